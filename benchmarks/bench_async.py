@@ -0,0 +1,103 @@
+"""Asyncio request throughput: run_in_executor around every call vs AsyncApplicationService.
+
+Concurrent request handlers issue product lookups with Zipf-like ids (a few
+SKUs get most traffic) and per-customer order listings for a small set of
+hot customers. The baseline hops to a thread pool for every call, as the
+API layer did; the facade runs lookups inline and coalesces identical
+listings that are in flight together.
+
+Run from the project root:
+
+    python -m benchmarks.bench_async --requests 200000 --concurrency 500
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from src.servises import AsyncApplicationService
+from benchmarks.suite import Context, Scale
+
+
+async def drive(requests: list, concurrency: int) -> float:
+    pending = iter(requests)
+
+    async def handler() -> None:
+        for request in pending:
+            await request()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handler() for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=10_000)
+    parser.add_argument('--customers', type=int, default=1_000)
+    parser.add_argument('--orders', type=int, default=20_000)
+    parser.add_argument('--requests', type=int, default=100_000)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--listing-ratio', type=int, default=100,
+                        help="one order listing per this many product lookups")
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--skew', type=float, default=1.1, help="Zipf exponent")
+    args = parser.parse_args()
+
+    scale = Scale(args.products, args.customers, args.orders, ops=0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        app = Context(scale, seed=42).app()
+
+    rng = random.Random(42)
+    weights = list(itertools.accumulate(1 / rank ** args.skew
+                                        for rank in range(1, args.products + 1)))
+    product_ids = rng.choices(range(1, args.products + 1), cum_weights=weights, k=args.requests)
+    hot_customers = range(1, 11)
+    plan = [('customer_orders', rng.choice(hot_customers)) if index % args.listing_ratio == 0
+            else ('product', product_id) for index, product_id in enumerate(product_ids)]
+
+    # Count the listings that actually run, whichever path issued them
+    listings = 0
+    get_customer_orders = app.order_service.get_customer_orders
+
+    def counted(customer_id: int) -> list:
+        nonlocal listings
+        listings += 1
+        return get_customer_orders(customer_id)
+
+    app.order_service.get_customer_orders = counted
+
+    async def baseline() -> float:
+        loop = asyncio.get_running_loop()
+        calls = {
+            'product': app.product_service.get_product,
+            'customer_orders': app.order_service.get_customer_orders,
+        }
+        with ThreadPoolExecutor(args.workers) as executor:
+            return await drive([partial(loop.run_in_executor, executor, calls[kind], key)
+                                for kind, key in plan], args.concurrency)
+
+    async def facade() -> float:
+        async with AsyncApplicationService(app, max_workers=args.workers) as service:
+            calls = {
+                'product': service.get_product,
+                'customer_orders': service.get_customer_orders,
+            }
+            return await drive([partial(calls[kind], key) for kind, key in plan],
+                               args.concurrency)
+
+    requested = sum(kind == 'customer_orders' for kind, _ in plan)
+    print(f"{'mode':<16}{'requests/s':>12}{'listings asked':>16}{'listings run':>14}")
+    for label, scenario in (("run_in_executor", baseline), ("facade", facade)):
+        listings = 0
+        elapsed = asyncio.run(scenario())
+        print(f"{label:<16}{len(plan) / elapsed:>12.0f}{requested:>16}{listings:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Applying a small catalog delta: incremental sync vs full reload.
+
+The new listing changes --delta of the catalog: a third of that is price
+updates, a third new products and a third removed products.
+
+Run from the project root:
+
+    python -m benchmarks.bench_catalog_sync --products 5000000 --delta 0.01
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.schemas import ProductDTO
+from src.servises.app_service import ApplicationService
+from src.utils.data_loader import DataLoader
+from src.utils.synthetic import SyntheticDataGenerator
+from src.utils.validation import validator_for
+
+
+def changed_listing(records: list[dict], delta: float, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    changes = max(3, int(len(records) * delta)) // 3
+    picked = rng.sample(range(len(records)), 2 * changes)
+    updated, removed = set(picked[:changes]), set(picked[changes:])
+    listing = []
+    for index, record in enumerate(records):
+        if index in removed:
+            continue
+        if index in updated:
+            record = {**record, "price": round(record["price"] * 1.1, 2)}
+        listing.append(record)
+    next_id = records[-1]["product_id"] + 1
+    listing.extend(SyntheticDataGenerator(seed + 1).products(changes, start_id=next_id))
+    return listing
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=500_000)
+    parser.add_argument('--delta', type=float, default=0.01)
+    args = parser.parse_args()
+
+    records = list(SyntheticDataGenerator(seed=42).products(args.products))
+    listing = changed_listing(records, args.delta)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "products.json"
+        SyntheticDataGenerator.write_json(path, listing)
+
+        app = ApplicationService()
+        app.product_service.sync_products(validator_for(ProductDTO).build_many(records)[0])
+
+        start = time.perf_counter()
+        dtos, _ = validator_for(ProductDTO).build_many(DataLoader(tmp).iter_records(path.name))
+        parse = time.perf_counter() - start
+
+    # Both paths need the parsed listing; time applying it separately
+    start = time.perf_counter()
+    result = app.product_service.sync_products(dtos)
+    incremental = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fresh = ApplicationService()
+    for dto in dtos:
+        fresh.product_service.create_product(dto)
+    full = time.perf_counter() - start
+
+    print(f"{args.products} products, delta {args.delta:.1%}: "
+          f"{result.inserted} inserted, {result.updated} updated, "
+          f"{result.deleted} deleted, {result.unchanged} unchanged")
+    print(f"{'parse + validate':<18}{parse:>8.2f} s")
+    print(f"{'incremental sync':<18}{incremental:>8.2f} s  (+ parse = {parse + incremental:.2f} s)")
+    print(f"{'full reload':<18}{full:>8.2f} s  (+ parse = {parse + full:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Loading compressed exports: decompress to disk then load vs streaming decompression.
+
+Run from the project root:
+
+    python -m benchmarks.bench_compression --records 200000
+"""
+import argparse
+import bz2
+import gzip
+import json
+import lzma
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from src.utils.data_loader import DataLoader, open_data
+from src.utils.synthetic import SyntheticDataGenerator
+
+FORMATS = {'gzip': ('.gz', gzip), 'bz2': ('.bz2', bz2), 'xz': ('.xz', lzma)}
+
+
+def decompress_then_load(directory: Path, name: str) -> int:
+    """Previous workflow: unpack next to the archive, then load the plain file"""
+    target = directory / "unpacked.json"
+    with open_data(directory / name) as source, open(target, 'wb') as out:
+        shutil.copyfileobj(source, out, 1024 * 1024)
+    try:
+        return len(DataLoader(directory).load_json("unpacked.json"))
+    finally:
+        target.unlink()
+
+
+def best(func, repeat: int) -> float:
+    """Best wall-clock time of several runs"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=3, help="best of N runs per case")
+    args = parser.parse_args()
+
+    records = list(SyntheticDataGenerator(seed=42).customers(args.records))
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        loader = DataLoader(directory)
+        raw = json.dumps(records).encode()
+        lines = "".join(json.dumps(record) + "\n" for record in records).encode()
+        (directory / "customers.json").write_bytes(raw)
+        print(f"{len(records)} customers, {len(raw) / 1e6:.1f} MB of JSON")
+        print(f"{'format':<8}{'ratio':>7}{'unpack+load s':>15}{'stream s':>10}"
+              f"{'jsonl stream s':>16}{'MB/s':>8}")
+
+        plain = best(lambda: loader.load_json("customers.json"), args.repeat)
+        print(f"{'plain':<8}{1:>7.1f}{'-':>15}{plain:>10.2f}{'-':>16}{len(raw) / 1e6 / plain:>8.0f}")
+
+        for label, (suffix, module) in FORMATS.items():
+            name = f"customers.json{suffix}"
+            compressed = module.compress(raw)
+            (directory / name).write_bytes(compressed)
+            (directory / f"customers.jsonl{suffix}").write_bytes(module.compress(lines))
+
+            unpacked = best(lambda: decompress_then_load(directory, name), args.repeat)
+            streamed = best(lambda: loader.load_json(name), args.repeat)
+            jsonl = best(lambda: sum(1 for _ in loader.iter_records(f"customers.jsonl{suffix}")),
+                         args.repeat)
+
+            print(f"{label:<8}{len(raw) / len(compressed):>7.1f}{unpacked:>15.2f}{streamed:>10.2f}"
+                  f"{jsonl:>16.2f}{len(raw) / 1e6 / streamed:>8.0f}")
+    print("MB/s is uncompressed JSON per second of streaming load")
+
+
+if __name__ == "__main__":
+    main()
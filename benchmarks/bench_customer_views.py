@@ -0,0 +1,56 @@
+"""Repeated profile reads of customers with many saved addresses.
+
+Compares CustomerService without a cache (every read rebuilds the address
+DTOs) against the versioned view cache, where reads return the same frozen
+view and writes share the existing address tuple.
+
+Run from the project root:
+
+    python -m benchmarks.bench_customer_views --customers 1000 --addresses 40
+"""
+import argparse
+import random
+import time
+
+from src.schemas import AddressDTO, CustomerDTO
+from src.servises import CustomerService
+from src.repositories import CustomerRepository
+from src.utils.cache import LRUCache
+
+
+def make_service(customers: int, addresses: int, cached: bool) -> CustomerService:
+    service = CustomerService(CustomerRepository(), LRUCache(customers) if cached else None)
+    for customer_id in range(1, customers + 1):
+        service.create_customer(CustomerDTO(
+            id=customer_id,
+            name=f"Customer {customer_id}",
+            email=f"customer{customer_id}@example.com",
+            addresses=[AddressDTO(f"{n} Main St", "Springfield", "USA") for n in range(addresses)],
+        ))
+    return service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--customers', type=int, default=1_000)
+    parser.add_argument('--addresses', type=int, default=40)
+    parser.add_argument('--reads', type=int, default=200_000)
+    parser.add_argument('--write-ratio', type=int, default=100)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    ids = [rng.randint(1, args.customers) for _ in range(args.reads)]
+
+    for label, cached in (("no cache", False), ("view cache", True)):
+        service = make_service(args.customers, args.addresses, cached)
+        start = time.perf_counter()
+        for index, customer_id in enumerate(ids):
+            if index % args.write_ratio == 0:
+                service.update_customer_email(customer_id, f"c{customer_id}-{index}@example.com")
+            service.get_customer(customer_id)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<11} {args.reads / elapsed:>10.0f} reads/s")
+
+
+if __name__ == "__main__":
+    main()
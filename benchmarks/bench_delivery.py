@@ -0,0 +1,60 @@
+"""Delivery quote throughput of DeliveryRateEngine and its cost to build.
+
+Run from the project root:
+
+    python -m benchmarks.bench_delivery --quotes 500000
+"""
+import argparse
+import random
+import time
+
+from src.models import DeliveryRateEngine
+
+COUNTRIES = ["USA", "Canada", "Germany", "France", "Japan", "Brazil", "India"]
+
+
+def make_engine(cities_per_country: int) -> DeliveryRateEngine:
+    """Build a rate table with country zones, city zones and weight brackets"""
+    engine = DeliveryRateEngine()
+    for country in COUNTRIES:
+        engine.add_zone(f"zone-{country}", country)
+        for city in range(cities_per_country):
+            engine.add_zone(f"zone-{country}-{city % 5}", country, f"city-{city}")
+
+    zones = {engine.zone_for(c, f"city-{i}") for c in COUNTRIES
+             for i in range(cities_per_country)} | {engine.default_zone}
+    for method, base in (("standard", 5.0), ("express", 15.0)):
+        engine.set_item_surcharge(method, 0.25)
+        for zone in zones:
+            for step, max_weight in enumerate((0.5, 1, 2, 5, 10, 20, 30, 50)):
+                engine.add_rate(method, zone, max_weight, base + step * 2.5)
+    return engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--quotes', type=int, default=500_000)
+    parser.add_argument('--cities', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    requests = [
+        (rng.choice(("standard", "express")), rng.choice(COUNTRIES),
+         f"city-{rng.randrange(args.cities * 2)}", rng.uniform(0.1, 40.0), rng.randint(1, 10))
+        for _ in range(args.quotes)
+    ]
+
+    start = time.perf_counter()
+    engine = make_engine(args.cities)
+    print(f"built rate table in {time.perf_counter() - start:.2f} s")
+
+    quote = engine.quote
+    start = time.perf_counter()
+    for method, country, city, weight, items in requests:
+        quote(method, country, city, weight, items)
+    elapsed = time.perf_counter() - start
+    print(f"{args.quotes / elapsed:>12.0f} quotes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Order export throughput for CSV, JSON Lines and the columnar format.
+
+Run from the project root:
+
+    python -m benchmarks.bench_export --orders 100000 --partition status
+"""
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+import tracemalloc
+
+from src.utils.export import FORMATS
+from benchmarks.suite import Context, Scale
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=50_000)
+    parser.add_argument('--partition', choices=['status', 'date'], default=None)
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="report peak allocations (much slower)")
+    args = parser.parse_args()
+
+    scale = Scale(products=1_000, customers=1_000, orders=args.orders, ops=0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        app = Context(scale, seed=42).app()
+
+    print(f"{'format':<10}{'orders/s':>10}{'lines/s':>10}{'MB':>8}{'files':>7}"
+          + (f"{'peak MB':>9}" if args.trace_memory else ""))
+    for format in FORMATS:
+        with tempfile.TemporaryDirectory() as tmp:
+            if args.trace_memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            report = app.order_service.export_orders(tmp, format, args.partition)
+            elapsed = time.perf_counter() - start
+            peak = ""
+            if args.trace_memory:
+                peak = f"{tracemalloc.get_traced_memory()[1] / 1e6:>9.1f}"
+                tracemalloc.stop()
+            size = sum(path.stat().st_size for path in report.files) / 1e6
+            print(f"{format:<10}{report.orders / elapsed:>10.0f}{report.lines / elapsed:>10.0f}"
+                  f"{size:>8.1f}{len(report.files):>7}{peak}")
+
+
+if __name__ == "__main__":
+    main()
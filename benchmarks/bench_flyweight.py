@@ -0,0 +1,65 @@
+"""Memory held by order discounts and deliveries: new objects per order vs shared instances.
+
+Run from the project root:
+
+    python -m benchmarks.bench_flyweight --orders 1000000
+"""
+import argparse
+import time
+import tracemalloc
+
+from src.models import ExpressDelivery, FixedDiscount, PercentageDiscount, StandardDelivery
+from src.schemas import (
+    ExpressDeliveryDTO,
+    FixedDiscountDTO,
+    PercentageDiscountDTO,
+    StandardDeliveryDTO,
+)
+from src.utils.synthetic import SyntheticDataGenerator
+
+# What OrderCreateDTO.to_model used to build for every order
+_FRESH = {
+    PercentageDiscountDTO: lambda dto: PercentageDiscount(dto.value),
+    FixedDiscountDTO: lambda dto: FixedDiscount(dto.value),
+    StandardDeliveryDTO: lambda dto: StandardDelivery(),
+    ExpressDeliveryDTO: lambda dto: ExpressDelivery(),
+}
+
+
+def fresh(dto):
+    return _FRESH[type(dto)](dto)
+
+
+def shared(dto):
+    return dto.to_model()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    requests = [(order.discount, order.delivery) for order in
+                SyntheticDataGenerator(seed=42).orders(args.orders, 1_000, 1_000)]
+
+    def held_by(build) -> tuple[float, float]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        models = [(build(discount), build(delivery)) for discount, delivery in requests]
+        elapsed = time.perf_counter() - start
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return held, len(models) / elapsed
+
+    # The list of pairs costs the same either way; count only the models
+    pairs, _ = held_by(lambda dto: dto)
+
+    print(f"{'models':<10}{'MB held':>10}{'bytes/order':>13}{'to_model/s':>12}")
+    for label, build in (("fresh", fresh), ("shared", shared)):
+        held, rate = held_by(build)
+        held = max(held - pairs, 0)
+        print(f"{label:<10}{held / 1e6:>10.1f}{held / len(requests):>13.1f}{rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
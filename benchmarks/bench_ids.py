@@ -0,0 +1,97 @@
+"""Order id allocation under many threads: a locked counter vs per-thread blocks.
+
+Also inserts --orders orders into one OrderRepository from --threads threads
+and verifies every id is unique and every order is retrievable.
+
+Run from the project root:
+
+    python -m benchmarks.bench_ids --threads 8 --ids 4000000 --orders 2000000
+"""
+import argparse
+import itertools
+import threading
+import time
+
+from src.models import CartItem, Customer, Order, Product
+from src.repositories import OrderRepository
+from src.utils.ids import IdAllocator
+
+
+class LockedCounter:
+    """Baseline: one lock taken for every id"""
+
+    def __init__(self):
+        self._next = 1
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        with self._lock:
+            value = self._next
+            self._next += 1
+            return value
+
+
+def in_threads(threads: int, work) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def target(index):
+        barrier.wait()
+        work(index)
+
+    workers = [threading.Thread(target=target, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def bench_allocators(threads: int, ids: int) -> None:
+    per_thread = ids // threads
+    for label, allocator in (("locked counter", LockedCounter()),
+                             ("block allocator", IdAllocator(block_size=1024))):
+        results = [None] * threads
+
+        def work(index):
+            next_id = allocator.next_id
+            results[index] = [next_id() for _ in itertools.repeat(None, per_thread)]
+
+        elapsed = in_threads(threads, work)
+        unique = len(set(itertools.chain.from_iterable(results)))
+        print(f"{label:<16} {per_thread * threads / elapsed:>12.0f} ids/s   "
+              f"unique {unique == per_thread * threads}")
+
+
+def bench_repository(threads: int, orders: int) -> None:
+    repository = OrderRepository()
+    customer = Customer(1, "Stress Test", "stress@example.com")
+    items = [CartItem(Product(1, "Mouse", 25.0), 1)]
+    per_thread = orders // threads
+
+    def work(_):
+        add = repository.add
+        for _ in itertools.repeat(None, per_thread):
+            add(Order(customer, items))
+
+    elapsed = in_threads(threads, work)
+    stored = repository.get_all()
+    unique = len({order.order_id for order in stored})
+    print(f"{'repository.add':<16} {per_thread * threads / elapsed:>12.0f} orders/s   "
+          f"stored {len(stored)} unique {unique == per_thread * threads}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--ids', type=int, default=4_000_000)
+    parser.add_argument('--orders', type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    bench_allocators(args.threads, args.ids)
+    bench_repository(args.threads, args.orders)
+
+
+if __name__ == "__main__":
+    main()
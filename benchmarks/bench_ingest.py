@@ -0,0 +1,62 @@
+"""Wall-clock time of partitioned product-file ingestion by number of worker processes.
+
+Only products are ingested: customer creation is dominated by the linear
+email lookup in CustomerRepository, which hides the parsing cost.
+
+Run from the project root:
+
+    python -m benchmarks.bench_ingest --files 64 --records 20000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.schemas import ProductDTO
+from src.servises.app_service import ApplicationService
+from src.utils.data_loader import DataLoader
+from src.utils.synthetic import SyntheticDataGenerator
+from src.utils.validation import validator_for
+
+
+def write_partitions(directory: Path, files: int, records: int) -> None:
+    generator = SyntheticDataGenerator(seed=42)
+    for part in range(files):
+        generator.write_json(directory / f"products-{part:04d}.json",
+                             generator.products(records, start_id=part * records + 1))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=16)
+    parser.add_argument('--records', type=int, default=20_000, help="products per file")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_partitions(directory, args.files, args.records)
+        loader = DataLoader(directory)
+        validate = validator_for(ProductDTO).build_many
+        print(f"{args.files} files x {args.records} products, {os.cpu_count()} CPUs available")
+        print(f"{'workers':>8}{'parse+validate s':>18}{'full ingest s':>15}{'speedup':>9}")
+
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            for _ in loader.load_files("products-*.json", workers, validate):
+                pass
+            parse_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            ApplicationService().ingest_files(directory, workers=workers)
+            ingest_time = time.perf_counter() - start
+
+            baseline = baseline or ingest_time
+            print(f"{workers:>8}{parse_time:>18.2f}{ingest_time:>15.2f}"
+                  f"{baseline / ingest_time:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Memory taken by address cities and countries once they are interned.
+
+Customers are written to customers.json, loaded through DataLoader and the
+customer service, and the strings held by the resulting models are counted:
+every reference as its own object (what JSON parsing produces) versus the
+distinct objects actually kept. Names are not interned: nearly every
+customer has their own, and interned strings are never freed.
+
+Run from the project root:
+
+    python -m benchmarks.bench_interning --customers 1000000
+"""
+import argparse
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from src.repositories.customer_repo import CustomerRepository
+from src.schemas import CustomerDTO
+from src.servises.customer_service import CustomerService
+from src.utils.data_loader import DataLoader
+from src.utils.synthetic import SyntheticDataGenerator
+from src.utils.validation import validator_for
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--customers', type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        SyntheticDataGenerator.write_json(Path(tmp) / "customers.json",
+                                          SyntheticDataGenerator(seed=42).customers(args.customers))
+
+        repository = CustomerRepository()
+        tracemalloc.start()
+        dtos, _ = validator_for(CustomerDTO).build_many(DataLoader(tmp).load_customers())
+        CustomerService(repository).sync_customers(dtos)
+        del dtos
+        held = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    fields = {'city': [], 'country': []}
+    for customer in repository.get_all():
+        for address in customer.addresses:
+            fields['city'].append(address.city)
+            fields['country'].append(address.country)
+
+    print(f"loaded {args.customers} customers, {held / 1e6:.1f} MB held")
+    print(f"{'field':<10}{'refs':>10}{'objects':>10}{'MB copied':>11}{'MB shared':>11}")
+    saved = 0
+    for field, values in fields.items():
+        copied = sum(map(sys.getsizeof, values))
+        distinct = {id(value): value for value in values}
+        shared = sum(map(sys.getsizeof, distinct.values()))
+        saved += copied - shared
+        print(f"{field:<10}{len(values):>10}{len(distinct):>10}{copied / 1e6:>11.1f}{shared / 1e6:>11.3f}")
+    print(f"saved {saved / 1e6:.1f} MB ({saved / held:.0%} of the loaded data)")
+
+
+if __name__ == "__main__":
+    main()
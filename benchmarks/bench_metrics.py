@@ -0,0 +1,105 @@
+"""Overhead of the metrics layer: uninstrumented vs disabled vs enabled.
+
+Run from the project root:
+
+    python -m benchmarks.bench_metrics --orders 50000
+"""
+import argparse
+import contextlib
+import io
+import time
+from contextlib import contextmanager
+
+from src.repositories import CustomerRepository, OrderRepository, ProductRepository
+from src.schemas import (
+    CreditCardPaymentDTO,
+    CustomerDTO,
+    OrderCreateDTO,
+    PercentageDiscountDTO,
+    ProductDTO,
+    StandardDeliveryDTO,
+)
+from src.servises import CustomerService, OrderService, ProductService
+from src.utils import metrics
+
+INSTRUMENTED_CLASSES = (
+    ProductService, CustomerService, OrderService,
+    ProductRepository, CustomerRepository, OrderRepository,
+)
+COMPONENTS = (
+    'product_service', 'customer_service', 'order_service',
+    'product_repository', 'customer_repository', 'order_repository',
+)
+
+
+@contextmanager
+def uninstrumented():
+    """Temporarily replace instrumented methods with the original functions"""
+    saved = []
+    for cls in INSTRUMENTED_CLASSES:
+        for name, attr in list(vars(cls).items()):
+            original = getattr(attr, '__wrapped__', None)
+            if original is not None:
+                saved.append((cls, name, attr))
+                setattr(cls, name, original)
+    try:
+        yield
+    finally:
+        for cls, name, attr in saved:
+            setattr(cls, name, attr)
+
+
+def run_workload(orders: int) -> float:
+    """Create products, customers and orders; return elapsed seconds"""
+    product_repo, customer_repo, order_repo = (
+        ProductRepository(), CustomerRepository(), OrderRepository()
+    )
+    products = ProductService(product_repo)
+    customers = CustomerService(customer_repo)
+    order_service = OrderService(order_repo, product_repo, customer_repo)
+
+    start = time.perf_counter()
+    for i in range(100):
+        products.create_product(ProductDTO(product_id=i, name=f"P{i}", price=10.0 + i))
+    for i in range(100):
+        customers.create_customer(CustomerDTO(i, f"C{i}", f"c{i}@example.com", []))
+    for i in range(orders):
+        order_service.create_order(OrderCreateDTO(
+            customer_id=i % 100,
+            items=[(i % 100, 1), ((i + 7) % 100, 2)],
+            discount=PercentageDiscountDTO(value=5.0),
+            delivery=StandardDeliveryDTO(),
+            payment=CreditCardPaymentDTO(details="4111"),
+        ))
+        order_service.get_order(i + 1)
+    return time.perf_counter() - start
+
+
+def best_of(repeat: int, orders: int) -> float:
+    return min(run_workload(orders) for _ in range(repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    # Payment models print to stdout; silence them for timing
+    with contextlib.redirect_stdout(io.StringIO()):
+        with uninstrumented():
+            baseline = best_of(args.repeat, args.orders)
+        metrics.disable()
+        disabled = best_of(args.repeat, args.orders)
+        metrics.enable(*COMPONENTS)
+        enabled = best_of(args.repeat, args.orders)
+        metrics.disable()
+
+    for label, elapsed in (("uninstrumented", baseline), ("disabled", disabled),
+                           ("enabled", enabled)):
+        overhead = (elapsed / baseline - 1) * 100
+        print(f"{label:<15} {elapsed:>8.3f} s   overhead {overhead:+6.1f}%")
+
+
+if __name__ == "__main__":
+    main()
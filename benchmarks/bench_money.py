@@ -0,0 +1,51 @@
+"""Benchmark of revenue summation: float vs Decimal vs integer-cents Money.
+
+Run from the project root:
+
+    python -m benchmarks.bench_money --orders 1000000
+"""
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from src.models import Money
+
+
+def make_totals(count: int, seed: int = 42) -> list[float]:
+    """Generate order totals that are exact to the cent"""
+    rng = random.Random(seed)
+    return [rng.randint(100, 500_000) / 100 for _ in range(count)]
+
+
+def bench(label: str, func, repeat: int) -> tuple[float, object]:
+    """Run func several times and report the best wall-clock time"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {best * 1000:>10.1f} ms   result={result}")
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    totals = make_totals(args.orders)
+    print(f"Summing {args.orders} order totals (best of {args.repeat})")
+
+    bench("float sum", lambda: sum(totals), args.repeat)
+    bench("Decimal sum", lambda: sum(Decimal(str(t)) for t in totals), args.repeat)
+    bench("Money.sum_amounts", lambda: Money.sum_amounts(totals), args.repeat)
+
+    money_totals = [Money.from_amount(t) for t in totals]
+    bench("Money.sum (Money values)", lambda: Money.sum(money_totals), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Hot-SKU read throughput of ProductService.get_product with and without the DTO cache.
+
+Reads follow a Zipf-like distribution over the catalogue (a few SKUs get most
+traffic) with one price update per --write-ratio reads.
+
+Run from the project root:
+
+    python -m benchmarks.bench_product_cache --products 100000 --reads 1000000
+"""
+import argparse
+import itertools
+import random
+import time
+
+from src.schemas import ProductDTO
+from src.servises import ApplicationService
+from src.utils.synthetic import SyntheticDataGenerator
+
+
+def make_app(products: int, cache_size: int | None) -> ApplicationService:
+    app = ApplicationService(product_cache_size=cache_size)
+    for record in SyntheticDataGenerator(42).products(products):
+        app.product_service.create_product(ProductDTO(**record))
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=100_000)
+    parser.add_argument('--reads', type=int, default=1_000_000)
+    parser.add_argument('--skew', type=float, default=1.1, help="Zipf exponent")
+    parser.add_argument('--write-ratio', type=int, default=1_000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    weights = list(itertools.accumulate(1 / rank ** args.skew
+                                        for rank in range(1, args.products + 1)))
+    ids = rng.choices(range(1, args.products + 1), cum_weights=weights, k=args.reads)
+
+    for label, cache_size in (("no cache", None), ("cache 1k", 1_000), ("cache 10k", 10_000)):
+        app = make_app(args.products, cache_size)
+        service = app.product_service
+        start = time.perf_counter()
+        for index, product_id in enumerate(ids):
+            if index % args.write_ratio == 0:
+                service.update_price(product_id, 9.99)
+            service.get_product(product_id)
+        elapsed = time.perf_counter() - start
+        info = service.cache.info() if service.cache else None
+        ratio = f"hit ratio {info.hit_ratio:.1%}" if info else ""
+        print(f"{label:<10} {args.reads / elapsed:>12.0f} reads/s   {ratio}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Throughput benchmark of the compiled promotion index vs evaluating every rule.
+
+Run from the project root:
+
+    python -m benchmarks.bench_promotions --rules 5000 --orders 20000
+"""
+import argparse
+import random
+import time
+
+from src.models import (
+    BuyXGetYRule,
+    CategoryRule,
+    FixedDiscount,
+    Money,
+    OrderLine,
+    SubtotalRule,
+    TieredRule,
+)
+from src.models.promotion import CompiledPromotions
+
+
+def make_rules(count: int, products: int, categories: int, rng: random.Random) -> list:
+    """Generate a mix of rules: 70% buy-X-get-Y, 28% category, 2% threshold"""
+    rules = []
+    for i in range(count):
+        kind = i % 50
+        if kind < 35:
+            rules.append(BuyXGetYRule(f"bxgy-{i}", rng.randrange(products), 2, 1))
+        elif kind < 49:
+            rules.append(CategoryRule(f"cat-{i}", f"cat-{rng.randrange(categories)}", 5.0))
+        elif i % 100 == 49:
+            rules.append(TieredRule(f"tier-{i}", [(rng.randint(500, 20000), 5.0),
+                                                  (rng.randint(20000, 50000), 10.0)]))
+        else:
+            rules.append(SubtotalRule(f"sub-{i}", FixedDiscount(10.0),
+                                      min_subtotal=rng.randint(100, 50000),
+                                      stackable=False))
+    return rules
+
+
+def make_orders(count: int, products: int, categories: int, rng: random.Random) -> list:
+    """Generate orders with 1-8 lines each"""
+    orders = []
+    for _ in range(count):
+        lines = []
+        for _ in range(rng.randint(1, 8)):
+            product_id = rng.randrange(products)
+            lines.append(OrderLine(
+                product_id,
+                Money(rng.randint(100, 50000)),
+                rng.randint(1, 5),
+                (f"cat-{product_id % categories}",),
+            ))
+        orders.append(lines)
+    return orders
+
+
+def evaluate_naive(rules: list, orders: list) -> int:
+    """Evaluate every rule against every order (the baseline)"""
+    total = 0
+    for lines in orders:
+        subtotal = Money.sum(line.total for line in lines)
+        for rule in rules:
+            total += rule.evaluate(lines, subtotal).cents
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rules', type=int, default=5000)
+    parser.add_argument('--orders', type=int, default=20000)
+    parser.add_argument('--products', type=int, default=10000)
+    parser.add_argument('--categories', type=int, default=200)
+    parser.add_argument('--naive-orders', type=int, default=200,
+                        help="orders used for the (slow) evaluate-everything baseline")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    rules = make_rules(args.rules, args.products, args.categories, rng)
+    orders = make_orders(args.orders, args.products, args.categories, rng)
+
+    start = time.perf_counter()
+    compiled = CompiledPromotions(rules)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled.evaluate_batch(orders)
+    batch_time = time.perf_counter() - start
+
+    naive_orders = orders[:args.naive_orders]
+    start = time.perf_counter()
+    evaluate_naive(rules, naive_orders)
+    naive_time = time.perf_counter() - start
+
+    print(f"rules={args.rules} orders={args.orders}")
+    print(f"compile:          {compile_time * 1000:>10.1f} ms")
+    print(f"compiled batch:   {args.orders / batch_time:>10.0f} orders/s")
+    print(f"evaluate all:     {len(naive_orders) / naive_time:>10.0f} orders/s")
+
+
+if __name__ == "__main__":
+    main()
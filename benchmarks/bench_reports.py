@@ -0,0 +1,78 @@
+"""Scaling of ReportService.generate from 1 to N worker processes.
+
+Run from the project root (10M orders need roughly 15-20 GB of RAM for the
+in-memory Order graph, so start smaller):
+
+    python -m benchmarks.bench_reports --orders 1000000
+    python -m benchmarks.bench_reports --orders 10000000 --chunk-size 200000
+"""
+import argparse
+import os
+import random
+import time
+
+from src.enum import OrderStatus
+from src.models import (
+    CartItem,
+    Customer,
+    ExpressDelivery,
+    FixedDiscount,
+    Order,
+    PercentageDiscount,
+    Product,
+    StandardDelivery,
+)
+from src.repositories import OrderRepository
+from src.servises import ReportService
+
+
+def build_repository(orders: int, seed: int = 42) -> OrderRepository:
+    """Fill an OrderRepository with random orders of 1-6 lines"""
+    rng = random.Random(seed)
+    products = [Product(i, f"Product {i}", rng.randint(100, 100_000) / 100) for i in range(5000)]
+    customers = [Customer(i, f"Customer {i}", f"c{i}@example.com") for i in range(50_000)]
+    discounts = [None, PercentageDiscount(10.0), PercentageDiscount(15.0), FixedDiscount(20.0)]
+    deliveries = [StandardDelivery(), ExpressDelivery()]
+    statuses = [OrderStatus.PROCESSING] * 8 + [OrderStatus.CANCELLED, OrderStatus.PENDING]
+
+    repository = OrderRepository()
+    for _ in range(orders):
+        items = [CartItem(rng.choice(products), rng.randint(1, 4))
+                 for _ in range(rng.randint(1, 6))]
+        order = Order(rng.choice(customers), items)
+        discount = rng.choice(discounts)
+        if discount:
+            order.discount = discount
+        order.delivery = rng.choice(deliveries)
+        repository.add(order)
+        order.status = rng.choice(statuses)
+    return repository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=200_000)
+    parser.add_argument('--chunk-size', type=int, default=50_000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    repository = build_repository(args.orders)
+    print(f"built {args.orders} orders in {time.perf_counter() - start:.1f} s")
+
+    service = ReportService(repository, chunk_size=args.chunk_size)
+    workers = 1
+    baseline = None
+    while workers <= args.max_workers:
+        start = time.perf_counter()
+        report = service.generate(workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"workers={workers:<3} {elapsed:>8.2f} s  "
+              f"{args.orders / elapsed:>12.0f} orders/s  speedup x{baseline / elapsed:.2f}  "
+              f"revenue={report.total_revenue:.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Round-trip speed of DTO serialization: dataclasses.asdict + json vs compiled codecs.
+
+Run from the project root:
+
+    python -m benchmarks.bench_serialization --orders 20000
+"""
+import argparse
+import contextlib
+import dataclasses
+import io
+import json
+import time
+
+from src.schemas import OrderResultDTO
+from src.utils.serialization import codec_for
+from benchmarks.suite import Context, Scale
+
+
+def timed(func) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=20_000)
+    args = parser.parse_args()
+
+    scale = Scale(products=1_000, customers=1_000, orders=args.orders, ops=0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        dtos = Context(scale, seed=42).app().order_service.get_all_orders()
+    codec = codec_for(OrderResultDTO)
+
+    cases = {
+        "asdict + json": (
+            lambda: [json.dumps(dataclasses.asdict(dto), default=str) for dto in dtos],
+            lambda encoded: [json.loads(text) for text in encoded],
+        ),
+        "codec json": (
+            lambda: [codec.dumps_json(dto) for dto in dtos],
+            lambda encoded: [codec.loads_json(text) for text in encoded],
+        ),
+        "codec binary": (
+            lambda: [codec.dumps_binary(dto) for dto in dtos],
+            lambda encoded: [codec.loads_binary(data) for data in encoded],
+        ),
+        "stream json": (
+            lambda: ["".join(codec.iter_json(dtos))],
+            lambda encoded: [codec.from_dict(d) for d in json.loads(encoded[0])],
+        ),
+        "stream binary": (
+            lambda: [b"".join(codec.iter_binary(dtos))],
+            lambda encoded: list(codec.iter_load_binary(encoded[0])),
+        ),
+    }
+
+    print(f"{'format':<15}{'encode/s':>12}{'decode/s':>12}{'bytes/order':>13}")
+    for label, (encode, decode) in cases.items():
+        encode_time, encoded = timed(encode)
+        decode_time, _ = timed(lambda: decode(encoded))
+        size = sum(len(item) for item in encoded) / len(dtos)
+        print(f"{label:<15}{len(dtos) / encode_time:>12.0f}{len(dtos) / decode_time:>12.0f}{size:>13.0f}")
+    print("(asdict + json decodes to plain dicts only)")
+
+
+if __name__ == "__main__":
+    main()
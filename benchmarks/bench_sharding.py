@@ -0,0 +1,79 @@
+"""Concurrent order writers against sharded customer/order repositories.
+
+Each writer thread places orders through OrderService. With --shards 1 every
+write serialises on one lock and one id counter; with more shards writers for
+different customers take different locks. Under the GIL pure-Python work still
+runs one thread at a time, so the gain is reduced lock contention rather than
+parallel execution; the numbers show what this host actually achieves.
+
+Run from the project root:
+
+    python -m benchmarks.bench_sharding --writers 1 2 4 8 --shards 1 4 16
+"""
+import argparse
+import contextlib
+import io
+import threading
+import time
+
+from src.schemas import ProductDTO
+from src.servises import ApplicationService
+from src.utils.synthetic import SyntheticDataGenerator
+from benchmarks.suite import customer_dto
+
+
+def make_app(shards: int, customers: int, products: int) -> ApplicationService:
+    app = ApplicationService(shards=shards)
+    generator = SyntheticDataGenerator(42)
+    for record in generator.products(products):
+        app.product_service.create_product(ProductDTO(**record))
+    for record in generator.customers(customers):
+        app.customer_service.create_customer(customer_dto(record))
+    return app
+
+
+def run(app: ApplicationService, writers: int, orders: int, customers: int,
+        products: int) -> float:
+    per_writer = orders // writers
+    batches = [
+        list(SyntheticDataGenerator(100 + index).orders(per_writer, customers, products))
+        for index in range(writers)
+    ]
+    barrier = threading.Barrier(writers + 1)
+
+    def writer(batch):
+        barrier.wait()
+        for order_dto in batch:
+            app.order_service.create_order(order_dto)
+
+    threads = [threading.Thread(target=writer, args=(batch,)) for batch in batches]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return per_writer * writers / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--shards', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--orders', type=int, default=40_000)
+    parser.add_argument('--customers', type=int, default=10_000)
+    parser.add_argument('--products', type=int, default=1_000)
+    args = parser.parse_args()
+
+    print(f"{'shards':>6} " + "".join(f"{f'{w} writers':>14}" for w in args.writers) + "   orders/s")
+    for shards in args.shards:
+        rates = []
+        for writers in args.writers:
+            app = make_app(shards, args.customers, args.products)
+            with contextlib.redirect_stdout(io.StringIO()):
+                rates.append(run(app, writers, args.orders, args.customers, args.products))
+        print(f"{shards:>6} " + "".join(f"{rate:>14.0f}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Flash-sale reads of get_product / get_order with and without single-flight lookups.
+
+Threads (or asyncio tasks going through a thread pool) read product and
+order ids drawn from a Zipf-like distribution, so a few hot ids get most of
+the traffic. --latency adds a blocking delay to every repository lookup, as
+a remote store would; with in-memory repositories lookups rarely overlap.
+
+Run from the project root:
+
+    python -m benchmarks.bench_singleflight --readers 64 --reads 200000 --latency 1
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from src.utils.singleflight import AsyncSingleFlight
+from benchmarks.suite import Context, Scale
+
+
+def zipf_ids(rng: random.Random, count: int, k: int, skew: float) -> list[int]:
+    weights = list(itertools.accumulate(1 / rank ** skew for rank in range(1, count + 1)))
+    return rng.choices(range(1, count + 1), cum_weights=weights, k=k)
+
+
+def with_latency(repository, latency: float, lookups: itertools.count) -> None:
+    get_by_id = repository.get_by_id
+
+    def get(key):
+        next(lookups)
+        if latency:
+            time.sleep(latency)
+        return get_by_id(key)
+
+    repository.get_by_id = get
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=10_000)
+    parser.add_argument('--orders', type=int, default=10_000)
+    parser.add_argument('--reads', type=int, default=50_000)
+    parser.add_argument('--readers', type=int, default=32)
+    parser.add_argument('--latency', type=float, default=0.0, help="ms per repository lookup")
+    parser.add_argument('--skew', type=float, default=1.2, help="Zipf exponent")
+    args = parser.parse_args()
+
+    scale = Scale(args.products, customers=1_000, orders=args.orders, ops=0)
+    rng = random.Random(42)
+    plan = [(('product', product_id) if rng.random() < 0.8 else ('order', order_id))
+            for product_id, order_id in zip(zipf_ids(rng, args.products, args.reads, args.skew),
+                                            zipf_ids(rng, args.orders, args.reads, args.skew))]
+
+    print(f"{'mode':<8}{'single-flight':>14}{'reads/s':>10}{'CPU s':>8}{'lookups':>10}")
+    for mode in ('threads', 'asyncio'):
+        for single_flight in (False, True):
+            with contextlib.redirect_stdout(io.StringIO()):
+                app = Context(scale, seed=42).app(single_flight=single_flight and mode == 'threads')
+            lookups = itertools.count()
+            for repository in (app._product_repo, app._order_repo):
+                with_latency(repository, args.latency / 1e3, lookups)
+            calls = {'product': app.product_service.get_product,
+                     'order': app.order_service.get_order}
+
+            cpu, start = time.process_time(), time.perf_counter()
+            if mode == 'threads':
+                pending = iter(plan)
+                lock = threading.Lock()
+
+                def reader() -> None:
+                    while True:
+                        with lock:
+                            request = next(pending, None)
+                        if request is None:
+                            return
+                        calls[request[0]](request[1])
+
+                threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            else:
+                async def run() -> None:
+                    loop = asyncio.get_running_loop()
+                    flight = AsyncSingleFlight() if single_flight else None
+                    pending = iter(plan)
+                    with ThreadPoolExecutor(args.readers) as executor:
+                        def read(kind: str, key: int):
+                            return loop.run_in_executor(executor, calls[kind], key)
+
+                        async def handler() -> None:
+                            for kind, key in pending:
+                                if flight is None:
+                                    await read(kind, key)
+                                else:
+                                    await flight.do((kind, key), partial(read, kind, key))
+
+                        await asyncio.gather(*(handler() for _ in range(args.readers)))
+                asyncio.run(run())
+            elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu
+
+            print(f"{mode:<8}{'on' if single_flight else 'off':>14}{len(plan) / elapsed:>10.0f}"
+                  f"{cpu:>8.2f}{next(lookups):>10}")
+
+
+if __name__ == "__main__":
+    main()
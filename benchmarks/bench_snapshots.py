@@ -0,0 +1,106 @@
+"""Writer throughput while reports run: snapshot reads vs locking the repositories.
+
+Writer threads place orders through OrderService for --duration seconds while
+one reporter thread computes statistics in a loop, either from a chunked
+copy-on-write snapshot (ApplicationService.get_statistics) or by holding every
+repository lock for the whole report.
+
+Run from the project root:
+
+    python -m benchmarks.bench_snapshots --writers 4 --duration 5 --orders 100000
+"""
+import argparse
+import contextlib
+import io
+import threading
+import time
+from contextlib import ExitStack
+
+from src.models import Money
+from src.schemas import ProductDTO
+from src.servises import ApplicationService
+from src.utils.synthetic import SyntheticDataGenerator
+from benchmarks.suite import customer_dto
+
+
+def make_app(orders: int, customers: int, products: int) -> ApplicationService:
+    app = ApplicationService()
+    generator = SyntheticDataGenerator(42)
+    for record in generator.products(products):
+        app.product_service.create_product(ProductDTO(**record))
+    for record in generator.customers(customers):
+        app.customer_service.create_customer(customer_dto(record))
+    for order_dto in generator.orders(orders, customers, products):
+        app.order_service.create_order(order_dto)
+    return app
+
+
+def locked_statistics(app: ApplicationService) -> dict:
+    """The same report computed on live data with all writers blocked"""
+    with ExitStack() as stack:
+        for repository in (app._product_repo, app._customer_repo, app._order_repo):
+            stack.enter_context(repository.lock)
+        orders = app._order_repo.get_all()
+        return {
+            'total_products': len(app._product_repo.get_all()),
+            'total_customers': len(app._customer_repo.get_all()),
+            'total_orders': len(orders),
+            'total_revenue': Money.sum(o.price_breakdown().total for o in orders).amount,
+        }
+
+
+def measure(app: ApplicationService, writers: int, duration: float, report,
+            customers: int, products: int) -> tuple[float, int]:
+    stop = threading.Event()
+    placed = [0] * writers
+    reports = 0
+
+    def writer(index: int) -> None:
+        for order_dto in SyntheticDataGenerator(1000 + index).orders(10**9, customers, products):
+            if stop.is_set():
+                return
+            app.order_service.create_order(order_dto)
+            placed[index] += 1
+
+    def reporter() -> None:
+        nonlocal reports
+        while not stop.is_set():
+            report(app)
+            reports += 1
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    if report is not None:
+        threads.append(threading.Thread(target=reporter))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(placed) / duration, reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--orders', type=int, default=100_000, help="orders loaded before the run")
+    parser.add_argument('--customers', type=int, default=10_000)
+    parser.add_argument('--products', type=int, default=1_000)
+    args = parser.parse_args()
+
+    modes = (
+        ("no reports", None),
+        ("snapshot reports", ApplicationService.get_statistics),
+        ("locked reports", locked_statistics),
+    )
+    for label, report in modes:
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = make_app(args.orders, args.customers, args.products)
+            rate, reports = measure(app, args.writers, args.duration, report,
+                                    args.customers, args.products)
+        print(f"{label:<17} {rate:>10.0f} orders/s   {reports:>4} reports")
+
+
+if __name__ == "__main__":
+    main()
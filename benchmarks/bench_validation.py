@@ -0,0 +1,81 @@
+"""Bulk DTO construction: kwargs + model setters vs compiled validators.
+
+Run from the project root:
+
+    python -m benchmarks.bench_validation --records 1000000
+"""
+import argparse
+import gc
+import time
+
+from src.schemas import AddressDTO, CustomerDTO, ProductDTO
+from src.utils.synthetic import SyntheticDataGenerator
+from src.utils.validation import validator_for
+
+
+def kwargs_products(records: list[dict]) -> int:
+    """Current ingestion path: unchecked DTO, then range checks in the model setters"""
+    dtos = []
+    for record in records:
+        try:
+            dto = ProductDTO(**record)
+            dto.to_model()
+            dtos.append(dto)
+        except (TypeError, ValueError):
+            pass
+    return len(dtos)
+
+
+def kwargs_customers(records: list[dict]) -> int:
+    """Current hand-written path from initialize_sample_data, without any checks"""
+    dtos = []
+    for record in records:
+        try:
+            dtos.append(CustomerDTO(
+                id=record['id'],
+                name=record['name'],
+                email=record['email'],
+                addresses=[AddressDTO(**addr) for addr in record['addresses']],
+            ))
+        except (KeyError, TypeError):
+            pass
+    return len(dtos)
+
+
+def compiled(dto_type: type):
+    build_many = validator_for(dto_type).build_many
+    return lambda records: len(build_many(records)[0])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=200_000)
+    parser.add_argument('--repeat', type=int, default=3, help="best of N runs per case")
+    args = parser.parse_args()
+
+    generator = SyntheticDataGenerator(seed=42)
+    datasets = {
+        "products": list(generator.products(args.records)),
+        "customers": list(generator.customers(args.records // 4)),
+    }
+    cases = [
+        ("products", "kwargs + setters", kwargs_products),
+        ("products", "compiled validator", compiled(ProductDTO)),
+        ("customers", "kwargs", kwargs_customers),
+        ("customers", "compiled validator", compiled(CustomerDTO)),
+    ]
+
+    print(f"{'records':<11}{'path':<20}{'count':>10}{'records/s':>12}")
+    for dataset, label, build in cases:
+        records = datasets[dataset]
+        elapsed = float('inf')
+        for _ in range(args.repeat):
+            gc.collect()
+            start = time.perf_counter()
+            valid = build(records)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        print(f"{dataset:<11}{label:<20}{valid:>10}{len(records) / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Load test: concurrent shoppers driving ApplicationService.
+
+Run from the project root:
+
+    python -m benchmarks.load_test --mode threads --clients 16 --duration 10
+    python -m benchmarks.load_test --mode threads --clients 32 --rate 2000
+    python -m benchmarks.load_test --mode asyncio --clients 100 --duration 5
+    python -m benchmarks.load_test --mode processes --clients 4
+"""
+import argparse
+
+from src.utils.load_test import LoadProfile, run_load_test
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--mode', choices=('threads', 'asyncio', 'processes'), default='threads')
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--rate', type=float, help="sessions/s (open loop); closed loop if omitted")
+    parser.add_argument('--products', type=int, default=1_000)
+    parser.add_argument('--customers', type=int, default=1_000)
+    parser.add_argument('--cancel-ratio', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    profile = LoadProfile(
+        clients=args.clients,
+        duration=args.duration,
+        arrival_rate=args.rate,
+        cancel_ratio=args.cancel_ratio,
+        products=args.products,
+        customers=args.customers,
+        seed=args.seed,
+    )
+    print(run_load_test(profile, args.mode).format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,496 @@
+"""Reproducible benchmark suite for every service entry point.
+
+Data comes from the deterministic SyntheticDataGenerator, so runs with the
+same --scale and --seed are comparable. Results are written as JSON and can
+be compared against an earlier run to detect regressions:
+
+    python -m benchmarks.suite --scale small
+    python -m benchmarks.suite --scale medium --output benchmarks/results/base.json
+    python -m benchmarks.suite --scale medium --compare benchmarks/results/base.json
+    python -m benchmarks.suite --only order_service --products 2000000 --orders 1000000
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from src.enum import OrderStatus
+from src.schemas import AddressDTO, CustomerDTO, ProductDTO
+from src.servises import ApplicationService
+from src.utils.synthetic import SyntheticDataGenerator
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+@dataclass(frozen=True)
+class Scale:
+    products: int
+    customers: int
+    orders: int
+    ops: int
+
+
+SCALES = {
+    'small': Scale(products=1_000, customers=1_000, orders=2_000, ops=1_000),
+    'medium': Scale(products=100_000, customers=100_000, orders=100_000, ops=10_000),
+    'large': Scale(products=1_000_000, customers=1_000_000, orders=1_000_000, ops=50_000),
+}
+
+
+class Context:
+    """Builds populated applications from the synthetic generator"""
+
+    def __init__(self, scale: Scale, seed: int):
+        self.scale = scale
+        self.generator = SyntheticDataGenerator(seed)
+
+    def app(self, orders: bool = True, **options) -> ApplicationService:
+        app = ApplicationService(**options)
+        for record in self.generator.products(self.scale.products):
+            app.product_service.create_product(ProductDTO(**record))
+        for record in self.generator.customers(self.scale.customers):
+            app.customer_service.create_customer(customer_dto(record))
+        if orders:
+            for order_dto in self.generator.orders(
+                self.scale.orders, self.scale.customers, self.scale.products
+            ):
+                app.order_service.create_order(order_dto)
+        return app
+
+    def ids(self, count: int, upper: int) -> list[int]:
+        """Deterministic spread of ids in 1..upper"""
+        step = max(upper // max(count, 1), 1)
+        return [(i * step) % upper + 1 for i in range(count)]
+
+
+def customer_dto(record: dict) -> CustomerDTO:
+    return CustomerDTO(
+        id=record['id'],
+        name=record['name'],
+        email=record['email'],
+        addresses=[AddressDTO(**address) for address in record['addresses']],
+    )
+
+
+# name -> setup(ctx) returning a run() closure that reports the ops it did
+BENCHMARKS: dict[str, Callable[[Context], Callable[[], int]]] = {}
+
+
+def benchmark(name: str):
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+@benchmark("product_service.create_product")
+def bench_create_product(ctx: Context):
+    app = ApplicationService()
+    records = list(ctx.generator.products(ctx.scale.ops))
+
+    def run():
+        for record in records:
+            app.product_service.create_product(ProductDTO(**record))
+        return len(records)
+    return run
+
+
+@benchmark("product_service.get_product")
+def bench_get_product(ctx: Context):
+    app = ctx.app(orders=False)
+    ids = ctx.ids(ctx.scale.ops, ctx.scale.products)
+
+    def run():
+        for product_id in ids:
+            app.product_service.get_product(product_id)
+        return len(ids)
+    return run
+
+
+@benchmark("product_service.get_product_cached")
+def bench_get_product_cached(ctx: Context):
+    app = ctx.app(orders=False, product_cache_size=10_000)
+    # Hot SKUs: the same 1% of the catalogue read over and over
+    hot = ctx.ids(max(ctx.scale.products // 100, 1), ctx.scale.products)
+    ids = [hot[i % len(hot)] for i in range(ctx.scale.ops)]
+
+    def run():
+        for product_id in ids:
+            app.product_service.get_product(product_id)
+        return len(ids)
+    return run
+
+
+@benchmark("product_service.update_price")
+def bench_update_price(ctx: Context):
+    app = ctx.app(orders=False)
+    ids = ctx.ids(ctx.scale.ops, ctx.scale.products)
+
+    def run():
+        for product_id in ids:
+            app.product_service.update_price(product_id, 9.99)
+        return len(ids)
+    return run
+
+
+@benchmark("product_service.get_all_products")
+def bench_get_all_products(ctx: Context):
+    app = ctx.app(orders=False)
+
+    def run():
+        app.product_service.get_all_products()
+        return ctx.scale.products
+    return run
+
+
+@benchmark("product_service.delete_product")
+def bench_delete_product(ctx: Context):
+    app = ctx.app(orders=False)
+    ids = sorted(set(ctx.ids(ctx.scale.ops, ctx.scale.products)))
+
+    def run():
+        for product_id in ids:
+            app.product_service.delete_product(product_id)
+        return len(ids)
+    return run
+
+
+@benchmark("customer_service.create_customer")
+def bench_create_customer(ctx: Context):
+    app = ApplicationService()
+    dtos = [customer_dto(record) for record in ctx.generator.customers(ctx.scale.ops)]
+
+    def run():
+        for dto in dtos:
+            app.customer_service.create_customer(dto)
+        return len(dtos)
+    return run
+
+
+@benchmark("customer_service.get_customer")
+def bench_get_customer(ctx: Context):
+    app = ctx.app(orders=False)
+    ids = ctx.ids(ctx.scale.ops, ctx.scale.customers)
+
+    def run():
+        for customer_id in ids:
+            app.customer_service.get_customer(customer_id)
+        return len(ids)
+    return run
+
+
+@benchmark("customer_service.get_customer_by_email")
+def bench_get_customer_by_email(ctx: Context):
+    app = ctx.app(orders=False)
+    emails = [app.customer_service.get_customer(customer_id).email
+              for customer_id in ctx.ids(min(ctx.scale.ops, 200), ctx.scale.customers)]
+
+    def run():
+        for email in emails:
+            app.customer_service.get_customer_by_email(email)
+        return len(emails)
+    return run
+
+
+@benchmark("customer_service.add_address_to_customer")
+def bench_add_address(ctx: Context):
+    app = ctx.app(orders=False)
+    ids = ctx.ids(ctx.scale.ops, ctx.scale.customers)
+    address = AddressDTO("1 Benchmark Way", "Berlin", "Germany")
+
+    def run():
+        for customer_id in ids:
+            app.customer_service.add_address_to_customer(customer_id, address)
+        return len(ids)
+    return run
+
+
+@benchmark("customer_service.update_customer_email")
+def bench_update_email(ctx: Context):
+    app = ctx.app(orders=False)
+    ids = ctx.ids(min(ctx.scale.ops, 200), ctx.scale.customers)
+
+    def run():
+        for customer_id in ids:
+            app.customer_service.update_customer_email(
+                customer_id, f"updated.{customer_id}@example.com")
+        return len(ids)
+    return run
+
+
+@benchmark("customer_service.get_all_customers")
+def bench_get_all_customers(ctx: Context):
+    app = ctx.app(orders=False)
+
+    def run():
+        app.customer_service.get_all_customers()
+        return ctx.scale.customers
+    return run
+
+
+@benchmark("cart_service.add_item")
+def bench_cart_add_item(ctx: Context):
+    app = ctx.app(orders=False)
+    carts = list(ctx.generator.order_lines(ctx.scale.ops, ctx.scale.products))
+
+    def run():
+        ops = 0
+        for items in carts:
+            for product_id, quantity in items:
+                app.cart_service.add_item(product_id, quantity)
+            ops += len(items)
+            app.cart_service.clear()
+        return ops
+    return run
+
+
+@benchmark("cart_service.get_total")
+def bench_cart_get_total(ctx: Context):
+    app = ctx.app(orders=False)
+    for product_id, quantity in next(ctx.generator.order_lines(1, ctx.scale.products)):
+        app.cart_service.add_item(product_id, quantity)
+
+    def run():
+        for _ in range(ctx.scale.ops):
+            app.cart_service.get_total()
+        return ctx.scale.ops
+    return run
+
+
+@benchmark("cart_service.quote_delivery")
+def bench_cart_quote_delivery(ctx: Context):
+    app = ctx.app(orders=False)
+    app.cart_service.add_item(1, 2)
+    address = AddressDTO("1 Main St", "Chicago", "USA")
+
+    def run():
+        for _ in range(ctx.scale.ops):
+            app.cart_service.quote_delivery("standard", address)
+        return ctx.scale.ops
+    return run
+
+
+@benchmark("order_service.create_order")
+def bench_create_order(ctx: Context):
+    app = ctx.app(orders=False)
+    dtos = list(ctx.generator.orders(ctx.scale.ops, ctx.scale.customers, ctx.scale.products))
+
+    def run():
+        for dto in dtos:
+            app.order_service.create_order(dto)
+        return len(dtos)
+    return run
+
+
+@benchmark("order_service.get_order")
+def bench_get_order(ctx: Context):
+    app = ctx.app()
+    ids = ctx.ids(ctx.scale.ops, ctx.scale.orders)
+
+    def run():
+        for order_id in ids:
+            app.order_service.get_order(order_id)
+        return len(ids)
+    return run
+
+
+@benchmark("order_service.get_customer_orders")
+def bench_get_customer_orders(ctx: Context):
+    app = ctx.app()
+    ids = ctx.ids(min(ctx.scale.ops, 100), ctx.scale.customers)
+
+    def run():
+        for customer_id in ids:
+            app.order_service.get_customer_orders(customer_id)
+        return len(ids)
+    return run
+
+
+@benchmark("order_service.get_all_orders")
+def bench_get_all_orders(ctx: Context):
+    app = ctx.app()
+
+    def run():
+        app.order_service.get_all_orders()
+        return ctx.scale.orders
+    return run
+
+
+@benchmark("order_service.cancel_order")
+def bench_cancel_order(ctx: Context):
+    app = ctx.app()
+    ids = sorted(set(ctx.ids(ctx.scale.ops, ctx.scale.orders)))
+
+    def run():
+        for order_id in ids:
+            app.order_service.cancel_order(order_id)
+        return len(ids)
+    return run
+
+
+@benchmark("order_service.transition_orders")
+def bench_transition_orders(ctx: Context):
+    app = ctx.app()
+    ids = list(range(1, ctx.scale.orders + 1))
+
+    def run():
+        app.order_service.transition_orders(ids, OrderStatus.SHIPPED, skip_invalid=True)
+        app.order_service.transition_orders(ids, OrderStatus.DELIVERED, skip_invalid=True)
+        return 2 * len(ids)
+    return run
+
+
+@benchmark("app.get_statistics")
+def bench_get_statistics(ctx: Context):
+    app = ctx.app()
+
+    def run():
+        app.get_statistics()
+        return ctx.scale.orders
+    return run
+
+
+@benchmark("app.initialize_sample_data")
+def bench_initialize_sample_data(ctx: Context):
+    apps = [ApplicationService() for _ in range(min(ctx.scale.ops, 1000))]
+
+    def run():
+        for app in apps:
+            app.initialize_sample_data()
+        return len(apps)
+    return run
+
+
+@benchmark("report_service.generate")
+def bench_report(ctx: Context):
+    app = ctx.app()
+
+    def run():
+        app.report_service.generate(workers=1)
+        return ctx.scale.orders
+    return run
+
+
+def run_benchmark(name: str, ctx: Context, repeat: int) -> dict:
+    """Run one benchmark `repeat` times with a fresh setup each time"""
+    timings = []
+    ops = 0
+    for _ in range(repeat):
+        run = BENCHMARKS[name](ctx)
+        start = time.perf_counter()
+        ops = run()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        'ops': ops,
+        'best_s': best,
+        'median_s': statistics.median(timings),
+        'ops_per_sec': ops / best if best else float('inf'),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print a comparison table and return the names of regressed benchmarks"""
+    regressions = []
+    print(f"\n{'benchmark':<45} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            print(f"{name:<45} {'-':>12} {result['ops_per_sec']:>12.0f}      new")
+            continue
+        change = result['ops_per_sec'] / base['ops_per_sec'] - 1
+        marker = ""
+        if change < -threshold:
+            marker = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<45} {base['ops_per_sec']:>12.0f} "
+              f"{result['ops_per_sec']:>12.0f} {change:>+7.1%}{marker}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--products', type=int)
+    parser.add_argument('--customers', type=int)
+    parser.add_argument('--orders', type=int)
+    parser.add_argument('--ops', type=int, help="operations per benchmark")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', action='append', default=[],
+                        help="run benchmarks whose name contains this text (repeatable)")
+    parser.add_argument('--output', type=Path, help="result file (default: results/<timestamp>.json)")
+    parser.add_argument('--compare', type=Path, help="baseline result file to compare with")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="relative slowdown that counts as a regression")
+    parser.add_argument('--list', action='store_true', help="list benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    overrides = {key: getattr(args, key) for key in ('products', 'customers', 'orders', 'ops')
+                 if getattr(args, key) is not None}
+    scale = replace(SCALES[args.scale], **overrides)
+    ctx = Context(scale, args.seed)
+    names = [name for name in BENCHMARKS
+             if not args.only or any(part in name for part in args.only)]
+
+    results = {}
+    print(f"scale={scale} seed={args.seed} repeat={args.repeat}")
+    for name in names:
+        # Payment models print every transaction
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = run_benchmark(name, ctx, args.repeat)
+        print(f"{name:<45} {results[name]['ops_per_sec']:>12.0f} ops/s")
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'git_revision': git_revision(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'scale': asdict(scale),
+            'seed': args.seed,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    output = args.output
+    if output is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        output = RESULTS_DIR / f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f"\nresults written to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
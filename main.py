@@ -1,3 +1,4 @@
+import argparse
 import logging
 from typing import Any
 from src.servises import ApplicationService
@@ -11,6 +12,8 @@ from src.schemas import (
     PayPalPaymentDTO,
     AddressDTO
 )
+from src.utils import metrics
+from src.utils.profiling import Workload, profile_workload
 
 logging.basicConfig(
     level=logging.INFO,
@@ -296,8 +299,64 @@ class DemoRunner:
         logger.info(f"Total Revenue:      ${stats['total_revenue']:.2f}")
 
 
-def main():
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Разбор аргументов командной строки"""
+    parser = argparse.ArgumentParser(description="E-commerce system demo")
+    parser.add_argument(
+        '--metrics',
+        metavar='PATH',
+        help="collect metrics for all components and write them to PATH "
+             "(.prom/.txt - Prometheus text, otherwise JSON)"
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help="run a synthetic workload under cProfile/tracemalloc instead of the demo"
+    )
+    parser.add_argument('--customers', type=int, default=1_000, help="profile: number of customers")
+    parser.add_argument('--orders', type=int, default=10_000, help="profile: number of orders")
+    parser.add_argument('--lines', type=int, default=3, help="profile: max lines per order")
+    parser.add_argument('--products', type=int, default=500, help="profile: number of products")
+    parser.add_argument('--profile-dir', default='profile', help="profile: output directory")
+    parser.add_argument('--top', type=int, default=20, help="profile: rows in the reports")
+    return parser.parse_args(argv)
+
+
+def run_profile(args: argparse.Namespace) -> None:
+    """Запуск синтетической нагрузки под профилировщиком"""
+    workload = Workload(
+        customers=args.customers,
+        orders=args.orders,
+        lines=args.lines,
+        products=args.products,
+    )
+    logger.info(f"Profiling workload: {workload}")
+    report = profile_workload(ApplicationService(), workload, args.profile_dir, args.top)
+
+    logger.info(f"Workload finished in {report.elapsed:.2f} s")
+    logger.info(f"pstats written to {report.pstats_path}")
+    logger.info(f"Allocation snapshot written to {report.snapshot_path}")
+    logger.info("Top hotspots (cumulative time):\n" + report.hotspots)
+    logger.info("Service methods:\n" + report.service_methods)
+    logger.info("Top allocation sites:\n" + report.allocations)
+    logger.info("Live allocations by service method:\n" + report.service_allocations)
+
+
+def main(argv: list[str] | None = None):
     """Главная функция для запуска демонстрации"""
+    args = parse_args(argv)
+    if args.profile:
+        run_profile(args)
+        return
+
+    if args.metrics:
+        metrics.enable(
+            'product_service', 'customer_service', 'cart_service', 'order_service',
+            'report_service', 'promotion_service',
+            'product_repository', 'customer_repository', 'order_repository',
+            'data_loader'
+        )
+
     app = ApplicationService()
     demo = DemoRunner(app)
 
@@ -349,6 +408,10 @@ def main():
     demo.display_statistics()
     demo.log_separator("END OF DEMO")
 
+    if args.metrics:
+        metrics.write(args.metrics)
+        logger.info(f"Metrics written to {args.metrics}")
+
 
 if __name__ == "__main__":
     try:
@@ -11,3 +11,18 @@ class OrderStatus(str, Enum):
 
     def __str__(self) -> str:
         return self.value
+
+    def can_transition_to(self, status: 'OrderStatus') -> bool:
+        """Check whether an order may move from this status to another one"""
+        return status is self or status in ORDER_STATUS_TRANSITIONS[self]
+
+
+# Allowed moves between statuses; DELIVERED and CANCELLED are final.
+# Re-assigning the current status is always allowed and changes nothing.
+ORDER_STATUS_TRANSITIONS: dict[OrderStatus, frozenset[OrderStatus]] = {
+    OrderStatus.PENDING: frozenset({OrderStatus.PROCESSING, OrderStatus.CANCELLED}),
+    OrderStatus.PROCESSING: frozenset({OrderStatus.SHIPPED, OrderStatus.CANCELLED}),
+    OrderStatus.SHIPPED: frozenset({OrderStatus.DELIVERED}),
+    OrderStatus.DELIVERED: frozenset(),
+    OrderStatus.CANCELLED: frozenset(),
+}
@@ -3,7 +3,18 @@ from .order import Order, Warehouse
 from .product import Product, Category
 from .cart import ShoppingCart, CartItem
 from .discount import PercentageDiscount, FixedDiscount
-from .delivery import StandardDelivery, ExpressDelivery
+from .delivery import StandardDelivery, ExpressDelivery, TableRateDelivery
+from .delivery_rates import DeliveryRateEngine
+from .money import Money
+from .promotion import (
+    PromotionRule,
+    SubtotalRule,
+    TieredRule,
+    CategoryRule,
+    BuyXGetYRule,
+    OrderLine,
+    PromotionResult,
+)
 from .payment import CreditCardPayment, BankTransferPayment, PayPalPayment, Payment
 
 
@@ -19,8 +30,18 @@ __all__ = [
     "FixedDiscount",
     "StandardDelivery",
     "ExpressDelivery",
+    "TableRateDelivery",
+    "DeliveryRateEngine",
     "CreditCardPayment",
     "BankTransferPayment",
     "PayPalPayment",
     "Payment",
+    "Money",
+    "PromotionRule",
+    "SubtotalRule",
+    "TieredRule",
+    "CategoryRule",
+    "BuyXGetYRule",
+    "OrderLine",
+    "PromotionResult",
 ]
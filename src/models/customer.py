@@ -1,3 +1,17 @@
+import sys
+from itertools import count
+
+# Process-wide change stamps: a recreated customer never reuses a version
+_versions = count(1)
+
+
+def _interned(value):
+    # Cities and countries repeat across millions of customers; interning
+    # keeps one string object per distinct value. Interned strings live as
+    # long as the process, so high-cardinality values such as names are not
+    return sys.intern(value) if type(value) is str else value
+
+
 class Customer:
     def __init__(self, id: int, name: str, email: str):
         self.id = id
@@ -5,12 +19,41 @@ class Customer:
         self.email = email
         self.addresses: list[Address] = []
 
+    @property
+    def version(self) -> int:
+        '''Changes whenever the name, email or saved addresses change'''
+        return self._version
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._version = next(_versions)
+
+    @property
+    def email(self) -> str:
+        return self._email
+
+    @email.setter
+    def email(self, value: str) -> None:
+        self._email = value
+        self._version = next(_versions)
+
     def add_address(self, street: str, city: str, country: str):
         self.addresses.append(Address(street, city, country))
+        self._version = next(_versions)
+
+    def set_addresses(self, addresses: list[tuple[str, str, str]]):
+        '''Replaces all saved addresses with (street, city, country) entries'''
+        self.addresses = [Address(street, city, country) for street, city, country in addresses]
+        self._version = next(_versions)
 
 
 class Address:
     def __init__(self, street: str, city: str, country: str):
         self.street = street
-        self.city = city
-        self.country = country
+        self.city = _interned(city)
+        self.country = _interned(country)
@@ -1,17 +1,71 @@
 from abc import ABC, abstractmethod
+from .customer import Address
+from .delivery_rates import DeliveryRateEngine
+
+# Flyweights handed out by Delivery.shared(), one per class
+_shared_deliveries: dict[type, 'Delivery'] = {}
 
 
 class Delivery(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def cost(self) -> float:
         pass
 
+    @classmethod
+    def shared(cls) -> 'Delivery':
+        '''Process-wide instance of a delivery method that has no per-order state'''
+        instance = _shared_deliveries.get(cls)
+        if instance is None:
+            instance = _shared_deliveries.setdefault(cls, cls())
+        return instance
+
+    def quote(self, address: Address | None, weight: float, item_count: int) -> float:
+        '''Delivery cost for a concrete parcel, flat by default'''
+        return self.cost()
+
 
 class StandardDelivery(Delivery):
+    __slots__ = ()
+
     def cost(self) -> float:
         return 5.0
 
 
 class ExpressDelivery(Delivery):
+    __slots__ = ()
+
     def cost(self) -> float:
         return 15.0
+
+
+class TableRateDelivery(Delivery):
+    '''Delivery priced by a DeliveryRateEngine rate table'''
+    __slots__ = ('_method', '_engine')
+
+    def __init__(self, method: str, engine: DeliveryRateEngine):
+        self._method = method
+        self._engine = engine
+
+    @classmethod
+    def shared(cls) -> 'Delivery':
+        raise TypeError("TableRateDelivery needs a method and a rate engine; create it directly")
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    @property
+    def engine(self) -> DeliveryRateEngine:
+        return self._engine
+
+    def cost(self) -> float:
+        return self._engine.quote(self._method)
+
+    def quote(self, address: Address | None, weight: float, item_count: int) -> float:
+        if address is None:
+            return self._engine.quote(self._method, weight=weight, item_count=item_count)
+        return self._engine.quote(
+            self._method, address.country, address.city, weight, item_count
+        )
@@ -0,0 +1,118 @@
+import math
+from bisect import bisect_left
+from .money import Money
+
+Brackets = tuple[tuple[float, ...], tuple[Money, ...]]
+
+
+class DeliveryRateEngine:
+    '''Table-driven delivery pricing.
+
+    Destinations are mapped to zones through precomputed (country, city) and
+    country lookups. Each (method, zone) has weight brackets. Whenever zones
+    or rates change, a table of the brackets that apply to every known
+    (method, zone) is rebuilt with the default-zone fallback already
+    resolved, so a quote is one lookup plus a bisect of the parcel's exact
+    weight, with the per-item surcharge added on top.
+    '''
+    def __init__(self, default_zone: str = "default"):
+        self.default_zone = default_zone
+        self._country_zones: dict[str, str] = {}
+        self._city_zones: dict[tuple[str, str], str] = {}
+        self._brackets: dict[tuple[str, str], tuple[list[float], list[Money]]] = {}
+        self._item_surcharges: dict[str, Money] = {}
+        # (method, zone) -> brackets, replaced as a whole by _rebuild()
+        self._zone_brackets: dict[tuple[str, str], Brackets] = {}
+
+    @classmethod
+    def flat(cls, rates: dict[str, float]) -> 'DeliveryRateEngine':
+        '''Creates an engine charging one flat price per method everywhere'''
+        engine = cls()
+        for method, cost in rates.items():
+            engine.add_rate(method, engine.default_zone, math.inf, cost)
+        return engine
+
+    def add_zone(self, zone: str, country: str, city: str | None = None) -> None:
+        '''Maps a country, or a single city of a country, to a zone'''
+        if city is None:
+            self._country_zones[country.casefold()] = zone
+        else:
+            self._city_zones[(country.casefold(), city.casefold())] = zone
+        self._rebuild()
+
+    def add_rate(self, method: str, zone: str, max_weight: float, cost: float) -> None:
+        '''Adds a weight bracket: parcels up to max_weight kg cost `cost`'''
+        limits, prices = self._brackets.setdefault((method, zone), ([], []))
+        position = bisect_left(limits, max_weight)
+        if position < len(limits) and limits[position] == max_weight:
+            prices[position] = Money.from_amount(cost)
+        else:
+            limits.insert(position, max_weight)
+            prices.insert(position, Money.from_amount(cost))
+        self._rebuild()
+
+    def set_item_surcharge(self, method: str, amount: float) -> None:
+        '''Sets an extra charge per item for a delivery method'''
+        self._item_surcharges[method] = Money.from_amount(amount)
+
+    def zone_for(self, country: str | None, city: str | None = None) -> str:
+        '''Resolves the delivery zone of a destination'''
+        if country is None:
+            return self.default_zone
+        country_key = country.casefold()
+        if city is not None:
+            zone = self._city_zones.get((country_key, city.casefold()))
+            if zone is not None:
+                return zone
+        return self._country_zones.get(country_key, self.default_zone)
+
+    def quote_money(
+        self,
+        method: str,
+        country: str | None = None,
+        city: str | None = None,
+        weight: float = 0.0,
+        item_count: int = 0
+    ) -> Money:
+        '''Quotes the exact delivery cost of a parcel'''
+        if weight < 0:
+            raise ValueError("Weight cannot be negative")
+        zone = self.zone_for(country, city)
+        brackets = self._zone_brackets.get((method, zone))
+        if brackets is None:
+            raise ValueError(f"No delivery rates for method {method} in zone {zone}")
+        limits, prices = brackets
+        position = bisect_left(limits, weight)
+        if position == len(limits):
+            raise ValueError(
+                f"Parcel too heavy for {method} delivery to zone {zone}"
+            )
+        price = prices[position]
+        surcharge = self._item_surcharges.get(method)
+        if surcharge is not None and item_count:
+            price = price + surcharge * item_count
+        return price
+
+    def quote(
+        self,
+        method: str,
+        country: str | None = None,
+        city: str | None = None,
+        weight: float = 0.0,
+        item_count: int = 0
+    ) -> float:
+        '''Quotes the delivery cost of a parcel'''
+        return self.quote_money(method, country, city, weight, item_count).amount
+
+    def _rebuild(self) -> None:
+        zones = {self.default_zone, *self._country_zones.values(), *self._city_zones.values()}
+        zones.update(zone for _, zone in self._brackets)
+        table = {}
+        for method in {method for method, _ in self._brackets}:
+            fallback = self._brackets.get((method, self.default_zone))
+            for zone in zones:
+                brackets = self._brackets.get((method, zone), fallback)
+                if brackets is not None:
+                    # Copies: later add_rate calls must not change a published table
+                    table[(method, zone)] = (tuple(brackets[0]), tuple(brackets[1]))
+        self._zone_brackets = table
@@ -1,23 +1,45 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from .money import Money
 
 
 class Discount(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def apply(self, amount: float) -> float:
         pass
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def shared(cls, value: float) -> 'Discount':
+        '''Interned instance per discount type and value; discounts are immutable'''
+        return cls(value)
+
 
 class PercentageDiscount(Discount):
+    __slots__ = ('_percentage',)
+
     def __init__(self, percentage: float):
-        self.percentage = percentage
+        self._percentage = percentage
+
+    @property
+    def percentage(self) -> float:
+        return self._percentage
 
     def apply(self, amount: float) -> float:
-        return amount * (self.percentage / 100)
+        return Money.from_amount(amount).percent(self._percentage).amount
 
 
 class FixedDiscount(Discount):
+    __slots__ = ('_fixed_amount',)
+
     def __init__(self, fixed_amount: float):
-        self.fixed_amount = fixed_amount
+        self._fixed_amount = fixed_amount
+
+    @property
+    def fixed_amount(self) -> float:
+        return self._fixed_amount
 
     def apply(self, amount: float) -> float:
-        return min(self.fixed_amount, amount)
+        return min(Money.from_amount(self._fixed_amount), Money.from_amount(amount)).amount
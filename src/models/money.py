@@ -0,0 +1,134 @@
+import math
+from decimal import ROUND_HALF_UP, Decimal
+from functools import total_ordering
+from itertools import repeat
+from operator import mul
+from typing import Iterable
+
+CENTS_PER_UNIT = 100
+_CENT = Decimal('0.01')
+_UNIT = Decimal(1)
+
+
+def to_cents(amount: float) -> int:
+    '''Converts an amount to whole cents, rounding half away from zero.
+
+    Halves are judged on the shortest decimal form of the float, so 0.285
+    becomes 29 cents even though 0.285 * 100 is 28.499999999999996.
+    '''
+    scaled = amount * CENTS_PER_UNIT
+    if scaled < 0:
+        scaled = -scaled
+    cents = math.floor(scaled + 0.5)
+    if 0.5 - abs(cents - scaled) < 1e-9 + scaled * 1e-12:
+        # Near a half cent the float product may land on either side
+        return int(Decimal(repr(amount)).quantize(_CENT, ROUND_HALF_UP) * CENTS_PER_UNIT)
+    return -cents if amount < 0 else cents
+
+
+def from_cents(cents: int) -> float:
+    '''Converts whole cents back to a float amount'''
+    return cents / CENTS_PER_UNIT
+
+
+@total_ordering
+class Money:
+    '''Fixed-point money value stored as an integer number of cents'''
+    __slots__ = ('_cents',)
+
+    def __init__(self, cents: int = 0):
+        if not isinstance(cents, int):
+            raise TypeError("Money must be created from integer cents")
+        self._cents = cents
+
+    @classmethod
+    def from_amount(cls, amount: float) -> 'Money':
+        '''Creates money from a float amount (e.g. a product price)'''
+        return cls(to_cents(amount))
+
+    @property
+    def cents(self) -> int:
+        return self._cents
+
+    @property
+    def amount(self) -> float:
+        return from_cents(self._cents)
+
+    def percent(self, percentage: float) -> 'Money':
+        '''Returns the given percentage of this amount, rounded to cents.
+
+        Rates are taken exactly as written (33.333 stays 33.333); only the
+        result is rounded, half away from zero.
+        '''
+        basis_points = to_cents(percentage)
+        if from_cents(basis_points) != percentage:
+            # More than two decimals: scale by the shortest decimal form
+            scaled = Decimal(self._cents) * Decimal(repr(percentage)) / CENTS_PER_UNIT
+            return Money(int(scaled.quantize(_UNIT, ROUND_HALF_UP)))
+        # cents * basis points, then divide by 100 * 100 rounding half up
+        product = self._cents * basis_points
+        quotient, remainder = divmod(abs(product), 10000)
+        if remainder * 2 >= 10000:
+            quotient += 1
+        return Money(quotient if product >= 0 else -quotient)
+
+    @staticmethod
+    def sum(values: Iterable['Money']) -> 'Money':
+        '''Sums money values exactly'''
+        return Money(sum(value._cents for value in values))
+
+    @staticmethod
+    def sum_amounts(amounts: Iterable[float]) -> 'Money':
+        '''Sums float amounts that are already exact to the cent.
+
+        The conversion runs entirely in C (map/round/sum over ints), so it
+        stays exact and is much faster than accumulating Decimals.
+        '''
+        return Money(sum(map(round, map(mul, amounts, repeat(CENTS_PER_UNIT)))))
+
+    def __add__(self, other: 'Money') -> 'Money':
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self._cents + other._cents)
+
+    def __sub__(self, other: 'Money') -> 'Money':
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self._cents - other._cents)
+
+    def __mul__(self, quantity: int) -> 'Money':
+        if not isinstance(quantity, int):
+            return NotImplemented
+        return Money(self._cents * quantity)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> 'Money':
+        return Money(-self._cents)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self._cents == other._cents
+
+    def __lt__(self, other: 'Money') -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self._cents < other._cents
+
+    def __hash__(self) -> int:
+        return hash(self._cents)
+
+    def __bool__(self) -> bool:
+        return self._cents != 0
+
+    def __float__(self) -> float:
+        return self.amount
+
+    def __repr__(self) -> str:
+        return f"Money({self._cents})"
+
+    def __str__(self) -> str:
+        sign = "-" if self._cents < 0 else ""
+        units, cents = divmod(abs(self._cents), CENTS_PER_UNIT)
+        return f"{sign}{units}.{cents:02d}"
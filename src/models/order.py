@@ -1,12 +1,23 @@
-from .customer import Customer
+import time
+from typing import NamedTuple
+from .customer import Customer, Address
 from .cart import CartItem
 from .product import Product
 from .discount import Discount
 from .delivery import Delivery
 from .payment import Payment
+from .money import Money
 from ..enum import OrderStatus
 
 
+class PriceBreakdown(NamedTuple):
+    '''Exact (integer cents) pricing of an order'''
+    subtotal: Money
+    discount: Money
+    delivery: Money
+    total: Money
+
+
 class Order:
     '''Represents a customer's order'''
     def __init__(
@@ -19,11 +30,14 @@ class Order:
             OrderItem(item.product, item.quantity) for item in cart_items
         ]
 
+        # Unix timestamp, UTC
+        self.created_at: float = time.time()
         self._status: OrderStatus = OrderStatus.PENDING
         self._order_id: int | None = None
         self._discount: Discount | None = None
         self._delivery: Delivery | None = None
         self._payment: Payment | None = None
+        self._shipping_address: Address | None = None
 
     @property
     def order_id(self) -> int | None:
@@ -41,6 +55,9 @@ class Order:
 
     @status.setter
     def status(self, value: OrderStatus) -> None:
+        value = OrderStatus(value)
+        if not self._status.can_transition_to(value):
+            raise ValueError(f"Cannot change order status from {self._status} to {value}")
         self._status = value
 
     @property
@@ -60,6 +77,17 @@ class Order:
         '''Sets the delivery method for the order'''
         self._delivery = delivery
 
+    @property
+    def shipping_address(self) -> Address | None:
+        '''Explicit shipping address, or the customer's first address'''
+        if self._shipping_address is not None:
+            return self._shipping_address
+        return self.customer.addresses[0] if self.customer.addresses else None
+
+    @shipping_address.setter
+    def shipping_address(self, address: Address) -> None:
+        self._shipping_address = address
+
     @property
     def payment(self) -> Payment | None:
         return self._payment
@@ -69,16 +97,37 @@ class Order:
         '''Sets the payment method for the order'''
         self._payment = payment
 
+    def price_breakdown(self) -> PriceBreakdown:
+        '''Calculates subtotal, discount, delivery and total in cents'''
+        subtotal = Money.sum(item.get_total_money() for item in self.items)
+        discount_amount = (
+            Money.from_amount(self._discount.apply(subtotal.amount))
+            if self._discount else Money()
+        )
+        delivery_cost = (
+            Money.from_amount(self._delivery.quote(
+                self.shipping_address, self.total_weight(), self.item_count()
+            ))
+            if self._delivery else Money()
+        )
+        total = subtotal - discount_amount + delivery_cost
+        return PriceBreakdown(subtotal, discount_amount, delivery_cost, total)
+
     def calculate_total(self) -> float:
         '''Calculates the total cost of the order'''
-        subtotal = self._calculate_subtotal()
-        discount_amount = self.discount.apply(subtotal) if self.discount else 0
-        delivery_cost = self._delivery.cost() if self._delivery else 0
-        return subtotal - discount_amount + delivery_cost
+        return self.price_breakdown().total.amount
+
+    def total_weight(self) -> float:
+        '''Total shipping weight of the order in kilograms'''
+        return sum(item.product.weight * item.quantity for item in self.items)
+
+    def item_count(self) -> int:
+        '''Total number of units in the order'''
+        return sum(item.quantity for item in self.items)
 
     def _calculate_subtotal(self) -> float:
         '''Calculates the subtotal before discounts and delivery'''
-        return sum(item.product.price * item.quantity for item in self.items)
+        return Money.sum(item.get_total_money() for item in self.items).amount
 
     def process_payment(self) -> None:
         '''Processes the payment for the order'''
@@ -97,7 +146,11 @@ class OrderItem:
 
     def get_total_price(self) -> float:
         '''Calculates the total price for this item'''
-        return self.product.price * self.quantity
+        return self.get_total_money().amount
+
+    def get_total_money(self) -> Money:
+        '''Calculates the exact total price for this item'''
+        return Money.from_amount(self.product.price) * self.quantity
 
 
 class Warehouse:
@@ -1,13 +1,18 @@
+from collections.abc import KeysView
+
+
 class Product:
     def __init__(
         self,
         product_id: int,
         name: str,
         price: float,
+        weight: float = 0.0,
     ):
         self.product_id = product_id
         self.name = name
         self.price = price
+        self.weight = weight
 
     @property
     def price(self):
@@ -19,20 +24,51 @@ class Product:
             raise ValueError("Price cannot be negative")
         self._price = value
 
+    @property
+    def weight(self) -> float:
+        '''Shipping weight in kilograms'''
+        return self._weight
+
+    @weight.setter
+    def weight(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("Weight cannot be negative")
+        self._weight = value
+
 
 class Category:
     def __init__(self, name: str):
         self.name = name
-        self._products: list[Product] = []
+        # dict keys keep insertion order and give O(1) membership
+        self._products: dict[Product, None] = {}
 
     @property
-    def products(self) -> list[Product]:
-        return self._products.copy()
+    def products(self) -> KeysView[Product]:
+        '''Read-only live view of the products in this category'''
+        return self._products.keys()
 
-    def add_product(self, product: Product):
-        if product not in self._products:
-            self._products.append(product)
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def __contains__(self, product: Product) -> bool:
+        return product in self._products
 
-    def remove_product(self, product: Product):
+    def add_product(self, product: Product) -> bool:
+        '''Adds a product, returns False if it was already present'''
         if product in self._products:
-            self._products.remove(product)
+            return False
+        self._products[product] = None
+        return True
+
+    def remove_product(self, product: Product) -> bool:
+        '''Removes a product, returns False if it was not present'''
+        if product not in self._products:
+            return False
+        del self._products[product]
+        return True
+
+    def add_products(self, products) -> int:
+        '''Adds many products at once, returns the number of new ones'''
+        before = len(self._products)
+        self._products.update(dict.fromkeys(products))
+        return len(self._products) - before
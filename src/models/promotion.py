@@ -0,0 +1,231 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from typing import Iterable, NamedTuple
+from .discount import Discount, FixedDiscount
+from .money import Money
+
+
+class OrderLine(NamedTuple):
+    '''A priced order line as seen by promotion rules'''
+    product_id: int
+    unit_price: Money
+    quantity: int
+    categories: tuple[str, ...] = ()
+
+    @property
+    def total(self) -> Money:
+        return self.unit_price * self.quantity
+
+
+class PromotionResult(NamedTuple):
+    '''Outcome of evaluating promotions against one order'''
+    amount: Money
+    applied_rules: tuple[str, ...]
+
+    def as_discount(self) -> Discount:
+        '''Returns the result as a discount that can be set on an Order'''
+        return FixedDiscount(self.amount.amount)
+
+
+class PromotionRule(ABC):
+    '''Base class for promotion rules.
+
+    The index hints (product_ids, categories, min_subtotal) let the compiled
+    rule set skip rules that cannot apply to an order.
+    '''
+    def __init__(self, rule_id: str, stackable: bool = True):
+        self.rule_id = rule_id
+        self.stackable = stackable
+
+    @property
+    def product_ids(self) -> frozenset[int]:
+        return frozenset()
+
+    @property
+    def categories(self) -> frozenset[str]:
+        return frozenset()
+
+    @property
+    def min_subtotal(self) -> Money:
+        return Money()
+
+    @abstractmethod
+    def evaluate(self, lines: list[OrderLine], subtotal: Money) -> Money:
+        '''Returns the discount this rule grants for the order'''
+        pass
+
+
+class SubtotalRule(PromotionRule):
+    '''Applies an existing Discount to the subtotal above a threshold'''
+    def __init__(
+        self,
+        rule_id: str,
+        discount: Discount,
+        min_subtotal: float = 0.0,
+        stackable: bool = True
+    ):
+        super().__init__(rule_id, stackable)
+        self.discount = discount
+        self._min_subtotal = Money.from_amount(min_subtotal)
+
+    @property
+    def min_subtotal(self) -> Money:
+        return self._min_subtotal
+
+    def evaluate(self, lines: list[OrderLine], subtotal: Money) -> Money:
+        if subtotal < self._min_subtotal:
+            return Money()
+        return Money.from_amount(self.discount.apply(subtotal.amount))
+
+
+class TieredRule(PromotionRule):
+    '''Percentage off the subtotal, the highest reached tier wins'''
+    def __init__(
+        self,
+        rule_id: str,
+        tiers: Iterable[tuple[float, float]],
+        stackable: bool = True
+    ):
+        super().__init__(rule_id, stackable)
+        ordered = sorted((Money.from_amount(threshold), percentage)
+                         for threshold, percentage in tiers)
+        if not ordered:
+            raise ValueError("Tiered rule needs at least one tier")
+        self._thresholds = [threshold.cents for threshold, _ in ordered]
+        self._percentages = [percentage for _, percentage in ordered]
+
+    @property
+    def min_subtotal(self) -> Money:
+        return Money(self._thresholds[0])
+
+    def evaluate(self, lines: list[OrderLine], subtotal: Money) -> Money:
+        tier = bisect_right(self._thresholds, subtotal.cents) - 1
+        if tier < 0:
+            return Money()
+        return subtotal.percent(self._percentages[tier])
+
+
+class CategoryRule(PromotionRule):
+    '''Percentage off the lines that belong to a category'''
+    def __init__(
+        self,
+        rule_id: str,
+        category: str,
+        percentage: float,
+        stackable: bool = True
+    ):
+        super().__init__(rule_id, stackable)
+        self.category = category
+        self.percentage = percentage
+
+    @property
+    def categories(self) -> frozenset[str]:
+        return frozenset((self.category,))
+
+    def evaluate(self, lines: list[OrderLine], subtotal: Money) -> Money:
+        matching = Money.sum(
+            line.total for line in lines if self.category in line.categories
+        )
+        return matching.percent(self.percentage)
+
+
+class BuyXGetYRule(PromotionRule):
+    '''For every `buy` units of a product, `get` more units are free'''
+    def __init__(
+        self,
+        rule_id: str,
+        product_id: int,
+        buy: int,
+        get: int,
+        stackable: bool = True
+    ):
+        if buy <= 0 or get <= 0:
+            raise ValueError("Buy and get quantities must be positive")
+        super().__init__(rule_id, stackable)
+        self.product_id = product_id
+        self.buy = buy
+        self.get = get
+
+    @property
+    def product_ids(self) -> frozenset[int]:
+        return frozenset((self.product_id,))
+
+    def evaluate(self, lines: list[OrderLine], subtotal: Money) -> Money:
+        discount = Money()
+        for line in lines:
+            if line.product_id == self.product_id:
+                free_units = line.quantity // (self.buy + self.get) * self.get
+                discount += line.unit_price * free_units
+        return discount
+
+
+class CompiledPromotions:
+    '''Promotion rules indexed by product, category and subtotal threshold.
+
+    Only the rules reachable through an order's products, categories and
+    subtotal are evaluated. Stackable rules add up, an exclusive rule only
+    wins when it is worth more than the whole stack; the discount never
+    exceeds the subtotal.
+    '''
+    def __init__(self, rules: Iterable[PromotionRule]):
+        self._by_product: dict[int, list[PromotionRule]] = {}
+        self._by_category: dict[str, list[PromotionRule]] = {}
+        threshold_rules: list[tuple[int, int, PromotionRule]] = []
+
+        for position, rule in enumerate(rules):
+            if rule.product_ids:
+                for product_id in rule.product_ids:
+                    self._by_product.setdefault(product_id, []).append(rule)
+            elif rule.categories:
+                for category in rule.categories:
+                    self._by_category.setdefault(category, []).append(rule)
+            else:
+                threshold_rules.append((rule.min_subtotal.cents, position, rule))
+
+        threshold_rules.sort(key=lambda entry: entry[:2])
+        self._thresholds = [cents for cents, _, _ in threshold_rules]
+        self._threshold_rules = [rule for _, _, rule in threshold_rules]
+
+    def candidates(self, lines: list[OrderLine], subtotal: Money) -> list[PromotionRule]:
+        '''Returns the rules that may apply to the order, without duplicates'''
+        found: dict[int, PromotionRule] = {}
+        by_product = self._by_product
+        by_category = self._by_category
+        for line in lines:
+            for rule in by_product.get(line.product_id, ()):
+                found[id(rule)] = rule
+            for category in line.categories:
+                for rule in by_category.get(category, ()):
+                    found[id(rule)] = rule
+        reachable = bisect_right(self._thresholds, subtotal.cents)
+        for rule in self._threshold_rules[:reachable]:
+            found[id(rule)] = rule
+        return list(found.values())
+
+    def evaluate(self, lines: list[OrderLine]) -> PromotionResult:
+        '''Evaluates the applicable rules for one order'''
+        subtotal = Money.sum(line.total for line in lines)
+        stacked = Money()
+        stacked_ids: list[str] = []
+        best_exclusive = Money()
+        best_exclusive_id: str | None = None
+
+        for rule in self.candidates(lines, subtotal):
+            amount = rule.evaluate(lines, subtotal)
+            if not amount:
+                continue
+            if rule.stackable:
+                stacked += amount
+                stacked_ids.append(rule.rule_id)
+            elif amount > best_exclusive:
+                best_exclusive = amount
+                best_exclusive_id = rule.rule_id
+
+        if best_exclusive_id is not None and best_exclusive > stacked:
+            return PromotionResult(min(best_exclusive, subtotal), (best_exclusive_id,))
+        return PromotionResult(min(stacked, subtotal), tuple(stacked_ids))
+
+    def evaluate_batch(self, orders: Iterable[list[OrderLine]]) -> list[PromotionResult]:
+        '''Evaluates many orders against the same compiled rule set'''
+        evaluate = self.evaluate
+        return [evaluate(lines) for lines in orders]
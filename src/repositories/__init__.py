@@ -1,12 +1,21 @@
+from .category_repo import CategoryRepository
 from .customer_repo import CustomerRepository
 from .order_repo import OrderRepository
 from .product_repo import ProductRepository
+from .sharded import ShardedCustomerRepository, ShardedOrderRepository
+from .snapshot import CustomerRepositorySnapshot, OrderRepositorySnapshot, RepositorySnapshot
 from .warehouse_repo import WarehouseRepository
 
 
 __all__ = [
+    "CategoryRepository",
     "CustomerRepository",
+    "CustomerRepositorySnapshot",
     "OrderRepository",
+    "OrderRepositorySnapshot",
     "ProductRepository",
+    "RepositorySnapshot",
+    "ShardedCustomerRepository",
+    "ShardedOrderRepository",
     "WarehouseRepository",
 ]
@@ -0,0 +1,91 @@
+from ..models import Category, Product
+
+
+class CategoryRepository:
+    '''Stores categories and a product -> categories reverse index.
+
+    Membership changes should go through the repository so that the
+    reverse index stays in sync with the categories.
+    '''
+    def __init__(self):
+        self._categories: dict[str, Category] = {}
+        self._product_categories: dict[int, dict[str, None]] = {}
+
+    def add(self, category: Category) -> Category:
+        '''Adds a category and indexes the products it already contains.'''
+        if category.name in self._categories:
+            raise ValueError(f"Category {category.name} already exists")
+        self._categories[category.name] = category
+        for product in category.products:
+            self._index(product, category.name)
+        return category
+
+    def create(self, name: str) -> Category:
+        '''Creates an empty category and adds it to the repository.'''
+        return self.add(Category(name))
+
+    def get_by_name(self, name: str) -> Category | None:
+        '''Retrieves a category by its name.'''
+        return self._categories.get(name)
+
+    def get_all(self) -> list[Category]:
+        '''Retrieves all categories in the repository.'''
+        return list(self._categories.values())
+
+    def delete(self, name: str) -> None:
+        '''Deletes a category and drops it from the reverse index.'''
+        category = self._get_existing(name)
+        for product in category.products:
+            self._unindex(product, name)
+        del self._categories[name]
+
+    def add_product(self, name: str, product: Product) -> None:
+        '''Adds a product to a category.'''
+        if self._get_existing(name).add_product(product):
+            self._index(product, name)
+
+    def add_products(self, name: str, products: list[Product]) -> int:
+        '''Adds many products to a category, returns the number of new ones.'''
+        category = self._get_existing(name)
+        added = 0
+        for product in products:
+            if category.add_product(product):
+                self._index(product, name)
+                added += 1
+        return added
+
+    def remove_product(self, name: str, product: Product) -> None:
+        '''Removes a product from a category.'''
+        if self._get_existing(name).remove_product(product):
+            self._unindex(product, name)
+
+    def remove_product_everywhere(self, product: Product) -> None:
+        '''Removes a product from every category that contains it.'''
+        names = self._product_categories.pop(product.product_id, {})
+        for name in names:
+            self._categories[name].remove_product(product)
+
+    def get_products(self, name: str) -> list[Product]:
+        '''Retrieves the products of a category in insertion order.'''
+        return list(self._get_existing(name).products)
+
+    def get_categories_for_product(self, product_id: int) -> list[str]:
+        '''Retrieves the names of the categories a product belongs to.'''
+        return list(self._product_categories.get(product_id, ()))
+
+    def _get_existing(self, name: str) -> Category:
+        category = self._categories.get(name)
+        if category is None:
+            raise ValueError(f"Category {name} not found")
+        return category
+
+    def _index(self, product: Product, name: str) -> None:
+        self._product_categories.setdefault(product.product_id, {})[name] = None
+
+    def _unindex(self, product: Product, name: str) -> None:
+        names = self._product_categories.get(product.product_id)
+        if names is None:
+            return
+        names.pop(name, None)
+        if not names:
+            del self._product_categories[product.product_id]
@@ -1,40 +1,65 @@
+import threading
+
 from ..models import Customer
+from ..utils.cow import CopyOnWriteDict
+from ..utils.metrics import instrumented
+from .snapshot import CustomerRepositorySnapshot
 
 
 class CustomerRepository:
     def __init__(self):
-        self._customers: dict[int, Customer] = {}
+        self._customers: CopyOnWriteDict[int, Customer] = CopyOnWriteDict()
+        self._lock = threading.RLock()
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock held by writers; hold it to snapshot several repositories at once."""
+        return self._lock
+
+    def snapshot(self) -> CustomerRepositorySnapshot:
+        """Return a point-in-time view of the customers (copies n / 1024 chunk references)."""
+        with self._lock:
+            return CustomerRepositorySnapshot([self._customers.freeze()])
 
+    @instrumented("customer_repository")
     def add(self, customer: Customer) -> Customer:
         """Add a customer to the repository."""
-        if customer.id in self._customers:
-            raise ValueError(f"Customer with id {customer.id} already exists")
-        self._customers[customer.id] = customer
+        with self._lock:
+            if customer.id in self._customers:
+                raise ValueError(f"Customer with id {customer.id} already exists")
+            self._customers[customer.id] = customer
         return customer
 
+    @instrumented("customer_repository")
     def get_by_id(self, customer_id: int) -> Customer | None:
         """Get a customer by ID."""
         return self._customers.get(customer_id)
 
+    @instrumented("customer_repository")
     def find_by_email(self, email: str) -> Customer | None:
         """Find a customer by email."""
-        for customer in self._customers.values():
+        for customer in list(self._customers.values()):
             if customer.email == email:
                 return customer
         return None
 
+    @instrumented("customer_repository")
     def get_all(self) -> list[Customer]:
         """Get all customers."""
         return list(self._customers.values())
 
+    @instrumented("customer_repository")
     def update(self, customer: Customer) -> Customer:
         """Update an existing customer."""
-        if customer.id not in self._customers:
-            raise ValueError(f"Customer with id {customer.id} not found")
-        self._customers[customer.id] = customer
+        with self._lock:
+            if customer.id not in self._customers:
+                raise ValueError(f"Customer with id {customer.id} not found")
+            self._customers[customer.id] = customer
         return customer
 
+    @instrumented("customer_repository")
     def delete(self, customer_id: int) -> None:
         """Delete a customer by ID."""
-        if customer_id in self._customers:
-            del self._customers[customer_id]
+        with self._lock:
+            if customer_id in self._customers:
+                del self._customers[customer_id]
@@ -1,37 +1,119 @@
+import threading
+from collections.abc import Iterable
+
+from ..enum import OrderStatus
 from ..models import Order
+from ..utils.cow import CopyOnWriteDict
+from ..utils.ids import IdAllocator
+from ..utils.metrics import instrumented
+from .snapshot import OrderRepositorySnapshot
 
 
 class OrderRepository:
-    def __init__(self):
-        self._orders: dict[int, Order] = {}
-        self._next_id: int = 1
+    def __init__(self, start_id: int = 1, id_step: int = 1):
+        self._orders: CopyOnWriteDict[int, Order] = CopyOnWriteDict()
+        # Ids handed out are start_id, start_id + id_step, ... so that
+        # shards can share one id space without overlapping
+        self._ids = IdAllocator(start_id, id_step)
+        # status -> ids of orders in that status, kept in step by add/update
+        self._by_status: dict[OrderStatus, dict[int, None]] = {s: {} for s in OrderStatus}
+        self._indexed_status: CopyOnWriteDict[int, OrderStatus] = CopyOnWriteDict()
+        self._lock = threading.RLock()
+
+    @property
+    def lock(self) -> threading.RLock:
+        '''Lock held by writers; hold it to snapshot several repositories at once.'''
+        return self._lock
+
+    def snapshot(self) -> OrderRepositorySnapshot:
+        '''Returns a point-in-time view of the orders and their statuses.
 
+        Copies n / 1024 chunk references per dict; the first write to a chunk
+        afterwards copies that chunk (at most 1024 entries).
+        '''
+        with self._lock:
+            return OrderRepositorySnapshot(
+                [self._orders.freeze()],
+                [self._indexed_status.freeze()],
+                {status: len(ids) for status, ids in self._by_status.items()},
+            )
+
+    @instrumented("order_repository")
     def add(self, order: Order) -> Order:
         '''Adds a new order to the repository and returns its ID.'''
-        order.order_id = self._next_id
-        self._orders[order.order_id] = order
-        self._next_id += 1
+        order.order_id = self._ids.next_id()
+        with self._lock:
+            self._orders[order.order_id] = order
+            self._reindex(order)
         return order
 
+    @instrumented("order_repository")
     def get_by_id(self, order_id: int) -> Order | None:
         '''Retrieves an order by its ID.'''
         return self._orders.get(order_id)
 
+    @instrumented("order_repository")
+    def get_many(self, order_ids: Iterable[int]) -> list[Order | None]:
+        '''Retrieves several orders at once, None for unknown IDs.'''
+        get = self._orders.get
+        return [get(order_id) for order_id in order_ids]
+
+    @instrumented("order_repository")
     def get_by_customer(self, customer_id: int) -> list[Order]:
         '''Retrieves all orders for a specific customer.'''
+        # list() copies in one step, so concurrent adds cannot break the scan
         return [
-            order for order in self._orders.values()
+            order for order in list(self._orders.values())
             if order.customer.id == customer_id
         ]
 
+    @instrumented("order_repository")
+    def get_by_status(self, status: OrderStatus) -> list[Order]:
+        '''Retrieves all orders currently in the given status.'''
+        return [self._orders[order_id] for order_id in list(self._by_status[OrderStatus(status)])]
+
+    @instrumented("order_repository")
+    def count_by_status(self) -> dict[OrderStatus, int]:
+        '''Returns the number of orders in every status.'''
+        with self._lock:
+            return {status: len(ids) for status, ids in self._by_status.items()}
+
+    @instrumented("order_repository")
     def get_all(self) -> list[Order]:
         '''Retrieves all orders in the repository.'''
         return list(self._orders.values())
 
+    @instrumented("order_repository")
     def update(self, order: Order) -> Order:
         '''Updates an existing order in the repository.'''
-        if order.order_id not in self._orders:
-            raise ValueError(f"Order with id {order.order_id} not found")
+        with self._lock:
+            if order.order_id not in self._orders:
+                raise ValueError(f"Order with id {order.order_id} not found")
 
-        self._orders[order.order_id] = order
+            self._orders[order.order_id] = order
+            self._reindex(order)
         return order
+
+    @instrumented("order_repository")
+    def update_many(self, orders: Iterable[Order]) -> int:
+        '''Updates several existing orders in one pass and returns their number.'''
+        orders = list(orders)
+        with self._lock:
+            for order in orders:
+                if order.order_id not in self._orders:
+                    raise ValueError(f"Order with id {order.order_id} not found")
+
+            for order in orders:
+                self._orders[order.order_id] = order
+                self._reindex(order)
+        return len(orders)
+
+    def _reindex(self, order: Order) -> None:
+        status = order.status
+        previous = self._indexed_status.get(order.order_id)
+        if previous is status:
+            return
+        if previous is not None:
+            del self._by_status[previous][order.order_id]
+        self._by_status[status][order.order_id] = None
+        self._indexed_status[order.order_id] = status
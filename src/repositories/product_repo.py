@@ -1,41 +1,66 @@
+import threading
+
 from ..models import Product
+from ..utils.cow import CopyOnWriteDict
+from ..utils.metrics import instrumented
+from .snapshot import RepositorySnapshot
 
 
 class ProductRepository:
     def __init__(self):
-        self._products: dict[int, Product] = {}
+        self._products: CopyOnWriteDict[int, Product] = CopyOnWriteDict()
+        self._lock = threading.RLock()
+
+    @property
+    def lock(self) -> threading.RLock:
+        '''Lock held by writers; hold it to snapshot several repositories at once.'''
+        return self._lock
+
+    def snapshot(self) -> RepositorySnapshot[Product]:
+        '''Returns a point-in-time view of the products (copies n / 1024 chunk references).'''
+        with self._lock:
+            return RepositorySnapshot([self._products.freeze()])
 
     def create(
         self,
         product_id: int,
         name: str,
-        price: float
+        price: float,
+        weight: float = 0.0
     ) -> Product:
         '''Creates a new product and adds it to the repository.'''
-        product = Product(product_id, name, price)
+        product = Product(product_id, name, price, weight)
         self.add(product)
         return product
 
+    @instrumented("product_repository")
     def add(self, product: Product) -> None:
         '''Adds a product to the repository.'''
-        self._products[product.product_id] = product
+        with self._lock:
+            self._products[product.product_id] = product
 
+    @instrumented("product_repository")
     def get_by_id(self, product_id: int) -> Product | None:
         '''Retrieves a product by its ID.'''
         return self._products.get(product_id)
 
+    @instrumented("product_repository")
     def get_all(self) -> list[Product]:
         '''Retrieves all products in the repository.'''
         return list(self._products.values())
 
+    @instrumented("product_repository")
     def update(self, product: Product) -> None:
         '''Updates an existing product in the repository.'''
-        if product.product_id not in self._products:
-            raise ValueError(f"Product with id {product.product_id} not found")
-        self._products[product.product_id] = product
+        with self._lock:
+            if product.product_id not in self._products:
+                raise ValueError(f"Product with id {product.product_id} not found")
+            self._products[product.product_id] = product
 
+    @instrumented("product_repository")
     def delete(self, product_id: int) -> None:
         '''Deletes a product from the repository by its ID.'''
-        if product_id not in self._products:
-            raise ValueError(f"Product with id {product_id} not found")
-        del self._products[product_id]
+        with self._lock:
+            if product_id not in self._products:
+                raise ValueError(f"Product with id {product_id} not found")
+            del self._products[product_id]
@@ -0,0 +1,219 @@
+from collections.abc import Iterable
+from contextlib import ExitStack
+from typing import Generic, TypeVar
+
+from ..enum import OrderStatus
+from ..models import Customer, Order
+from .customer_repo import CustomerRepository
+from .order_repo import OrderRepository
+from .snapshot import CustomerRepositorySnapshot, OrderRepositorySnapshot
+
+R = TypeVar('R')
+
+
+class _Shard(Generic[R]):
+    '''One partition: a plain repository guarded by its own lock.'''
+    __slots__ = ('repository', 'lock')
+
+    def __init__(self, repository: R):
+        self.repository = repository
+        self.lock = repository.lock
+
+
+class _AllShardsLock:
+    '''Acquires every shard lock, always in shard order to avoid deadlocks.'''
+
+    def __init__(self, shards: list[_Shard]):
+        self._shards = shards
+        self._stack: ExitStack | None = None
+
+    def __enter__(self):
+        stack = ExitStack()
+        for shard in self._shards:
+            stack.enter_context(shard.lock)
+        self._stack = stack
+        return self
+
+    def __exit__(self, *exc_info):
+        stack, self._stack = self._stack, None
+        return stack.__exit__(*exc_info)
+
+
+class ShardedCustomerRepository:
+    '''Customers partitioned by id across independently locked shards.
+
+    Exposes the CustomerRepository interface. Point operations touch one
+    shard; get_all and find_by_email scatter to every shard and gather.
+    '''
+
+    def __init__(self, shards: int = 4):
+        if shards <= 0:
+            raise ValueError("Shard count must be positive")
+        self._shards = [_Shard(CustomerRepository()) for _ in range(shards)]
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._shards)
+
+    @property
+    def lock(self) -> _AllShardsLock:
+        '''Context manager holding every shard lock at once.'''
+        return _AllShardsLock(self._shards)
+
+    def snapshot(self) -> CustomerRepositorySnapshot:
+        '''Returns a point-in-time view across all shards.'''
+        with self.lock:
+            parts = [shard.repository.snapshot() for shard in self._shards]
+        return CustomerRepositorySnapshot.merged(parts, sort_key=lambda customer: customer.id)
+
+    def _shard(self, customer_id: int) -> _Shard[CustomerRepository]:
+        return self._shards[hash(customer_id) % len(self._shards)]
+
+    def add(self, customer: Customer) -> Customer:
+        '''Add a customer to its shard.'''
+        shard = self._shard(customer.id)
+        with shard.lock:
+            return shard.repository.add(customer)
+
+    def get_by_id(self, customer_id: int) -> Customer | None:
+        '''Get a customer by ID.'''
+        return self._shard(customer_id).repository.get_by_id(customer_id)
+
+    def find_by_email(self, email: str) -> Customer | None:
+        '''Find a customer by email in any shard.'''
+        for shard in self._shards:
+            with shard.lock:
+                customer = shard.repository.find_by_email(email)
+            if customer is not None:
+                return customer
+        return None
+
+    def get_all(self) -> list[Customer]:
+        '''Get all customers, ordered by ID.'''
+        customers = []
+        for shard in self._shards:
+            with shard.lock:
+                customers.extend(shard.repository.get_all())
+        customers.sort(key=lambda customer: customer.id)
+        return customers
+
+    def update(self, customer: Customer) -> Customer:
+        '''Update an existing customer.'''
+        shard = self._shard(customer.id)
+        with shard.lock:
+            return shard.repository.update(customer)
+
+    def delete(self, customer_id: int) -> None:
+        '''Delete a customer by ID.'''
+        shard = self._shard(customer_id)
+        with shard.lock:
+            shard.repository.delete(customer_id)
+
+
+class ShardedOrderRepository:
+    '''Orders partitioned across independently locked shards.
+
+    An order is stored in the shard of its customer, so get_by_customer
+    reads a single shard. Shard k allocates ids k + 1, k + 1 + N, ...
+    which lets get_by_id find the shard from the id alone without any
+    global counter.
+    '''
+
+    def __init__(self, shards: int = 4):
+        if shards <= 0:
+            raise ValueError("Shard count must be positive")
+        self._shards = [
+            _Shard(OrderRepository(start_id=index + 1, id_step=shards))
+            for index in range(shards)
+        ]
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._shards)
+
+    @property
+    def lock(self) -> _AllShardsLock:
+        '''Context manager holding every shard lock at once.'''
+        return _AllShardsLock(self._shards)
+
+    def snapshot(self) -> OrderRepositorySnapshot:
+        '''Returns a point-in-time view across all shards.'''
+        with self.lock:
+            parts = [shard.repository.snapshot() for shard in self._shards]
+        return OrderRepositorySnapshot.merged(parts, sort_key=lambda order: order.order_id)
+
+    def _shard_for_customer(self, customer_id: int) -> _Shard[OrderRepository]:
+        return self._shards[hash(customer_id) % len(self._shards)]
+
+    def _shard_for_order(self, order_id: int) -> _Shard[OrderRepository]:
+        return self._shards[(order_id - 1) % len(self._shards)]
+
+    def add(self, order: Order) -> Order:
+        '''Adds a new order to its customer's shard and assigns its ID.'''
+        shard = self._shard_for_customer(order.customer.id)
+        with shard.lock:
+            return shard.repository.add(order)
+
+    def get_by_id(self, order_id: int) -> Order | None:
+        '''Retrieves an order by its ID.'''
+        if order_id <= 0:
+            return None
+        return self._shard_for_order(order_id).repository.get_by_id(order_id)
+
+    def get_many(self, order_ids: Iterable[int]) -> list[Order | None]:
+        '''Retrieves several orders at once, None for unknown IDs.'''
+        return [self.get_by_id(order_id) for order_id in order_ids]
+
+    def get_by_customer(self, customer_id: int) -> list[Order]:
+        '''Retrieves all orders for a specific customer.'''
+        shard = self._shard_for_customer(customer_id)
+        with shard.lock:
+            return shard.repository.get_by_customer(customer_id)
+
+    def get_by_status(self, status: OrderStatus) -> list[Order]:
+        '''Retrieves all orders currently in the given status, ordered by ID.'''
+        return self._gather(lambda repository: repository.get_by_status(status))
+
+    def count_by_status(self) -> dict[OrderStatus, int]:
+        '''Returns the number of orders in every status.'''
+        counts = dict.fromkeys(OrderStatus, 0)
+        for shard in self._shards:
+            with shard.lock:
+                for status, count in shard.repository.count_by_status().items():
+                    counts[status] += count
+        return counts
+
+    def get_all(self) -> list[Order]:
+        '''Retrieves all orders, ordered by ID.'''
+        return self._gather(lambda repository: repository.get_all())
+
+    def update(self, order: Order) -> Order:
+        '''Updates an existing order in its shard.'''
+        if self.get_by_id(order.order_id or 0) is None:
+            raise ValueError(f"Order with id {order.order_id} not found")
+        shard = self._shard_for_order(order.order_id)
+        with shard.lock:
+            return shard.repository.update(order)
+
+    def update_many(self, orders: Iterable[Order]) -> int:
+        '''Updates several existing orders, one batch per shard.'''
+        batches: dict[int, list[Order]] = {}
+        for order in orders:
+            if self.get_by_id(order.order_id or 0) is None:
+                raise ValueError(f"Order with id {order.order_id} not found")
+            batches.setdefault((order.order_id - 1) % len(self._shards), []).append(order)
+
+        updated = 0
+        for index, batch in batches.items():
+            shard = self._shards[index]
+            with shard.lock:
+                updated += shard.repository.update_many(batch)
+        return updated
+
+    def _gather(self, read) -> list[Order]:
+        orders = []
+        for shard in self._shards:
+            with shard.lock:
+                orders.extend(read(shard.repository))
+        orders.sort(key=lambda order: order.order_id)
+        return orders
@@ -0,0 +1,101 @@
+from collections.abc import Callable, Iterator, Mapping
+from itertools import chain
+from typing import Any, Generic, TypeVar
+
+from ..enum import OrderStatus
+from ..models import Customer, Order
+
+T = TypeVar('T')
+
+
+class RepositorySnapshot(Generic[T]):
+    '''Read-only point-in-time view of a repository.
+
+    Holds frozen id -> entity mappings (one per shard). Later adds, updates
+    and deletes in the repository are not visible; the entities themselves
+    are shared, so in-place changes to their fields are.
+    '''
+
+    def __init__(self, parts: list[Mapping[int, T]], sort_key: Callable[[T], Any] | None = None):
+        self._parts = parts
+        self._sort_key = sort_key
+
+    @classmethod
+    def merged(cls, snapshots: list['RepositorySnapshot[T]'],
+               sort_key: Callable[[T], Any] | None = None) -> 'RepositorySnapshot[T]':
+        '''Combines per-shard snapshots into one view.'''
+        return cls([part for snapshot in snapshots for part in snapshot._parts], sort_key)
+
+    def __len__(self) -> int:
+        return sum(len(part) for part in self._parts)
+
+    def __iter__(self) -> Iterator[T]:
+        '''Iterates entities shard by shard without building (or sorting) a list.'''
+        return chain.from_iterable(part.values() for part in self._parts)
+
+    def get_by_id(self, entity_id: int) -> T | None:
+        for part in self._parts:
+            entity = part.get(entity_id)
+            if entity is not None:
+                return entity
+        return None
+
+    def get_all(self) -> list[T]:
+        entities = list(chain.from_iterable(part.values() for part in self._parts))
+        if self._sort_key is not None and len(self._parts) > 1:
+            entities.sort(key=self._sort_key)
+        return entities
+
+
+class CustomerRepositorySnapshot(RepositorySnapshot[Customer]):
+    def find_by_email(self, email: str) -> Customer | None:
+        for customer in self.get_all():
+            if customer.email == email:
+                return customer
+        return None
+
+
+class OrderRepositorySnapshot(RepositorySnapshot[Order]):
+    '''Orders as of the snapshot, including the status each order had then.'''
+
+    def __init__(
+        self,
+        parts: list[Mapping[int, Order]],
+        statuses: list[Mapping[int, OrderStatus]],
+        counts: dict[OrderStatus, int],
+        sort_key: Callable[[Order], Any] | None = None
+    ):
+        super().__init__(parts, sort_key)
+        self._statuses = statuses
+        self._counts = counts
+
+    @classmethod
+    def merged(cls, snapshots: list['OrderRepositorySnapshot'],
+               sort_key: Callable[[Order], Any] | None = None) -> 'OrderRepositorySnapshot':
+        counts = dict.fromkeys(OrderStatus, 0)
+        for snapshot in snapshots:
+            for status, count in snapshot._counts.items():
+                counts[status] += count
+        return cls(
+            [part for snapshot in snapshots for part in snapshot._parts],
+            [part for snapshot in snapshots for part in snapshot._statuses],
+            counts,
+            sort_key,
+        )
+
+    def status_of(self, order_id: int) -> OrderStatus | None:
+        for part in self._statuses:
+            status = part.get(order_id)
+            if status is not None:
+                return status
+        return None
+
+    def get_by_customer(self, customer_id: int) -> list[Order]:
+        return [order for order in self.get_all() if order.customer.id == customer_id]
+
+    def get_by_status(self, status: OrderStatus) -> list[Order]:
+        status = OrderStatus(status)
+        return [order for order in self.get_all() if self.status_of(order.order_id) is status]
+
+    def count_by_status(self) -> dict[OrderStatus, int]:
+        return dict(self._counts)
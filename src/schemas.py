@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from typing import ClassVar
 from .models import (
     Product,
     Customer,
@@ -17,30 +18,34 @@ from .models import (
 from .enum import OrderStatus
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProductDTO:
     """Data Transfer Object for Product"""
     product_id: int
     name: str
-    price: float
+    # min/max metadata is enforced by src.utils.validation
+    price: float = field(metadata={'min': 0})
+    weight: float = field(default=0.0, metadata={'min': 0})
 
     @classmethod
     def from_model(cls, product: Product) -> 'ProductDTO':
         return cls(
             product_id=product.product_id,
             name=product.name,
-            price=product.price
+            price=product.price,
+            weight=product.weight
         )
 
     def to_model(self) -> Product:
         return Product(
             product_id=self.product_id,
             name=self.name,
-            price=self.price
+            price=self.price,
+            weight=self.weight
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class AddressDTO:
     """Data Transfer Object for Address"""
     street: str
@@ -48,13 +53,18 @@ class AddressDTO:
     country: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class CustomerDTO:
     """Data Transfer Object for Customer"""
     id: int
     name: str
     email: str
-    addresses: list[AddressDTO]
+    addresses: tuple[AddressDTO, ...]
+
+    def __post_init__(self):
+        # Accept any iterable; the stored tuple can be shared between versions
+        if not isinstance(self.addresses, tuple):
+            object.__setattr__(self, 'addresses', tuple(self.addresses))
 
     @classmethod
     def from_model(cls, customer: Customer) -> 'CustomerDTO':
@@ -62,10 +72,10 @@ class CustomerDTO:
             id=customer.id,
             name=customer.name,
             email=customer.email,
-            addresses=[
+            addresses=tuple(
                 AddressDTO(addr.street, addr.city, addr.country)
                 for addr in customer.addresses
-            ]
+            )
         )
 
     def to_model(self) -> Customer:
@@ -76,7 +86,7 @@ class CustomerDTO:
         return customer
 
 
-@dataclass
+@dataclass(frozen=True)
 class CartItemDTO:
     """Data Transfer Object for Cart Item"""
     product: ProductDTO
@@ -114,10 +124,10 @@ class PercentageDiscountDTO(DiscountDTO):
     """DTO for percentage discount"""
 
     def calculate_discount(self, amount: float) -> float:
-        return amount * (self.value / 100)
+        return self.to_model().apply(amount)
 
     def to_model(self) -> PercentageDiscount:
-        return PercentageDiscount(self.value)
+        return PercentageDiscount.shared(self.value)
 
 
 @dataclass
@@ -125,10 +135,10 @@ class FixedDiscountDTO(DiscountDTO):
     """DTO for fixed amount discount"""
 
     def calculate_discount(self, amount: float) -> float:
-        return min(self.value, amount)
+        return self.to_model().apply(amount)
 
     def to_model(self) -> FixedDiscount:
-        return FixedDiscount(self.value)
+        return FixedDiscount.shared(self.value)
 
 
 @dataclass
@@ -144,17 +154,19 @@ class DeliveryDTO(ABC):
 @dataclass
 class StandardDeliveryDTO(DeliveryDTO):
     """DTO for standard delivery"""
+    method: ClassVar[str] = 'standard'
 
     def to_model(self) -> StandardDelivery:
-        return StandardDelivery()
+        return StandardDelivery.shared()
 
 
 @dataclass
 class ExpressDeliveryDTO(DeliveryDTO):
     """DTO for express delivery"""
+    method: ClassVar[str] = 'express'
 
     def to_model(self) -> ExpressDelivery:
-        return ExpressDelivery()
+        return ExpressDelivery.shared()
 
 
 @dataclass
@@ -214,12 +226,12 @@ class OrderCreateDTO:
         return order
 
 
-@dataclass
+@dataclass(frozen=True)
 class OrderResultDTO:
     """Result of order processing"""
     order_id: int
     customer_name: str
-    items: list[CartItemDTO]
+    items: tuple[CartItemDTO, ...]
     subtotal: float
     discount_amount: float
     delivery_cost: float
@@ -227,34 +239,39 @@ class OrderResultDTO:
     status: OrderStatus
     payment_method: Payment | None = None
 
+    def __post_init__(self):
+        # Results are shared between concurrent callers, so keep them immutable
+        if not isinstance(self.items, tuple):
+            object.__setattr__(self, 'items', tuple(self.items))
+
     @classmethod
     def from_model(cls, order: Order) -> 'OrderResultDTO':
         """Convert Order model to DTO"""
-        items_dto = []
-        for order_item in order.items:
-            product_dto = ProductDTO.from_model(order_item.product)
-            cart_item_dto = CartItemDTO(
-                product=product_dto, quantity=order_item.quantity
-            )
-            items_dto.append(cart_item_dto)
-
-        subtotal = (
-            sum(item.product.price * item.quantity for item in order.items)
+        items_dto = tuple(
+            CartItemDTO(product=ProductDTO.from_model(order_item.product),
+                        quantity=order_item.quantity)
+            for order_item in order.items
         )
-        discount_amount = (
-            order.discount.apply(subtotal) if order.discount else 0
-        )
-        delivery_cost = order.delivery.cost() if order.delivery else 0
-        total = subtotal - discount_amount + delivery_cost
+
+        prices = order.price_breakdown()
 
         return cls(
             order_id=order.order_id,
             customer_name=order.customer.name,
             items=items_dto,
-            subtotal=subtotal,
-            discount_amount=discount_amount,
-            delivery_cost=delivery_cost,
-            total_amount=total,
+            subtotal=prices.subtotal.amount,
+            discount_amount=prices.discount.amount,
+            delivery_cost=prices.delivery.amount,
+            total_amount=prices.total.amount,
             status=order.status,
             payment_method=order.payment
         )
+
+
+@dataclass
+class SyncResultDTO:
+    """Counts of changes applied by an incremental sync"""
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
@@ -2,7 +2,10 @@ from .cart_service import CartService
 from .order_service import OrderService
 from .product_service import ProductService
 from .customer_service import CustomerService
+from .promotion_service import PromotionService
+from .report_service import ReportService
 from .app_service import ApplicationService
+from .async_service import AsyncApplicationService
 
 
 __all__ = [
@@ -10,5 +13,8 @@ __all__ = [
     "OrderService",
     "ProductService",
     "CustomerService",
+    "PromotionService",
+    "ReportService",
     "ApplicationService",
+    "AsyncApplicationService",
 ]
@@ -1,35 +1,98 @@
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass
+from itertools import count
 from pathlib import Path
 from ..repositories import (
     ProductRepository,
     CustomerRepository,
     OrderRepository,
-    WarehouseRepository
+    WarehouseRepository,
+    CategoryRepository,
+    ShardedCustomerRepository,
+    ShardedOrderRepository,
+    RepositorySnapshot,
+    CustomerRepositorySnapshot,
+    OrderRepositorySnapshot,
 )
-from . import ProductService, CustomerService, CartService, OrderService
-from ..schemas import ProductDTO, CustomerDTO, AddressDTO
+from . import (
+    ProductService,
+    CustomerService,
+    CartService,
+    OrderService,
+    PromotionService,
+    ReportService,
+)
+from ..schemas import ProductDTO, CustomerDTO, SyncResultDTO
 from ..utils import DataLoader
+from ..utils.data_loader import intern_customer
+from ..utils.cache import LRUCache
+from ..utils.singleflight import SingleFlight
+from ..utils.validation import ValidationError, validator_for
 from ..enum import OrderStatus
+from ..models import Money, DeliveryRateEngine, Product
+
+
+@dataclass(frozen=True)
+class ApplicationSnapshot:
+    """Products, customers and orders as of one instant"""
+    products: RepositorySnapshot[Product]
+    customers: CustomerRepositorySnapshot
+    orders: OrderRepositorySnapshot
+    taken_at: float
 
 
 class ApplicationService:
     """Main application service that initializes and coordinates all components"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        product_cache_size: int | None = None,
+        product_cache_ttl: float | None = None,
+        customer_cache_size: int | None = None,
+        shards: int | None = None,
+        single_flight: bool = False
+    ):
+        # With shards, customers and orders are partitioned across locked shards
+        self._shards = shards
+
         # Initialize repositories
         self._product_repo = ProductRepository()
-        self._customer_repo = CustomerRepository()
-        self._order_repo = OrderRepository()
+        self._customer_repo = self._new_customer_repo()
+        self._order_repo = self._new_order_repo()
         self._warehouse_repo = WarehouseRepository()
+        self._category_repo = CategoryRepository()
+
+        # Flat rates matching StandardDelivery / ExpressDelivery
+        self._delivery_engine = DeliveryRateEngine.flat({'standard': 5.0, 'express': 15.0})
+
+        # Read-through cache of product DTOs shared by product, cart and order services
+        self._product_cache = (
+            LRUCache(product_cache_size, product_cache_ttl) if product_cache_size else None
+        )
+
+        self._customer_cache = LRUCache(customer_cache_size) if customer_cache_size else None
+
+        # Concurrent get_product / get_order calls for one id share a single lookup
+        self._product_flight = SingleFlight() if single_flight else None
+        self._order_flight = SingleFlight() if single_flight else None
 
         # Initialize services
-        self._product_service = ProductService(self._product_repo)
-        self._customer_service = CustomerService(self._customer_repo)
-        self._cart_service = CartService(self._product_repo)
+        self._product_service = ProductService(
+            self._product_repo, self._category_repo, self._product_cache, self._product_flight
+        )
+        self._customer_service = CustomerService(self._customer_repo, self._customer_cache)
+        self._cart_service = self.new_cart()
         self._order_service = OrderService(
             self._order_repo,
             self._product_repo,
-            self._customer_repo
+            self._customer_repo,
+            self._product_cache,
+            self._order_flight,
+            self._delivery_engine
         )
+        self._promotion_service = PromotionService(self._product_repo, self._category_repo)
+        self._report_service = ReportService(self._order_repo)
         # Initialize data loader
         project_root = Path(__file__).parent.parent
         data_dir = project_root / "utils"
@@ -56,32 +119,64 @@ class ApplicationService:
         """Get order service instance"""
         return self._order_service
 
+    @property
+    def promotion_service(self) -> PromotionService:
+        """Get promotion service instance"""
+        return self._promotion_service
+
+    @property
+    def report_service(self) -> ReportService:
+        """Get report service instance"""
+        return self._report_service
+
+    @property
+    def delivery_engine(self) -> DeliveryRateEngine:
+        """Get delivery rate engine instance"""
+        return self._delivery_engine
+
     @property
     def warehouse_repo(self) -> WarehouseRepository:
         """Get warehouse repository instance"""
         return self._warehouse_repo
 
+    @property
+    def category_repo(self) -> CategoryRepository:
+        """Get category repository instance"""
+        return self._category_repo
+
+    def _new_customer_repo(self) -> CustomerRepository | ShardedCustomerRepository:
+        if self._shards:
+            return ShardedCustomerRepository(self._shards)
+        return CustomerRepository()
+
+    def _new_order_repo(self) -> OrderRepository | ShardedOrderRepository:
+        if self._shards:
+            return ShardedOrderRepository(self._shards)
+        return OrderRepository()
+
+    def new_cart(self) -> CartService:
+        """Create a separate cart for one shopper session"""
+        return CartService(self._product_repo, self._delivery_engine, self._product_cache)
+
     def initialize_sample_data(self) -> dict:
         """Initialize the application with sample data from JSON files"""
         products_data = self._data_loader.load_products()
         customers_data = self._data_loader.load_customers()
 
+        # Records are type- and range-checked in one pass, with every problem reported
+        build_product = validator_for(ProductDTO).build
+        build_customer = validator_for(CustomerDTO).build
+
         products = {}
         for prod_data in products_data:
-            product_dto = ProductDTO(**prod_data)
+            product_dto = build_product(prod_data)
             created_product = self._product_service.create_product(product_dto)
             key = prod_data['name'].lower().replace(' ', '_').split('_')[0]
             products[key] = created_product
 
         customers = {}
         for cust_data in customers_data:
-            addresses = [AddressDTO(**addr) for addr in cust_data['addresses']]
-            customer_dto = CustomerDTO(
-                id=cust_data['id'],
-                name=cust_data['name'],
-                email=cust_data['email'],
-                addresses=addresses
-            )
+            customer_dto = build_customer(cust_data)
             created_customer = self._customer_service.create_customer(customer_dto)
             key = cust_data['name'].split()[0].lower()
             customers[key] = created_customer
@@ -91,37 +186,145 @@ class ApplicationService:
             'customers': customers
         }
 
+    def ingest_files(
+        self,
+        data_dir: str | Path,
+        products: str = 'products-*.json',
+        customers: str = 'customers-*.json',
+        workers: int | None = None
+    ) -> dict:
+        """Load partitioned product and customer files from a directory.
+
+        Worker processes parse and validate whole files; the DTOs are fed to
+        the services here in file name order, products before customers.
+        Invalid records, and records the services refuse (such as an id
+        delivered twice), are skipped and reported per file by record index;
+        the rest of the batch is still applied.
+        """
+        loader = DataLoader(data_dir)
+        counts = {'products': 0, 'customers': 0}
+        rejected: dict[str, dict[int, tuple[str, ...]]] = {}
+
+        for key, pattern, dto_type, create in (
+            ('products', products, ProductDTO, self._product_service.create_product),
+            ('customers', customers, CustomerDTO, self._customer_service.create_customer),
+        ):
+            validate = validator_for(dto_type).build_many
+            for path, (dtos, failures) in loader.load_files(pattern, workers, validate):
+                failures = dict(failures)
+                # Valid DTOs are the records without validation errors, in order
+                indexes = (index for index in count() if index not in failures)
+                for index, dto in zip(indexes, dtos):
+                    try:
+                        create(dto)
+                    except ValueError as error:
+                        failures[index] = (str(error),)
+                    else:
+                        counts[key] += 1
+                if failures:
+                    rejected[path.name] = dict(sorted(failures.items()))
+
+        return {**counts, 'rejected': rejected}
+
+    def reload_catalog(
+        self,
+        data_dir: str | Path | None = None,
+        products: str | None = 'products.json',
+        customers: str | None = 'customers.json'
+    ) -> dict[str, SyncResultDTO]:
+        """Apply new full product/customer files as inserts, updates and deletes.
+
+        Files are validated completely before anything is applied, since a
+        record dropped as invalid would otherwise delete its entity. Pass
+        None to leave products or customers untouched.
+        """
+        loader = DataLoader(data_dir) if data_dir is not None else self._data_loader
+        results = {}
+
+        for key, filename, dto_type, sync in (
+            ('products', products, ProductDTO, self._product_service.sync_products),
+            ('customers', customers, CustomerDTO, self._customer_service.sync_customers),
+        ):
+            if filename is None:
+                continue
+            records = loader.iter_records(filename)
+            if dto_type is CustomerDTO:
+                # The whole file is held as DTOs until it is applied
+                records = map(intern_customer, records)
+            dtos, failures = validator_for(dto_type).build_many(records)
+            if failures:
+                raise ValidationError(dto_type.__name__, [
+                    f"record {index}: {error}"
+                    for index, errors in failures.items() for error in errors
+                ])
+            results[key] = sync(dtos)
+
+        return results
+
+    def snapshot(self) -> ApplicationSnapshot:
+        """Take a consistent point-in-time view of products, customers and orders.
+
+        Writers are paused while the chunk tables of the three repositories
+        are copied (n / 1024 references each). Afterwards the first write to
+        each chunk copies that chunk, at most 1024 entries; readers of the
+        snapshot never block later writes.
+        """
+        with ExitStack() as stack:
+            # Fixed order: products, customers, orders
+            for repository in (self._product_repo, self._customer_repo, self._order_repo):
+                stack.enter_context(repository.lock)
+            return ApplicationSnapshot(
+                products=self._product_repo.snapshot(),
+                customers=self._customer_repo.snapshot(),
+                orders=self._order_repo.snapshot(),
+                taken_at=time.time(),
+            )
+
     def get_statistics(self) -> dict:
         """Get application statistics"""
-        all_products = self._product_service.get_all_products()
-        all_customers = self._customer_service.get_all_customers()
-        all_orders = self._order_service.get_all_orders()
+        snapshot = self.snapshot()
+        orders = snapshot.orders.get_all()
+        status_counts = snapshot.orders.count_by_status()
 
-        total_revenue = sum(order.total_amount for order in all_orders)
-        active_orders = [order for order in all_orders if order.status != OrderStatus.CANCELLED]
-        cancelled_orders = [order for order in all_orders if order.status == OrderStatus.CANCELLED]
+        total_revenue = Money.sum(order.price_breakdown().total for order in orders).amount
+        cancelled_orders = status_counts[OrderStatus.CANCELLED]
 
         return {
-            'total_products': len(all_products),
-            'total_customers': len(all_customers),
-            'total_orders': len(all_orders),
-            'active_orders': len(active_orders),
-            'cancelled_orders': len(cancelled_orders),
+            'total_products': len(snapshot.products),
+            'total_customers': len(snapshot.customers),
+            'total_orders': len(orders),
+            'active_orders': len(orders) - cancelled_orders,
+            'cancelled_orders': cancelled_orders,
             'total_revenue': total_revenue
         }
 
     def reset(self):
         """Reset all data (useful for testing)"""
         self._product_repo = ProductRepository()
-        self._customer_repo = CustomerRepository()
-        self._order_repo = OrderRepository()
+        self._customer_repo = self._new_customer_repo()
+        self._order_repo = self._new_order_repo()
         self._warehouse_repo = WarehouseRepository()
+        self._category_repo = CategoryRepository()
+        for cache in (self._product_cache, self._customer_cache):
+            if cache is not None:
+                cache.clear()
+        if self._product_flight is not None:
+            # Lookups still running read the old repositories
+            self._product_flight = SingleFlight()
+            self._order_flight = SingleFlight()
 
-        self._product_service = ProductService(self._product_repo)
-        self._customer_service = CustomerService(self._customer_repo)
-        self._cart_service = CartService(self._product_repo)
+        self._product_service = ProductService(
+            self._product_repo, self._category_repo, self._product_cache, self._product_flight
+        )
+        self._customer_service = CustomerService(self._customer_repo, self._customer_cache)
+        self._cart_service = self.new_cart()
         self._order_service = OrderService(
             self._order_repo,
             self._product_repo,
-            self._customer_repo
+            self._customer_repo,
+            self._product_cache,
+            self._order_flight,
+            self._delivery_engine
         )
+        self._promotion_service = PromotionService(self._product_repo, self._category_repo)
+        self._report_service = ReportService(self._order_repo)
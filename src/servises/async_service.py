@@ -0,0 +1,267 @@
+import asyncio
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TypeVar
+
+from ..enum import OrderStatus
+from ..schemas import (
+    AddressDTO,
+    CustomerDTO,
+    OrderCreateDTO,
+    OrderResultDTO,
+    ProductDTO,
+    SyncResultDTO,
+)
+from ..utils.export import ExportReport
+from ..utils.singleflight import AsyncSingleFlight
+from .app_service import ApplicationService
+from .cart_service import CartService
+from .report_service import OrderReport
+
+T = TypeVar('T')
+
+# Coalesced reads, by the first element of their key, that each kind of
+# write can make stale
+_PRODUCT_READS = frozenset({'products', 'category', 'statistics', 'report'})
+_CUSTOMER_READS = frozenset({'customers', 'customer_by_email', 'statistics', 'report'})
+_ORDER_READS = frozenset({'orders', 'customer_orders', 'statistics', 'report'})
+
+
+class AsyncApplicationService:
+    """Asyncio facade over ApplicationService.
+
+    Lookups by id and other in-memory operations run inline on the event
+    loop: they finish in microseconds, well below the cost of a thread hop.
+    Calls that block or scan whole repositories (placing orders with their
+    payment, email lookups, listings, exports and file loads) run in a
+    bounded thread pool. Identical scans in flight at the same time are
+    coalesced into one call whose result every caller receives, so the
+    returned lists must not be modified. A write made through the facade
+    ends the sharing of scans it may affect, so a caller always sees its
+    own earlier writes.
+
+    Use one facade per event loop and close it when done, or use it as an
+    async context manager.
+    """
+
+    def __init__(self, app: ApplicationService | None = None, max_workers: int = 8):
+        if max_workers <= 0:
+            raise ValueError("Worker count must be positive")
+        self._app = app if app is not None else ApplicationService()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='async-service')
+        self._single_flight = AsyncSingleFlight()
+
+    @property
+    def app(self) -> ApplicationService:
+        """Get the wrapped application service"""
+        return self._app
+
+    async def __aenter__(self) -> 'AsyncApplicationService':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Wait for offloaded calls to finish and stop the thread pool."""
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    async def _offload(self, func: Callable[..., T], *args) -> T:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(func, *args)
+        )
+
+    async def _coalesced(self, key: tuple, func: Callable[..., T], *args) -> T:
+        return await self._single_flight.do(key, self._offload, func, *args)
+
+    def _forget(self, reads: frozenset[str]) -> None:
+        # Scans already running may predate the write; later callers start anew
+        self._single_flight.forget_if(lambda key: key[0] in reads)
+
+    def new_cart(self) -> CartService:
+        """Create a cart for one shopper session.
+
+        Cart operations are in-memory and fast; call them directly.
+        """
+        return self._app.new_cart()
+
+    # Products
+
+    async def get_product(self, product_id: int) -> ProductDTO | None:
+        """Get a product by id."""
+        return self._app.product_service.get_product(product_id)
+
+    async def get_all_products(self) -> list[ProductDTO]:
+        """Get all products."""
+        service = self._app.product_service
+        return await self._coalesced(('products',), service.get_all_products)
+
+    async def get_products_by_category(self, category_name: str) -> list[ProductDTO]:
+        """Get the products of a category."""
+        service = self._app.product_service
+        return await self._coalesced(('category', category_name),
+                                     service.get_products_by_category, category_name)
+
+    async def create_product(self, dto: ProductDTO) -> ProductDTO:
+        """Create a new product."""
+        try:
+            return self._app.product_service.create_product(dto)
+        finally:
+            self._forget(_PRODUCT_READS)
+
+    async def update_price(self, product_id: int, new_price: float) -> None:
+        """Update the price of a product."""
+        try:
+            self._app.product_service.update_price(product_id, new_price)
+        finally:
+            self._forget(_PRODUCT_READS)
+
+    async def delete_product(self, product_id: int) -> None:
+        """Delete a product."""
+        try:
+            self._app.product_service.delete_product(product_id)
+        finally:
+            self._forget(_PRODUCT_READS)
+
+    # Customers
+
+    async def get_customer(self, customer_id: int) -> CustomerDTO | None:
+        """Get a customer by id."""
+        return self._app.customer_service.get_customer(customer_id)
+
+    async def get_customer_by_email(self, email: str) -> CustomerDTO | None:
+        """Get a customer by email."""
+        service = self._app.customer_service
+        return await self._coalesced(('customer_by_email', email),
+                                     service.get_customer_by_email, email)
+
+    async def get_all_customers(self) -> list[CustomerDTO]:
+        """Get all customers."""
+        service = self._app.customer_service
+        return await self._coalesced(('customers',), service.get_all_customers)
+
+    async def create_customer(self, dto: CustomerDTO) -> CustomerDTO:
+        """Create a new customer."""
+        try:
+            return await self._offload(self._app.customer_service.create_customer, dto)
+        finally:
+            self._forget(_CUSTOMER_READS)
+
+    async def add_address_to_customer(
+        self,
+        customer_id: int,
+        address_dto: AddressDTO
+    ) -> CustomerDTO:
+        """Add an address to a customer."""
+        try:
+            return self._app.customer_service.add_address_to_customer(customer_id, address_dto)
+        finally:
+            self._forget(_CUSTOMER_READS)
+
+    async def update_customer_email(self, customer_id: int, new_email: str) -> CustomerDTO:
+        """Change the email of a customer."""
+        try:
+            return await self._offload(
+                self._app.customer_service.update_customer_email, customer_id, new_email
+            )
+        finally:
+            self._forget(_CUSTOMER_READS)
+
+    # Orders
+
+    async def create_order(self, order_dto: OrderCreateDTO) -> OrderResultDTO:
+        """Place an order and process its payment."""
+        try:
+            return await self._offload(self._app.order_service.create_order, order_dto)
+        finally:
+            self._forget(_ORDER_READS)
+
+    async def get_order(self, order_id: int) -> OrderResultDTO | None:
+        """Get an order by id."""
+        return self._app.order_service.get_order(order_id)
+
+    async def get_customer_orders(self, customer_id: int) -> list[OrderResultDTO]:
+        """Get all orders of a customer."""
+        service = self._app.order_service
+        return await self._coalesced(('customer_orders', customer_id),
+                                     service.get_customer_orders, customer_id)
+
+    async def get_all_orders(self) -> list[OrderResultDTO]:
+        """Get all orders."""
+        service = self._app.order_service
+        return await self._coalesced(('orders',), service.get_all_orders)
+
+    async def cancel_order(self, order_id: int) -> OrderResultDTO:
+        """Cancel an order."""
+        try:
+            return self._app.order_service.cancel_order(order_id)
+        finally:
+            self._forget(_ORDER_READS)
+
+    async def transition_orders(
+        self,
+        order_ids: Iterable[int],
+        status: OrderStatus,
+        skip_invalid: bool = False
+    ) -> list[int]:
+        """Move many orders to a new status and return the changed ids."""
+        try:
+            return await self._offload(
+                self._app.order_service.transition_orders, list(order_ids), status, skip_invalid
+            )
+        finally:
+            self._forget(_ORDER_READS)
+
+    async def count_orders_by_status(self) -> dict[OrderStatus, int]:
+        """Count orders in every status."""
+        return self._app.order_service.count_orders_by_status()
+
+    async def export_orders(
+        self,
+        directory: str | Path,
+        format: str = 'csv',
+        partition_by: str | None = None
+    ) -> ExportReport:
+        """Write all orders and their lines to files."""
+        return await self._offload(
+            self._app.order_service.export_orders, directory, format, partition_by
+        )
+
+    # Application
+
+    async def get_statistics(self) -> dict:
+        """Get application statistics."""
+        return await self._coalesced(('statistics',), self._app.get_statistics)
+
+    async def generate_report(self) -> OrderReport:
+        """Generate the customer spend, product revenue and status report."""
+        return await self._coalesced(('report',), self._app.report_service.generate)
+
+    async def reload_catalog(
+        self,
+        data_dir: str | Path | None = None,
+        products: str | None = 'products.json',
+        customers: str | None = 'customers.json'
+    ) -> dict[str, SyncResultDTO]:
+        """Apply new product and customer files as inserts, updates and deletes."""
+        try:
+            return await self._offload(self._app.reload_catalog, data_dir, products, customers)
+        finally:
+            self._forget(_PRODUCT_READS | _CUSTOMER_READS)
+
+    async def ingest_files(
+        self,
+        data_dir: str | Path,
+        products: str = 'products-*.json',
+        customers: str = 'customers-*.json',
+        workers: int | None = None
+    ) -> dict:
+        """Load partitioned product and customer files from a directory."""
+        try:
+            return await self._offload(
+                self._app.ingest_files, data_dir, products, customers, workers
+            )
+        finally:
+            self._forget(_PRODUCT_READS | _CUSTOMER_READS)
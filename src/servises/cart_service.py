@@ -1,32 +1,47 @@
+from dataclasses import replace
+
+from ..models import Money, DeliveryRateEngine
 from ..repositories import ProductRepository
-from ..schemas import CartItemDTO, ProductDTO
+from ..schemas import CartItemDTO, AddressDTO
+from ..utils.cache import LRUCache
+from ..utils.metrics import instrumented
+from .product_service import load_product_dto
 
 
 class CartService:
-    def __init__(self, product_repository: ProductRepository):
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        delivery_engine: DeliveryRateEngine | None = None,
+        product_cache: LRUCache | None = None
+    ):
         self._product_repository = product_repository
+        self._delivery_engine = delivery_engine
+        self._product_cache = product_cache
         self._cart_items: list[CartItemDTO] = []
 
+    @instrumented("cart_service")
     def add_item(self, product_id: int, quantity: int) -> CartItemDTO:
         """Add a product to the cart."""
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
 
-        product = self._product_repository.get_by_id(product_id)
-        if not product:
+        product_dto = load_product_dto(
+            self._product_repository, product_id, self._product_cache
+        )
+        if not product_dto:
             raise ValueError(f"Product with id {product_id} not found")
 
-        product_dto = ProductDTO.from_model(product)
-
-        for item in self._cart_items:
+        for index, item in enumerate(self._cart_items):
             if item.product.product_id == product_id:
-                item.quantity += quantity
+                item = self._cart_items[index] = replace(item, quantity=item.quantity + quantity)
                 return item
 
         cart_item = CartItemDTO(product=product_dto, quantity=quantity)
         self._cart_items.append(cart_item)
         return cart_item
 
+    @instrumented("cart_service")
     def remove_item(self, product_id: int) -> None:
         """Remove a product from the cart."""
         self._cart_items = [
@@ -34,14 +49,15 @@ class CartService:
             if item.product.product_id != product_id
         ]
 
+    @instrumented("cart_service")
     def update_quantity(self, product_id: int, quantity: int) -> CartItemDTO:
         """Update the quantity of a product in the cart."""
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
 
-        for item in self._cart_items:
+        for index, item in enumerate(self._cart_items):
             if item.product.product_id == product_id:
-                item.quantity = quantity
+                item = self._cart_items[index] = replace(item, quantity=quantity)
                 return item
 
         raise ValueError(f"Product with id {product_id} not in cart")
@@ -50,9 +66,38 @@ class CartService:
         """Get all items in the cart."""
         return self._cart_items.copy()
 
+    @instrumented("cart_service")
     def get_total(self) -> float:
         """Calculate the total price of all items in the cart."""
-        return sum(item.product.price * item.quantity for item in self._cart_items)
+        return Money.sum(
+            Money.from_amount(item.product.price) * item.quantity
+            for item in self._cart_items
+        ).amount
+
+    def get_total_weight(self) -> float:
+        """Calculate the shipping weight of all items in the cart."""
+        return sum(item.product.weight * item.quantity for item in self._cart_items)
+
+    @instrumented("cart_service")
+    def quote_delivery(self, method: str, address: AddressDTO | None = None) -> float:
+        """Quote the delivery cost of the cart for a delivery method."""
+        if self._delivery_engine is None:
+            raise ValueError("Delivery rate engine is not configured")
+
+        item_count = sum(item.quantity for item in self._cart_items)
+        return self._delivery_engine.quote(
+            method,
+            address.country if address else None,
+            address.city if address else None,
+            self.get_total_weight(),
+            item_count
+        )
+
+    def get_total_with_delivery(self, method: str, address: AddressDTO | None = None) -> float:
+        """Calculate the cart total including the delivery quote."""
+        total = Money.from_amount(self.get_total())
+        delivery = Money.from_amount(self.quote_delivery(method, address))
+        return (total + delivery).amount
 
     def clear(self) -> None:
         """Clear all items from the cart."""
@@ -1,64 +1,98 @@
+from collections.abc import Iterable
+from dataclasses import replace
+
+from ..models import Customer
 from ..repositories import CustomerRepository
-from ..schemas import CustomerDTO, AddressDTO
+from ..schemas import CustomerDTO, AddressDTO, SyncResultDTO
+from ..utils.cache import LRUCache
+from ..utils.metrics import instrumented
 
 
 class CustomerService:
-    def __init__(self, repository: CustomerRepository):
+    def __init__(self, repository: CustomerRepository, cache: LRUCache | None = None):
         self._repository = repository
+        # customer id -> (customer version, frozen CustomerDTO)
+        self._cache = cache
+
+    @property
+    def cache(self) -> LRUCache | None:
+        """Get the customer view cache, if configured"""
+        return self._cache
 
+    @instrumented("customer_service")
     def create_customer(self, customer_dto: CustomerDTO) -> CustomerDTO:
         """Create a new customer."""
-        existing_customer = self._repository.find_by_email(customer_dto.email)
-        if existing_customer:
-            raise ValueError(f"Customer with email {customer_dto.email} already exists")
-
         customer = customer_dto.to_model()
-        created_customer = self._repository.add(customer)
-        return CustomerDTO.from_model(created_customer)
+        # Check and add together, so concurrent creates cannot share an email
+        with self._repository.lock:
+            existing_customer = self._repository.find_by_email(customer_dto.email)
+            if existing_customer:
+                raise ValueError(f"Customer with email {customer_dto.email} already exists")
 
+            created_customer = self._repository.add(customer)
+        return self._view(created_customer)
+
+    @instrumented("customer_service")
     def get_customer(self, customer_id: int) -> CustomerDTO | None:
         """Retrieve a customer by ID."""
         customer = self._repository.get_by_id(customer_id)
-        return CustomerDTO.from_model(customer) if customer else None
+        return self._view(customer) if customer else None
 
+    @instrumented("customer_service")
     def get_customer_by_email(self, email: str) -> CustomerDTO | None:
         """Retrieve a customer by email."""
         customer = self._repository.find_by_email(email)
-        return CustomerDTO.from_model(customer) if customer else None
+        return self._view(customer) if customer else None
 
+    @instrumented("customer_service")
     def add_address_to_customer(self, customer_id: int, address_dto: AddressDTO) -> CustomerDTO:
         """Add a new address to a customer."""
-        customer = self._repository.get_by_id(customer_id)
+        with self._repository.lock:
+            customer = self._repository.get_by_id(customer_id)
 
-        if not customer:
-            raise ValueError(f"Customer with id {customer_id} not found")
+            if not customer:
+                raise ValueError(f"Customer with id {customer_id} not found")
 
-        customer.add_address(address_dto.street, address_dto.city, address_dto.country)
-        self._repository.update(customer)
+            previous = self._current_view(customer)
+            customer.add_address(address_dto.street, address_dto.city, address_dto.country)
+            version = customer.version
+            self._repository.update(customer)
 
-        return CustomerDTO.from_model(customer)
+        if previous is None:
+            return self._view(customer)
+        address = AddressDTO(address_dto.street, address_dto.city, address_dto.country)
+        view = replace(previous, addresses=previous.addresses + (address,))
+        return self._store(customer.id, version, view)
 
+    @instrumented("customer_service")
     def update_customer_email(self, customer_id: int, new_email: str) -> CustomerDTO:
         """Update customer's email."""
-        customer = self._repository.get_by_id(customer_id)
+        with self._repository.lock:
+            customer = self._repository.get_by_id(customer_id)
 
-        if not customer:
-            raise ValueError(f"Customer with id {customer_id} not found")
+            if not customer:
+                raise ValueError(f"Customer with id {customer_id} not found")
 
-        existing = self._repository.find_by_email(new_email)
-        if existing and existing.id != customer_id:
-            raise ValueError(f"Email {new_email} is already in use")
+            existing = self._repository.find_by_email(new_email)
+            if existing and existing.id != customer_id:
+                raise ValueError(f"Email {new_email} is already in use")
 
-        customer.email = new_email
-        self._repository.update(customer)
+            previous = self._current_view(customer)
+            customer.email = new_email
+            version = customer.version
+            self._repository.update(customer)
 
-        return CustomerDTO.from_model(customer)
+        if previous is None:
+            return self._view(customer)
+        return self._store(customer.id, version, replace(previous, email=new_email))
 
+    @instrumented("customer_service")
     def get_all_customers(self) -> list[CustomerDTO]:
         """Retrieve all customers."""
         customers = self._repository.get_all()
-        return [CustomerDTO.from_model(c) for c in customers]
+        return [self._view(c) for c in customers]
 
+    @instrumented("customer_service")
     def delete_customer(self, customer_id: int) -> None:
         """Delete a customer."""
         customer = self._repository.get_by_id(customer_id)
@@ -66,3 +100,70 @@ class CustomerService:
             raise ValueError(f"Customer with id {customer_id} not found")
 
         self._repository.delete(customer_id)
+        if self._cache is not None:
+            self._cache.invalidate(customer_id)
+
+    @instrumented("customer_service")
+    def sync_customers(self, dtos: Iterable[CustomerDTO]) -> SyncResultDTO:
+        """Make the customers match a full listing, touching only what differs.
+
+        The listing is authoritative: new customers are added without the
+        duplicate email check of create_customer, and customers absent from
+        it are deleted.
+        """
+        result = SyncResultDTO()
+        seen: set[int] = set()
+
+        with self._repository.lock:
+            for dto in dtos:
+                seen.add(dto.id)
+                customer = self._repository.get_by_id(dto.id)
+                if customer is None:
+                    self._repository.add(dto.to_model())
+                    result.inserted += 1
+                    continue
+
+                view = self._view(customer)
+                if view != dto:
+                    if view.name != dto.name:
+                        customer.name = dto.name
+                    if view.email != dto.email:
+                        customer.email = dto.email
+                    if view.addresses != dto.addresses:
+                        customer.set_addresses(
+                            [(a.street, a.city, a.country) for a in dto.addresses]
+                        )
+                    result.updated += 1
+                else:
+                    result.unchanged += 1
+
+            for customer in self._repository.get_all():
+                if customer.id not in seen:
+                    self.delete_customer(customer.id)
+                    result.deleted += 1
+        return result
+
+    def _current_view(self, customer: Customer) -> CustomerDTO | None:
+        """Return the cached view if it matches the customer's version."""
+        if self._cache is None:
+            return None
+        cached = self._cache.get(customer.id)
+        if cached is not None and cached[0] == customer.version:
+            return cached[1]
+        return None
+
+    def _view(self, customer: Customer) -> CustomerDTO:
+        """Return a frozen view of the customer, rebuilt only after a change."""
+        view = self._current_view(customer)
+        if view is None:
+            # Read first: a write landing mid-build leaves the entry stale, not wrong
+            version = customer.version
+            view = CustomerDTO.from_model(customer)
+            self._store(customer.id, version, view)
+        return view
+
+    def _store(self, customer_id: int, version: int, view: CustomerDTO) -> CustomerDTO:
+        """Cache a view under the customer version it was built from."""
+        if self._cache is not None:
+            self._cache.put(customer_id, (version, view))
+        return view
@@ -1,6 +1,16 @@
+from collections.abc import Iterable
+from pathlib import Path
+
+from ..models import DeliveryRateEngine, TableRateDelivery
+from ..models.delivery import Delivery
 from ..repositories import OrderRepository, ProductRepository, CustomerRepository
-from ..schemas import OrderCreateDTO, OrderResultDTO, CartItemDTO, ProductDTO
+from ..schemas import OrderCreateDTO, OrderResultDTO, CartItemDTO, DeliveryDTO
 from ..enum import OrderStatus
+from ..utils.cache import LRUCache
+from ..utils.export import ExportReport, OrderExporter
+from ..utils.metrics import instrumented
+from ..utils.singleflight import SingleFlight
+from .product_service import load_product_dto
 
 
 class OrderService:
@@ -8,12 +18,27 @@ class OrderService:
         self,
         order_repository: OrderRepository,
         product_repository: ProductRepository,
-        customer_repository: CustomerRepository
+        customer_repository: CustomerRepository,
+        product_cache: LRUCache | None = None,
+        single_flight: SingleFlight | None = None,
+        delivery_engine: DeliveryRateEngine | None = None
     ):
         self._order_repository = order_repository
         self._product_repository = product_repository
         self._customer_repository = customer_repository
-
+        self._product_cache = product_cache
+        # Concurrent reads of one order share a single lookup
+        self._single_flight = single_flight
+        # With an engine, orders are charged the same table rates carts quote
+        self._delivery_engine = delivery_engine
+        self._deliveries: dict[str, Delivery] = {}
+
+    @property
+    def single_flight(self) -> SingleFlight | None:
+        """Get the shared-lookup group for get_order, if configured"""
+        return self._single_flight
+
+    @instrumented("order_service")
     def create_order(self, order_dto: OrderCreateDTO) -> OrderResultDTO:
         """Create a new order from DTO."""
         customer = self._customer_repository.get_by_id(order_dto.customer_id)
@@ -22,15 +47,16 @@ class OrderService:
 
         cart_items_dto = []
         for product_id, quantity in order_dto.items:
-            product = self._product_repository.get_by_id(product_id)
+            product_dto = load_product_dto(
+                self._product_repository, product_id, self._product_cache
+            )
 
-            if not product:
+            if not product_dto:
                 raise ValueError(f"Product with id {product_id} not found")
 
             if quantity <= 0:
                 raise ValueError(f"Invalid quantity {quantity} for product {product_id}")
 
-            product_dto = ProductDTO.from_model(product)
             cart_item_dto = CartItemDTO(product=product_dto, quantity=quantity)
             cart_items_dto.append(cart_item_dto)
 
@@ -40,6 +66,8 @@ class OrderService:
         cart_items = [item.to_model() for item in cart_items_dto]
 
         order = order_dto.to_model(customer, cart_items)
+        if self._delivery_engine is not None:
+            order.delivery = self._table_rate_delivery(order_dto.delivery)
         saved_order = self._order_repository.add(order)
 
         try:
@@ -50,35 +78,125 @@ class OrderService:
             saved_order.status = OrderStatus.CANCELLED
             self._order_repository.update(saved_order)
             raise ValueError(f"Payment processing failed: {str(e)}") from e
+        finally:
+            self._forget(saved_order.order_id)
 
         return OrderResultDTO.from_model(saved_order)
 
+    @instrumented("order_service")
     def get_order(self, order_id: int) -> OrderResultDTO | None:
         """Get order by ID."""
+        if self._single_flight is not None:
+            return self._single_flight.do(order_id, self._load_order, order_id)
+        return self._load_order(order_id)
+
+    def _load_order(self, order_id: int) -> OrderResultDTO | None:
         order = self._order_repository.get_by_id(order_id)
 
         if not order:
             return None
         return OrderResultDTO.from_model(order)
 
+    @instrumented("order_service")
     def get_customer_orders(self, customer_id: int) -> list[OrderResultDTO]:
         """Get all orders for a customer."""
         orders = self._order_repository.get_by_customer(customer_id)
         return [OrderResultDTO.from_model(order) for order in orders]
 
+    @instrumented("order_service")
     def get_all_orders(self) -> list[OrderResultDTO]:
         """Get all orders."""
         orders = self._order_repository.get_all()
         return [OrderResultDTO.from_model(order) for order in orders]
 
+    @instrumented("order_service")
     def cancel_order(self, order_id: int) -> OrderResultDTO:
         """Cancel an order."""
-        order = self._order_repository.get_by_id(order_id)
+        with self._order_repository.lock:
+            order = self._order_repository.get_by_id(order_id)
 
-        if not order:
-            raise ValueError(f"Order with id {order_id} not found")
+            if not order:
+                raise ValueError(f"Order with id {order_id} not found")
 
-        order.status = OrderStatus.CANCELLED
-        self._order_repository.update(order)
+            order.status = OrderStatus.CANCELLED
+            self._order_repository.update(order)
+        self._forget(order_id)
 
         return OrderResultDTO.from_model(order)
+
+    @instrumented("order_service")
+    def transition_orders(
+        self,
+        order_ids: Iterable[int],
+        status: OrderStatus,
+        skip_invalid: bool = False
+    ) -> list[int]:
+        """Move many orders to a new status in one pass and return the changed ids.
+
+        All orders are validated before any of them changes, so by default an
+        unknown id or a forbidden transition leaves every order untouched.
+        With skip_invalid those orders are left out instead. Orders already in
+        the target status are not counted as changed.
+        """
+        status = OrderStatus(status)
+        order_ids = list(order_ids)
+        changed = []
+        errors = []
+
+        # Validation and the status changes form one step for concurrent writers
+        with self._order_repository.lock:
+            for order_id, order in zip(order_ids, self._order_repository.get_many(order_ids)):
+                if order is None:
+                    errors.append(f"Order with id {order_id} not found")
+                elif not order.status.can_transition_to(status):
+                    errors.append(
+                        f"Cannot change order {order_id} status from {order.status} to {status}"
+                    )
+                elif order.status is not status:
+                    changed.append(order)
+
+            if errors and not skip_invalid:
+                shown = "; ".join(errors[:5])
+                more = f" (and {len(errors) - 5} more)" if len(errors) > 5 else ""
+                raise ValueError(f"Invalid status transition: {shown}{more}")
+
+            for order in changed:
+                order.status = status
+            self._order_repository.update_many(changed)
+        for order in changed:
+            self._forget(order.order_id)
+        return [order.order_id for order in changed]
+
+    @instrumented("order_service")
+    def count_orders_by_status(self) -> dict[OrderStatus, int]:
+        """Count orders in every status."""
+        return self._order_repository.count_by_status()
+
+    @instrumented("order_service")
+    def export_orders(
+        self,
+        directory: str | Path,
+        format: str = 'csv',
+        partition_by: str | None = None
+    ) -> ExportReport:
+        """Stream all orders and their lines to files, as of one snapshot.
+
+        format is 'csv', 'jsonl' or 'columnar'; partition_by is None,
+        'status' or 'date'. Orders placed during the export are not included.
+        """
+        snapshot = self._order_repository.snapshot()
+        orders = ((order, snapshot.status_of(order.order_id)) for order in snapshot)
+        return OrderExporter(directory, format, partition_by).export(orders)
+
+    def _forget(self, order_id: int) -> None:
+        # Reads that started before a change must not be shared after it
+        if self._single_flight is not None:
+            self._single_flight.forget(order_id)
+
+    def _table_rate_delivery(self, delivery_dto: DeliveryDTO) -> Delivery:
+        delivery = self._deliveries.get(delivery_dto.method)
+        if delivery is None:
+            delivery = self._deliveries.setdefault(
+                delivery_dto.method, TableRateDelivery(delivery_dto.method, self._delivery_engine)
+            )
+        return delivery
@@ -1,24 +1,84 @@
-from ..repositories import ProductRepository
-from ..schemas import ProductDTO
+from collections.abc import Iterable
+
+from ..repositories import ProductRepository, CategoryRepository
+from ..schemas import ProductDTO, SyncResultDTO
+from ..utils.cache import LRUCache
+from ..utils.metrics import instrumented
+from ..utils.singleflight import SingleFlight
+
+
+def load_product_dto(
+    repository: ProductRepository,
+    product_id: int,
+    cache: LRUCache | None = None,
+    single_flight: SingleFlight | None = None
+) -> ProductDTO | None:
+    """Build a product DTO, reading through the cache when one is given.
+
+    With single_flight, concurrent misses for the same id share one load.
+    """
+    def load(key: int) -> ProductDTO | None:
+        product = repository.get_by_id(key)
+        return ProductDTO.from_model(product) if product else None
+
+    if single_flight is not None:
+        build = load
+
+        def load(key: int) -> ProductDTO | None:
+            return single_flight.do(key, build, key)
+
+    return load(product_id) if cache is None else cache.get_or_load(product_id, load)
 
 
 class ProductService:
-    def __init__(self, repository: ProductRepository):
+    def __init__(
+        self,
+        repository: ProductRepository,
+        category_repository: CategoryRepository | None = None,
+        cache: LRUCache | None = None,
+        single_flight: SingleFlight | None = None
+    ):
         self._repository = repository
+        self._category_repository = category_repository
+        # Product DTOs are frozen, so cached ones can be handed out as is.
+        # Changes made directly through the repository bypass invalidation.
+        self._cache = cache
+        # Concurrent reads of one id share a single lookup
+        self._single_flight = single_flight
+
+    @property
+    def cache(self) -> LRUCache | None:
+        """Get the product DTO cache, if configured"""
+        return self._cache
+
+    @property
+    def single_flight(self) -> SingleFlight | None:
+        """Get the shared-lookup group for get_product, if configured"""
+        return self._single_flight
 
+    @instrumented("product_service")
     def create_product(self, dto: ProductDTO) -> ProductDTO:
         """Create a new product and add it to the repository."""
         if dto.price < 0:
             raise ValueError("Price cannot be negative")
+        with self._repository.lock:
+            if self._repository.get_by_id(dto.product_id) is not None:
+                raise ValueError(f"Product with id {dto.product_id} already exists")
 
-        product = self._repository.create(dto.product_id, dto.name, dto.price)
+            product = self._repository.create(
+                dto.product_id, dto.name, dto.price, dto.weight
+            )
+        self._invalidate(dto.product_id)
         return ProductDTO.from_model(product)
 
+    @instrumented("product_service")
     def get_product(self, product_id: int) -> ProductDTO | None:
         """Retrieve a product by its ID."""
-        product = self._repository.get_by_id(product_id)
-        return ProductDTO.from_model(product) if product else None
+        return load_product_dto(
+            self._repository, product_id, self._cache, self._single_flight
+        )
 
+    @instrumented("product_service")
     def update_price(self, product_id: int, new_price: float) -> None:
         """Update the price of an existing product."""
         if new_price < 0:
@@ -31,16 +91,86 @@ class ProductService:
 
         product.price = new_price
         self._repository.update(product)
+        self._invalidate(product_id)
 
+    @instrumented("product_service")
     def get_all_products(self) -> list[ProductDTO]:
         """Retrieve all products from the repository."""
         products = self._repository.get_all()
         return [ProductDTO.from_model(p) for p in products]
 
+    @instrumented("product_service")
     def delete_product(self, product_id: int) -> None:
         """Delete a product from the repository."""
         product = self._repository.get_by_id(product_id)
         if not product:
             raise ValueError(f"Product with id {product_id} not found")
 
+        if self._category_repository is not None:
+            self._category_repository.remove_product_everywhere(product)
         self._repository.delete(product_id)
+        self._invalidate(product_id)
+
+    @instrumented("product_service")
+    def sync_products(self, dtos: Iterable[ProductDTO]) -> SyncResultDTO:
+        """Make the catalog match a full product listing, touching only what differs.
+
+        Products missing from the repository are inserted, ones whose name,
+        price or weight differ are updated in place (so categories keep
+        them), and products absent from the listing are deleted.
+        """
+        result = SyncResultDTO()
+        seen: set[int] = set()
+        get = self._repository.get_by_id
+
+        with self._repository.lock:
+            for dto in dtos:
+                seen.add(dto.product_id)
+                product = get(dto.product_id)
+                if product is None:
+                    self._repository.create(dto.product_id, dto.name, dto.price, dto.weight)
+                    result.inserted += 1
+                elif (product.name, product.price, product.weight) != (dto.name, dto.price, dto.weight):
+                    product.name = dto.name
+                    product.price = dto.price
+                    product.weight = dto.weight
+                    result.updated += 1
+                else:
+                    result.unchanged += 1
+                    continue
+                self._invalidate(dto.product_id)
+
+            for product in self._repository.get_all():
+                if product.product_id not in seen:
+                    self.delete_product(product.product_id)
+                    result.deleted += 1
+        return result
+
+    def add_product_to_category(self, product_id: int, category_name: str) -> None:
+        """Add an existing product to a category."""
+        product = self._repository.get_by_id(product_id)
+        if not product:
+            raise ValueError(f"Product with id {product_id} not found")
+
+        self._get_category_repository().add_product(category_name, product)
+
+    @instrumented("product_service")
+    def get_products_by_category(self, category_name: str) -> list[ProductDTO]:
+        """Retrieve all products of a category."""
+        products = self._get_category_repository().get_products(category_name)
+        return [ProductDTO.from_model(p) for p in products]
+
+    def get_product_categories(self, product_id: int) -> list[str]:
+        """Retrieve the names of the categories a product belongs to."""
+        return self._get_category_repository().get_categories_for_product(product_id)
+
+    def _get_category_repository(self) -> CategoryRepository:
+        if self._category_repository is None:
+            raise ValueError("Category repository is not configured")
+        return self._category_repository
+
+    def _invalidate(self, product_id: int) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(product_id)
+        if self._single_flight is not None:
+            self._single_flight.forget(product_id)
@@ -0,0 +1,90 @@
+from typing import Iterable
+from ..models import Money, Order
+from ..models.promotion import (
+    CompiledPromotions,
+    OrderLine,
+    PromotionResult,
+    PromotionRule,
+)
+from ..repositories import CategoryRepository, ProductRepository
+from ..utils.metrics import instrumented
+
+
+class PromotionService:
+    """Manages active promotion rules and evaluates them against orders.
+
+    Rules are compiled into an index on first use after any change, so adding
+    or removing many rules in a row costs a single compilation.
+    """
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        category_repository: CategoryRepository | None = None
+    ):
+        self._product_repository = product_repository
+        self._category_repository = category_repository
+        self._rules: dict[str, PromotionRule] = {}
+        self._compiled: CompiledPromotions | None = None
+
+    def add_rule(self, rule: PromotionRule) -> None:
+        """Add a new promotion rule."""
+        if rule.rule_id in self._rules:
+            raise ValueError(f"Promotion rule {rule.rule_id} already exists")
+        self._rules[rule.rule_id] = rule
+        self._compiled = None
+
+    def remove_rule(self, rule_id: str) -> None:
+        """Remove a promotion rule."""
+        if rule_id not in self._rules:
+            raise ValueError(f"Promotion rule {rule_id} not found")
+        del self._rules[rule_id]
+        self._compiled = None
+
+    def get_rules(self) -> list[PromotionRule]:
+        """Retrieve all active promotion rules."""
+        return list(self._rules.values())
+
+    def compile(self) -> CompiledPromotions:
+        """Return the compiled rule index, rebuilding it if rules changed."""
+        if self._compiled is None:
+            self._compiled = CompiledPromotions(self._rules.values())
+        return self._compiled
+
+    @instrumented("promotion_service")
+    def evaluate_items(self, items: list[tuple[int, int]]) -> PromotionResult:
+        """Evaluate promotions for (product_id, quantity) pairs."""
+        return self.compile().evaluate(self._lines_from_items(items))
+
+    @instrumented("promotion_service")
+    def evaluate_order(self, order: Order) -> PromotionResult:
+        """Evaluate promotions for an order model."""
+        return self.compile().evaluate(self._lines_from_order(order))
+
+    @instrumented("promotion_service")
+    def evaluate_batch(self, orders: Iterable[Order]) -> list[PromotionResult]:
+        """Evaluate promotions for many orders with one compiled index."""
+        lines_from_order = self._lines_from_order
+        return self.compile().evaluate_batch(lines_from_order(order) for order in orders)
+
+    def _lines_from_items(self, items: list[tuple[int, int]]) -> list[OrderLine]:
+        lines = []
+        for product_id, quantity in items:
+            product = self._product_repository.get_by_id(product_id)
+            if not product:
+                raise ValueError(f"Product with id {product_id} not found")
+            lines.append(self._make_line(product_id, product.price, quantity))
+        return lines
+
+    def _lines_from_order(self, order: Order) -> list[OrderLine]:
+        return [
+            self._make_line(item.product.product_id, item.product.price, item.quantity)
+            for item in order.items
+        ]
+
+    def _make_line(self, product_id: int, price: float, quantity: int) -> OrderLine:
+        categories = (
+            tuple(self._category_repository.get_categories_for_product(product_id))
+            if self._category_repository is not None else ()
+        )
+        return OrderLine(product_id, Money.from_amount(price), quantity, categories)
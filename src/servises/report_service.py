@@ -0,0 +1,224 @@
+import marshal
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+from ..enum import OrderStatus
+from ..models import Money, Order, PercentageDiscount, FixedDiscount
+from ..models.delivery import Delivery
+from ..models.money import to_cents
+from ..repositories import OrderRepository
+from ..utils.metrics import instrumented
+
+_STATUSES = list(OrderStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_CANCELLED = _STATUS_CODES[OrderStatus.CANCELLED]
+
+# Discount kinds in the compact payload
+_NO_DISCOUNT, _PERCENT, _FIXED, _PRECOMPUTED = range(4)
+
+# Orders of the report being generated, inherited by forked workers so only
+# index ranges cross the process boundary
+_forked_orders: list[Order] = []
+_fork_lock = threading.Lock()
+
+
+@dataclass
+class OrderReport:
+    """Aggregated order report; cancelled orders count only in status_counts"""
+    order_count: int = 0
+    total_revenue: float = 0.0
+    customer_spend: dict[int, float] = field(default_factory=dict)
+    product_revenue: dict[int, float] = field(default_factory=dict)
+    status_counts: dict[OrderStatus, int] = field(default_factory=dict)
+
+
+def encode_orders(orders: Iterable[Order]) -> bytes:
+    """Encode orders as a compact marshal payload of plain tuples.
+
+    Each order becomes (customer_id, status_code, discount_kind,
+    discount_value, delivery_cost, [(product_id, unit_price, quantity), ...]).
+    Only raw attributes are read here; cents conversion and pricing of
+    percentage and fixed discounts happen in the worker. Any other discount
+    is priced here and shipped as a precomputed amount.
+    """
+    return marshal.dumps(list(_records(orders)))
+
+
+def _records(orders: Iterable[Order]) -> Iterator[tuple]:
+    for order in orders:
+        discount = order.discount
+        if discount is None:
+            kind, value = _NO_DISCOUNT, 0.0
+        elif type(discount) is PercentageDiscount:
+            kind, value = _PERCENT, discount.percentage
+        elif type(discount) is FixedDiscount:
+            kind, value = _FIXED, discount.fixed_amount
+        else:
+            kind, value = _PRECOMPUTED, order.price_breakdown().discount.amount
+
+        delivery = order.delivery
+        if delivery is None:
+            delivery_cost = 0.0
+        elif type(delivery).quote is Delivery.quote:
+            delivery_cost = delivery.cost()
+        else:
+            delivery_cost = delivery.quote(
+                order.shipping_address, order.total_weight(), order.item_count()
+            )
+
+        yield (
+            order.customer.id,
+            _STATUS_CODES[order.status],
+            kind,
+            value,
+            delivery_cost,
+            [(item.product.product_id, item.product.price, item.quantity)
+             for item in order.items],
+        )
+
+
+def aggregate_payload(payload: bytes) -> tuple[int, int, dict, dict, list]:
+    """Compute partial aggregates (all in cents) for one encoded chunk."""
+    return _aggregate(marshal.loads(payload))
+
+
+def aggregate_orders(orders: Iterable[Order]) -> tuple[int, int, dict, dict, list]:
+    """Compute partial aggregates (all in cents) straight from Order models."""
+    return _aggregate(_records(orders))
+
+
+def _aggregate_forked(start: int, stop: int) -> tuple[int, int, dict, dict, list]:
+    return aggregate_orders(_forked_orders[start:stop])
+
+
+def _aggregate(records: Iterable[tuple]) -> tuple[int, int, dict, dict, list]:
+    order_count = 0
+    revenue = 0
+    customer_spend: dict[int, int] = {}
+    product_revenue: dict[int, int] = {}
+    status_counts = [0] * len(_STATUSES)
+
+    for customer_id, status, kind, value, delivery, lines in records:
+        order_count += 1
+        status_counts[status] += 1
+        if status == _CANCELLED:
+            continue
+
+        subtotal = 0
+        for product_id, unit_price, quantity in lines:
+            line_cents = to_cents(unit_price) * quantity
+            subtotal += line_cents
+            product_revenue[product_id] = product_revenue.get(product_id, 0) + line_cents
+
+        if kind == _PERCENT:
+            discount = Money(subtotal).percent(value).cents
+        elif kind == _FIXED:
+            discount = min(to_cents(value), subtotal)
+        else:
+            discount = to_cents(value)
+
+        total = subtotal - discount + to_cents(delivery)
+        revenue += total
+        customer_spend[customer_id] = customer_spend.get(customer_id, 0) + total
+
+    return order_count, revenue, customer_spend, product_revenue, status_counts
+
+
+class ReportService:
+    """Builds order reports by aggregating repository chunks in a process pool.
+
+    Where fork is available, workers inherit the list of orders and receive
+    only index ranges: reading, pricing and summing each order all happen in
+    the worker, and the partial results are merged here. Elsewhere the main
+    process encodes each chunk into a compact payload for the workers. With
+    one worker everything runs in-process.
+    """
+
+    def __init__(
+        self,
+        order_repository: OrderRepository,
+        workers: int | None = None,
+        chunk_size: int = 50_000
+    ):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self._order_repository = order_repository
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+
+    @instrumented("report_service")
+    def generate(self, workers: int | None = None) -> OrderReport:
+        """Generate the customer spend, product revenue and status report."""
+        workers = workers or self._workers
+        orders = self._order_repository.get_all()
+        ranges = [(start, min(start + self._chunk_size, len(orders)))
+                  for start in range(0, len(orders), self._chunk_size)]
+
+        if workers == 1 or len(ranges) <= 1:
+            return self._merge(aggregate_orders(orders[start:stop]) for start, stop in ranges)
+
+        if 'fork' in multiprocessing.get_all_start_methods():
+            return self._merge(self._aggregate_forked(orders, ranges, workers))
+
+        payloads = (encode_orders(orders[start:stop]) for start, stop in ranges)
+        return self._merge(self._aggregate_in_pool(payloads, workers))
+
+    @staticmethod
+    def _aggregate_forked(orders: list[Order], ranges: list[tuple[int, int]],
+                          workers: int) -> Iterator[tuple]:
+        global _forked_orders
+        with _fork_lock:
+            _forked_orders = orders
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context('fork')
+                ) as executor:
+                    yield from executor.map(_aggregate_forked, *zip(*ranges))
+            finally:
+                _forked_orders = []
+
+    @staticmethod
+    def _aggregate_in_pool(payloads: Iterator[bytes], workers: int) -> Iterator[tuple]:
+        # Keep a bounded number of chunks in flight so encoded payloads
+        # don't pile up in memory while workers are busy
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for payload in payloads:
+                pending.add(executor.submit(aggregate_payload, payload))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in pending:
+                yield future.result()
+
+    @staticmethod
+    def _merge(partials: Iterable[tuple]) -> OrderReport:
+        order_count = 0
+        revenue = 0
+        customer_spend: dict[int, int] = {}
+        product_revenue: dict[int, int] = {}
+        status_counts = [0] * len(_STATUSES)
+
+        for count, part_revenue, part_customers, part_products, part_statuses in partials:
+            order_count += count
+            revenue += part_revenue
+            for customer_id, cents in part_customers.items():
+                customer_spend[customer_id] = customer_spend.get(customer_id, 0) + cents
+            for product_id, cents in part_products.items():
+                product_revenue[product_id] = product_revenue.get(product_id, 0) + cents
+            for code, status_count in enumerate(part_statuses):
+                status_counts[code] += status_count
+
+        return OrderReport(
+            order_count=order_count,
+            total_revenue=Money(revenue).amount,
+            customer_spend={k: Money(v).amount for k, v in customer_spend.items()},
+            product_revenue={k: Money(v).amount for k, v in product_revenue.items()},
+            status_counts={
+                _STATUSES[code]: count for code, count in enumerate(status_counts) if count
+            },
+        )
@@ -1,4 +1,6 @@
 from .data_loader import DataLoader
+from .ids import IdAllocator
+from .metrics import MetricsRegistry, instrumented, metrics
 
 
-__all__ = ['DataLoader']
+__all__ = ['DataLoader', 'IdAllocator', 'MetricsRegistry', 'instrumented', 'metrics']
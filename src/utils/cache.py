@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache:
+    """Thread-safe bounded LRU cache with an optional time-to-live.
+
+    Values are returned as stored, so only immutable values should be
+    cached. Entries older than `ttl` seconds count as misses.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Cache TTL must be positive")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        # key -> (value, expires_at)
+        self._data: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Bumped by invalidate/clear so a load racing with a write is not cached
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def _expired(self, entry: tuple[Any, float]) -> bool:
+        return self._ttl is not None and self._clock() >= entry[1]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if self._ttl is None or self._clock() < entry[1]:
+                    self._data.move_to_end(key)
+                    self._hits += 1
+                    return entry[0]
+                del self._data[key]
+            self._misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        expires_at = self._clock() + self._ttl if self._ttl is not None else 0.0
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[Hashable], Any]) -> Any:
+        """Return the cached value or call loader(key) and cache a non-None result"""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        generation = self._generation
+        value = loader(key)
+        if value is not None:
+            self.put(key, value, generation)
+        return value
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            self._generation += 1
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             len(self._data), self._maxsize)
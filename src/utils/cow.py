@@ -0,0 +1,121 @@
+from collections.abc import Iterator, Mapping, MutableMapping
+from itertools import chain
+from typing import Generic, TypeVar
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+# Keys whose hashes share the bits above CHUNK_BITS live in one chunk, so
+# consecutive integer ids fill a chunk of 1024 before starting the next
+CHUNK_BITS = 10
+
+
+class CopyOnWriteDict(MutableMapping, Generic[K, V]):
+    """A dict whose point-in-time views are cheap to take and to outlive.
+
+    Entries are split into chunks of up to 1024 consecutive integer keys.
+    freeze() copies only the chunk table (n / 1024 references) and hands
+    it out as a read-only view; afterwards the first write to a chunk
+    copies that chunk alone, so no write after a snapshot copies more than
+    1024 entries. Writers must be serialised by the caller (the owning
+    repository holds a lock); reads need no lock. Iteration follows chunk
+    creation order, then insertion order within a chunk.
+    """
+    __slots__ = ('_chunks', '_owned', '_len')
+
+    def __init__(self):
+        self._chunks: dict[int, dict[K, V]] = {}
+        # Chunks written since the last freeze(), not shared with any view
+        self._owned: set[int] = set()
+        self._len = 0
+
+    def __getitem__(self, key: K) -> V:
+        chunk = self._chunks.get(hash(key) >> CHUNK_BITS)
+        if chunk is None:
+            raise KeyError(key)
+        return chunk[key]
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        chunk = self._chunks.get(hash(key) >> CHUNK_BITS)
+        return default if chunk is None else chunk.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        chunk = self._chunks.get(hash(key) >> CHUNK_BITS)
+        return chunk is not None and key in chunk
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.keys())
+
+    def keys(self) -> list[K]:
+        return [key for chunk in list(self._chunks.values()) for key in list(chunk)]
+
+    def values(self) -> list[V]:
+        # Copies, so a concurrent writer cannot break the caller's iteration
+        return [value for chunk in list(self._chunks.values()) for value in list(chunk.values())]
+
+    def items(self) -> list[tuple[K, V]]:
+        return [item for chunk in list(self._chunks.values()) for item in list(chunk.items())]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        chunk = self._writable(hash(key) >> CHUNK_BITS)
+        if key not in chunk:
+            self._len += 1
+        chunk[key] = value
+
+    def __delitem__(self, key: K) -> None:
+        index = hash(key) >> CHUNK_BITS
+        if key not in self._chunks.get(index, ()):
+            raise KeyError(key)
+        chunk = self._writable(index)
+        del chunk[key]
+        self._len -= 1
+        if not chunk:
+            del self._chunks[index]
+            self._owned.discard(index)
+
+    def freeze(self) -> Mapping[K, V]:
+        """Return a read-only view that later writes will not change."""
+        self._owned = set()
+        return _FrozenChunks(dict(self._chunks), self._len)
+
+    def _writable(self, index: int) -> dict[K, V]:
+        chunk = self._chunks.get(index)
+        if index not in self._owned:
+            # Shared with a frozen view (or new): copy this chunk only
+            chunk = self._chunks[index] = dict(chunk) if chunk is not None else {}
+            self._owned.add(index)
+        return chunk
+
+
+class _FrozenChunks(Mapping, Generic[K, V]):
+    """Read-only view returned by CopyOnWriteDict.freeze()"""
+    __slots__ = ('_chunks', '_len')
+
+    def __init__(self, chunks: dict[int, dict[K, V]], length: int):
+        self._chunks = chunks
+        self._len = length
+
+    def __getitem__(self, key: K) -> V:
+        chunk = self._chunks.get(hash(key) >> CHUNK_BITS)
+        if chunk is None:
+            raise KeyError(key)
+        return chunk[key]
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        chunk = self._chunks.get(hash(key) >> CHUNK_BITS)
+        return default if chunk is None else chunk.get(key, default)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[K]:
+        return chain.from_iterable(self._chunks.values())
+
+    def values(self) -> Iterator[V]:
+        return chain.from_iterable(chunk.values() for chunk in self._chunks.values())
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        return chain.from_iterable(chunk.items() for chunk in self._chunks.values())
@@ -1,6 +1,83 @@
+import bz2
+import gzip
 import json
+import lzma
+import os
+import sys
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+from .metrics import instrumented
+
+# Detected from the first bytes, so the file name suffix doesn't matter
+_COMPRESSED = (
+    (b'\x1f\x8b', gzip.open),
+    (b'BZh', bz2.open),
+    (b'\xfd7zXZ\x00', lzma.open),
+)
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+_DATA_SUFFIXES = ('.json', '.jsonl')
+
+
+def open_data(path: str | Path) -> BinaryIO:
+    """Open a data file for reading, decompressing gzip, bz2 or xz on the fly"""
+    with open(path, 'rb') as f:
+        head = f.read(6)
+    for magic, opener in _COMPRESSED:
+        if head.startswith(magic):
+            return opener(path, 'rb')
+    if head.startswith(_ZSTD_MAGIC):
+        raise ValueError(f"Zstandard compression is not supported: {path}")
+    return open(path, 'rb')
+
+
+def is_json_lines(path: str | Path) -> bool:
+    """True for one-record-per-line files such as data.jsonl or data.jsonl.gz"""
+    return '.jsonl' in Path(path).suffixes
+
+
+def parse_file(path: str | Path) -> Any:
+    """Parse a (possibly compressed) JSON or JSON Lines file"""
+    if is_json_lines(path):
+        return list(iter_json_lines(path))
+    with open_data(path) as f:
+        # Decompressed bytes go straight to the parser, no temporary file
+        return json.loads(f.read())
+
+
+def iter_json_lines(path: str | Path) -> Iterator[Any]:
+    """Stream records from a (possibly compressed) JSON Lines file"""
+    with open_data(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def intern_customer(record: Any) -> Any:
+    """Intern the address city and country strings of a raw customer record in place
+
+    Malformed records are left as they are for validation to report
+    """
+    if isinstance(record, dict):
+        addresses = record.get('addresses')
+        if isinstance(addresses, list):
+            for address in addresses:
+                if isinstance(address, dict):
+                    for key in ('city', 'country'):
+                        value = address.get(key)
+                        if type(value) is str:
+                            address[key] = sys.intern(value)
+    return record
+
+
+def _read_file(path: Path, transform: Callable[[Any], Any] | None = None) -> Any:
+    """Parse one data file; runs in a worker process during parallel loads"""
+    data = parse_file(path)
+    return transform(data) if transform is not None else data
 
 
 class DataLoader:
@@ -16,12 +93,27 @@ class DataLoader:
         if not self.data_dir.exists():
             raise FileNotFoundError(f"Data directory not found: {self.data_dir}")
 
+    def _path(self, filename: str) -> Path:
+        if not any(suffix in _DATA_SUFFIXES for suffix in Path(filename).suffixes):
+            filename = f"{filename}.json"
+
+        file_path = self.data_dir / filename
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"Data file not found: {file_path}")
+        return file_path
+
+    @instrumented("data_loader")
     def load_json(self, filename: str) -> Any:
         """
         Load data from JSON file
 
+        gzip, bz2 and xz files are decompressed while reading, and JSON
+        Lines files (.jsonl) are returned as a list of records.
+
         Args:
-            filename: Name of JSON file (with or without .json extension)
+            filename: Name of JSON file, e.g. products, products.json,
+                products.json.gz or products.jsonl.xz
 
         Returns:
             Parsed JSON data
@@ -29,22 +121,79 @@ class DataLoader:
         Raises:
             FileNotFoundError: If file doesn't exist
             json.JSONDecodeError: If file contains invalid JSON
+            ValueError: If the file uses an unsupported compression
         """
-        if not filename.endswith('.json'):
-            filename = f"{filename}.json"
-
-        file_path = self.data_dir / filename
+        return parse_file(self._path(filename))
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"Data file not found: {file_path}")
+    def iter_records(self, filename: str) -> Iterator[Any]:
+        """
+        Stream records from a JSON Lines file, or from a JSON array
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        A .jsonl file is decoded one line at a time, so only the current
+        record is held in memory; a JSON array is parsed whole first.
+        """
+        file_path = self._path(filename)
+        if is_json_lines(file_path):
+            return iter_json_lines(file_path)
+        return iter(parse_file(file_path))
 
     def load_products(self) -> list[dict]:
         """Load products from products.json"""
         return self.load_json('products.json')
 
     def load_customers(self) -> list[dict]:
-        """Load customers from customers.json"""
-        return self.load_json('customers.json')
+        """Load customers from customers.json, sharing repeated cities and countries"""
+        customers = self.load_json('customers.json')
+        if isinstance(customers, list):
+            for record in customers:
+                intern_customer(record)
+        return customers
+
+    def find_files(self, pattern: str) -> list[Path]:
+        """Files in data_dir matching a glob pattern, sorted by name"""
+        return sorted(path for path in self.data_dir.glob(pattern) if path.is_file())
+
+    def load_files(
+        self,
+        pattern: str,
+        workers: int | None = None,
+        transform: Callable[[Any], Any] | None = None
+    ) -> Iterator[tuple[Path, Any]]:
+        """
+        Parse all files matching a glob pattern, e.g. 'products-*.json'
+
+        Files are parsed in a pool of worker processes and yielded as
+        (path, data) in file name order as soon as each is ready; at most
+        two files per worker are parsed ahead of the consumer. transform, a
+        picklable callable, is applied to the parsed data inside the worker.
+
+        Args:
+            pattern: Glob pattern relative to data_dir
+            workers: Number of processes (default: CPU count); 1 parses in-process
+            transform: Optional function applied to each file's data
+
+        Yields:
+            (path, data) tuples
+        """
+        paths = self.find_files(pattern)
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        read = partial(_read_file, transform=transform)
+        if workers <= 1:
+            for path in paths:
+                yield path, read(path)
+            return
+
+        queue = deque(paths)
+        pending: deque = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            try:
+                while pending or queue:
+                    while queue and len(pending) < 2 * workers:
+                        path = queue.popleft()
+                        pending.append((path, executor.submit(read, path)))
+                    path, future = pending.popleft()
+                    yield path, future.result()
+            finally:
+                # The consumer may stop early; don't parse what nobody reads
+                for _, future in pending:
+                    future.cancel()
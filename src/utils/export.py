@@ -0,0 +1,272 @@
+import csv
+import json
+import mmap
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ..enum import OrderStatus
+from ..models import Order
+from .serialization import pack, unpack
+
+ORDER_COLUMNS = (
+    'order_id', 'created_at', 'customer_id', 'customer_name', 'status', 'item_count',
+    'subtotal', 'discount', 'delivery', 'total', 'payment_method',
+)
+LINE_COLUMNS = (
+    'order_id', 'line', 'product_id', 'product_name', 'quantity', 'unit_price', 'line_total',
+)
+
+FORMATS = ('csv', 'jsonl', 'columnar')
+PARTITIONS = ('status', 'date')
+
+# Columnar files start with this marker, then a header value, then chunks;
+# each chunk is a list of columns, plain or dictionary-encoded
+COLUMNAR_MAGIC = b'ORDCOL1\n'
+
+
+@dataclass
+class ExportReport:
+    """What an export wrote"""
+    orders: int = 0
+    lines: int = 0
+    files: list[Path] = field(default_factory=list)
+
+
+def order_rows(order: Order, status: OrderStatus) -> tuple[tuple, list[tuple]]:
+    """Flatten an order into one ORDER_COLUMNS row and its LINE_COLUMNS rows"""
+    prices = order.price_breakdown()
+    created_at = datetime.fromtimestamp(order.created_at, timezone.utc).isoformat()
+    order_id = order.order_id
+    lines = []
+    item_count = 0
+    for number, item in enumerate(order.items, 1):
+        product = item.product
+        item_count += item.quantity
+        lines.append((
+            order_id, number, product.product_id, product.name, item.quantity,
+            product.price, item.get_total_price(),
+        ))
+    row = (
+        order_id, created_at, order.customer.id, order.customer.name, status.value,
+        item_count, prices.subtotal.amount, prices.discount.amount,
+        prices.delivery.amount, prices.total.amount,
+        str(order.payment) if order.payment is not None else None,
+    )
+    return row, lines
+
+
+class _CsvSink:
+    def __init__(self, path: Path, columns: tuple[str, ...], buffer_size: int, append: bool):
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', newline='',
+                          buffering=buffer_size)
+        self._writer = csv.writer(self._file)
+        if not append:
+            self._writer.writerow(columns)
+
+    def write(self, rows: list[tuple]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _JsonLinesSink:
+    def __init__(self, path: Path, columns: tuple[str, ...], buffer_size: int, append: bool):
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', buffering=buffer_size)
+        self._columns = columns
+        self._dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+    def write(self, rows: list[tuple]) -> None:
+        columns, dumps = self._columns, self._dumps
+        self._file.write(''.join(dumps(dict(zip(columns, row))) + '\n' for row in rows))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ColumnarSink:
+    """Rows are buffered into chunks that are written column by column"""
+
+    def __init__(
+        self,
+        path: Path,
+        columns: tuple[str, ...],
+        buffer_size: int,
+        append: bool,
+        chunk_rows: int
+    ):
+        self._file = open(path, 'ab' if append else 'wb', buffering=buffer_size)
+        self._columns = columns
+        self._chunk_rows = chunk_rows
+        self._rows: list[tuple] = []
+        if not append:
+            out = bytearray(COLUMNAR_MAGIC)
+            pack({'columns': list(columns)}, out)
+            self._file.write(out)
+
+    def write(self, rows: list[tuple]) -> None:
+        self._rows.extend(rows)
+        if len(self._rows) >= self._chunk_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        out = bytearray()
+        pack([_encode_column(column) for column in zip(*self._rows)], out)
+        self._file.write(out)
+        self._rows.clear()
+
+    def close(self) -> None:
+        self._flush()
+        self._file.close()
+
+
+def _encode_column(values: tuple) -> list | dict:
+    """Dictionary-encode a column chunk when its values repeat a lot"""
+    distinct = dict.fromkeys(values)
+    if len(distinct) * 2 > len(values):
+        return list(values)
+    codes = {value: code for code, value in enumerate(distinct)}
+    return {'dictionary': list(distinct), 'indices': [codes[value] for value in values]}
+
+
+def _decode_column(column: list | dict) -> list:
+    if isinstance(column, dict):
+        dictionary = column['dictionary']
+        return [dictionary[index] for index in column['indices']]
+    return column
+
+
+def read_columnar(path: str | Path) -> Iterator[dict[str, list]]:
+    """Yield the chunks of a columnar export as {column: values}"""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if data[:len(COLUMNAR_MAGIC)] != COLUMNAR_MAGIC:
+            raise ValueError(f"Not a columnar export: {path}")
+        header, position = unpack(data, len(COLUMNAR_MAGIC))
+        columns = header['columns']
+        while position < len(data):
+            chunk, position = unpack(data, position)
+            yield dict(zip(columns, map(_decode_column, chunk)))
+
+
+class OrderExporter:
+    """Streams orders and order lines into CSV, JSON Lines or columnar files.
+
+    Every partition gets an orders file and an order_lines file, written
+    through large buffers as orders arrive, so memory use does not grow
+    with the number of orders. With partition_by='status' or 'date' (UTC
+    creation date) the files go to status=<status>/ or date=<YYYY-MM-DD>/
+    subdirectories. At most max_open_partitions partitions keep their files
+    open; the least recently used one is flushed and closed, and reopened
+    for appending when more of its orders arrive.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        format: str = 'csv',
+        partition_by: str | None = None,
+        chunk_rows: int = 10_000,
+        buffer_size: int = 1024 * 1024,
+        max_open_partitions: int = 16
+    ):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown export format: {format}")
+        if partition_by is not None and partition_by not in PARTITIONS:
+            raise ValueError(f"Unknown partition: {partition_by}")
+        if chunk_rows <= 0:
+            raise ValueError("Chunk size must be positive")
+        if max_open_partitions <= 0:
+            raise ValueError("Open partition limit must be positive")
+        self.directory = Path(directory)
+        self.format = format
+        self.partition_by = partition_by
+        self.chunk_rows = chunk_rows
+        self.buffer_size = buffer_size
+        self.max_open_partitions = max_open_partitions
+
+    def export(self, orders: Iterable[tuple[Order, OrderStatus]]) -> ExportReport:
+        """Write (order, status) pairs and report the counts and files"""
+        report = ExportReport()
+        # partition -> (sinks, pending batch), least recently used first
+        open_partitions: OrderedDict[str, tuple[tuple[Any, Any], tuple[list, list]]] = OrderedDict()
+        started: set[str] = set()
+        try:
+            for order, status in orders:
+                row, lines = order_rows(order, status)
+                key = self._partition(order, status)
+                entry = open_partitions.get(key)
+                if entry is None:
+                    if len(open_partitions) >= self.max_open_partitions:
+                        self._close(*open_partitions.popitem(last=False)[1])
+                    entry = open_partitions[key] = (
+                        self._open(key, report, append=key in started), ([], [])
+                    )
+                    started.add(key)
+                else:
+                    open_partitions.move_to_end(key)
+                sinks, batch = entry
+                batch[0].append(row)
+                batch[1].extend(lines)
+                report.orders += 1
+                report.lines += len(lines)
+                if len(batch[0]) >= self.chunk_rows:
+                    self._write(sinks, batch)
+            while open_partitions:
+                self._close(*open_partitions.popitem(last=False)[1])
+        finally:
+            for sinks, _ in open_partitions.values():
+                for sink in sinks:
+                    sink.close()
+        return report
+
+    def _partition(self, order: Order, status: OrderStatus) -> str:
+        if self.partition_by == 'status':
+            return f"status={status.value}"
+        if self.partition_by == 'date':
+            return f"date={datetime.fromtimestamp(order.created_at, timezone.utc).date()}"
+        return ''
+
+    def _open(self, key: str, report: ExportReport, append: bool) -> tuple[Any, Any]:
+        directory = self.directory / key if key else self.directory
+        directory.mkdir(parents=True, exist_ok=True)
+        suffix = {'csv': '.csv', 'jsonl': '.jsonl', 'columnar': '.col'}[self.format]
+        sinks = []
+        try:
+            for name, columns in (('orders', ORDER_COLUMNS), ('order_lines', LINE_COLUMNS)):
+                path = directory / f"{name}{suffix}"
+                if self.format == 'csv':
+                    sinks.append(_CsvSink(path, columns, self.buffer_size, append))
+                elif self.format == 'jsonl':
+                    sinks.append(_JsonLinesSink(path, columns, self.buffer_size, append))
+                else:
+                    sinks.append(_ColumnarSink(
+                        path, columns, self.buffer_size, append, self.chunk_rows
+                    ))
+                if not append:
+                    report.files.append(path)
+        except BaseException:
+            for sink in sinks:
+                sink.close()
+            raise
+        return sinks[0], sinks[1]
+
+    @classmethod
+    def _close(cls, sinks: tuple[Any, Any], batch: tuple[list, list]) -> None:
+        try:
+            cls._write(sinks, batch)
+        finally:
+            sinks[0].close()
+            sinks[1].close()
+
+    @staticmethod
+    def _write(sinks: tuple[Any, Any], batch: tuple[list, list]) -> None:
+        sinks[0].write(batch[0])
+        sinks[1].write(batch[1])
+        batch[0].clear()
+        batch[1].clear()
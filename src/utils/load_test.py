@@ -0,0 +1,353 @@
+import asyncio
+import contextlib
+import io
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from ..schemas import (
+    CreditCardPaymentDTO,
+    OrderCreateDTO,
+    PercentageDiscountDTO,
+    ProductDTO,
+    StandardDeliveryDTO,
+)
+from .metrics import Histogram
+from .synthetic import SyntheticDataGenerator
+
+OPERATIONS = ('browse', 'add_to_cart', 'place_order', 'cancel_order')
+
+
+@dataclass
+class LoadProfile:
+    """Shape of a load test.
+
+    With `arrival_rate` set the test is open-loop: shopper sessions start
+    on a Poisson schedule and latency is measured from the scheduled start,
+    so queueing delay is included. Without it every client runs sessions
+    back to back (closed loop).
+    """
+    clients: int = 8
+    duration: float = 10.0
+    arrival_rate: float | None = None
+    browse_views: int = 3
+    max_cart_lines: int = 4
+    cancel_ratio: float = 0.1
+    products: int = 1_000
+    customers: int = 1_000
+    seed: int = 42
+
+
+@dataclass
+class OperationStats:
+    count: int = 0
+    errors: int = 0
+    latency: Histogram = field(default_factory=Histogram)
+
+
+class LoadRecorder:
+    """Thread-safe collection of per-operation latencies and errors"""
+
+    def __init__(self):
+        self.stats = {name: OperationStats() for name in OPERATIONS + ('session',)}
+        self.sessions = 0
+        self.errors: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, seconds: float, error: Exception | None = None) -> None:
+        stats = self.stats[operation]
+        stats.latency.observe(seconds)
+        with self._lock:
+            stats.count += 1
+            if error is not None:
+                stats.errors += 1
+                key = f"{operation}: {type(error).__name__}"
+                self.errors[key] = self.errors.get(key, 0) + 1
+
+    def add_session(self, seconds: float) -> None:
+        """Record one finished shopper session"""
+        self.record('session', seconds)
+        with self._lock:
+            self.sessions += 1
+
+    def export(self) -> dict:
+        """Plain-data copy of the recorder that can cross a process boundary"""
+        return {
+            'stats': {name: (stats.count, stats.errors, stats.latency.samples())
+                      for name, stats in self.stats.items()},
+            'sessions': self.sessions,
+            'errors': dict(self.errors),
+        }
+
+    def merge(self, exported: dict) -> None:
+        for name, (count, errors, samples) in exported['stats'].items():
+            target = self.stats[name]
+            target.count += count
+            target.errors += errors
+            for sample in samples:
+                target.latency.observe(sample)
+        self.sessions += exported['sessions']
+        for key, count in exported['errors'].items():
+            self.errors[key] = self.errors.get(key, 0) + count
+
+
+@dataclass
+class LoadReport:
+    mode: str
+    profile: LoadProfile
+    elapsed: float
+    recorder: LoadRecorder
+
+    @property
+    def orders_per_second(self) -> float:
+        placed = self.recorder.stats['place_order']
+        return (placed.count - placed.errors) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        total = sum(s.count for s in self.recorder.stats.values())
+        errors = sum(s.errors for s in self.recorder.stats.values())
+        return errors / total if total else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"mode={self.mode} clients={self.profile.clients} "
+            f"arrival_rate={self.profile.arrival_rate or 'closed-loop'} "
+            f"elapsed={self.elapsed:.1f}s sessions={self.recorder.sessions}",
+            f"{'operation':<14}{'count':>9}{'ops/s':>10}{'errors':>8}"
+            f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}",
+        ]
+        for name, stats in self.recorder.stats.items():
+            summary = stats.latency.summary()
+            lines.append(
+                f"{name:<14}{stats.count:>9}{stats.count / self.elapsed:>10.0f}{stats.errors:>8}"
+                f"{summary['p50'] * 1e3:>9.2f}{summary['p95'] * 1e3:>9.2f}"
+                f"{summary['p99'] * 1e3:>9.2f}{summary['max'] * 1e3:>9.2f}"
+            )
+        lines.append(f"orders/s={self.orders_per_second:.0f} error rate={self.error_rate:.2%}")
+        for key, count in sorted(self.recorder.errors.items()):
+            lines.append(f"  {key}: {count}")
+        return "\n".join(lines)
+
+
+def build_app(profile: LoadProfile):
+    """Create an ApplicationService filled with synthetic products and customers"""
+    from ..schemas import AddressDTO, CustomerDTO
+    from ..servises import ApplicationService
+
+    app = ApplicationService()
+    generator = SyntheticDataGenerator(profile.seed)
+    for record in generator.products(profile.products):
+        app.product_service.create_product(ProductDTO(**record))
+    for record in generator.customers(profile.customers):
+        app.customer_service.create_customer(CustomerDTO(
+            id=record['id'], name=record['name'], email=record['email'],
+            addresses=[AddressDTO(**address) for address in record['addresses']],
+        ))
+    return app
+
+
+def _timed(recorder: LoadRecorder, operation: str, func, *args):
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    except Exception as error:
+        recorder.record(operation, time.perf_counter() - start, error)
+        return None
+    recorder.record(operation, time.perf_counter() - start)
+    return result
+
+
+async def _timed_async(recorder: LoadRecorder, operation: str, func, *args):
+    start = time.perf_counter()
+    try:
+        result = await func(*args)
+    except Exception as error:
+        recorder.record(operation, time.perf_counter() - start, error)
+        return None
+    recorder.record(operation, time.perf_counter() - start)
+    return result
+
+
+def _order_for(cart, profile: LoadProfile, rng: random.Random) -> OrderCreateDTO:
+    return OrderCreateDTO(
+        customer_id=rng.randint(1, profile.customers),
+        items=[(item.product.product_id, item.quantity) for item in cart.get_items()],
+        discount=PercentageDiscountDTO(value=5.0),
+        delivery=StandardDeliveryDTO(),
+        payment=CreditCardPaymentDTO(details="4111-1111-1111-1111"),
+    )
+
+
+def run_session(app, profile: LoadProfile, rng: random.Random, recorder: LoadRecorder,
+                scheduled_at: float | None = None) -> None:
+    """One shopper: browse, fill a cart, place an order and maybe cancel it"""
+    start = scheduled_at if scheduled_at is not None else time.perf_counter()
+
+    for _ in range(profile.browse_views):
+        _timed(recorder, 'browse', app.product_service.get_product,
+               rng.randint(1, profile.products))
+
+    cart = app.new_cart()
+    for _ in range(rng.randint(1, profile.max_cart_lines)):
+        _timed(recorder, 'add_to_cart', cart.add_item,
+               rng.randint(1, profile.products), rng.randint(1, 3))
+
+    order = _timed(recorder, 'place_order', app.order_service.create_order,
+                   _order_for(cart, profile, rng))
+
+    if order is not None and rng.random() < profile.cancel_ratio:
+        _timed(recorder, 'cancel_order', app.order_service.cancel_order, order.order_id)
+
+    recorder.add_session(time.perf_counter() - start)
+
+
+async def run_session_async(service, profile: LoadProfile, rng: random.Random,
+                            recorder: LoadRecorder, scheduled_at: float | None = None) -> None:
+    """The same shopper session, through an AsyncApplicationService"""
+    start = scheduled_at if scheduled_at is not None else time.perf_counter()
+
+    for _ in range(profile.browse_views):
+        await _timed_async(recorder, 'browse', service.get_product,
+                           rng.randint(1, profile.products))
+
+    cart = service.new_cart()
+    for _ in range(rng.randint(1, profile.max_cart_lines)):
+        _timed(recorder, 'add_to_cart', cart.add_item,
+               rng.randint(1, profile.products), rng.randint(1, 3))
+
+    order = await _timed_async(recorder, 'place_order', service.create_order,
+                               _order_for(cart, profile, rng))
+
+    if order is not None and rng.random() < profile.cancel_ratio:
+        await _timed_async(recorder, 'cancel_order', service.cancel_order, order.order_id)
+
+    recorder.add_session(time.perf_counter() - start)
+
+
+def _arrivals(profile: LoadProfile, rng: random.Random) -> list[float]:
+    """Poisson arrival offsets (seconds from start) over the test duration"""
+    offsets = []
+    offset = rng.expovariate(profile.arrival_rate)
+    while offset < profile.duration:
+        offsets.append(offset)
+        offset += rng.expovariate(profile.arrival_rate)
+    return offsets
+
+
+def run_threads(app, profile: LoadProfile) -> LoadReport:
+    """Drive the application from a pool of client threads"""
+    recorder = LoadRecorder()
+    started = time.perf_counter()
+
+    if profile.arrival_rate:
+        rng = random.Random(profile.seed)
+        local = threading.local()
+
+        def scheduled(at: float) -> None:
+            if not hasattr(local, 'rng'):
+                local.rng = random.Random(f"{profile.seed}-{threading.get_ident()}")
+            run_session(app, profile, local.rng, recorder, at)
+
+        with ThreadPoolExecutor(max_workers=profile.clients) as executor:
+            for offset in _arrivals(profile, rng):
+                at = started + offset
+                delay = at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(scheduled, at)
+    else:
+        deadline = started + profile.duration
+
+        def client(index: int) -> None:
+            rng = random.Random(f"{profile.seed}-{index}")
+            while time.perf_counter() < deadline:
+                run_session(app, profile, rng, recorder)
+
+        with ThreadPoolExecutor(max_workers=profile.clients) as executor:
+            list(executor.map(client, range(profile.clients)))
+
+    return LoadReport('threads', profile, time.perf_counter() - started, recorder)
+
+
+def run_asyncio(app, profile: LoadProfile) -> LoadReport:
+    """Drive the application from asyncio tasks through AsyncApplicationService.
+
+    Each client is a task; orders are placed on the facade's thread pool,
+    so sessions overlap while payments are processed.
+    """
+    from ..servises import AsyncApplicationService
+
+    recorder = LoadRecorder()
+
+    async def main() -> float:
+        async with AsyncApplicationService(app) as service:
+            return await drive(service)
+
+    async def drive(service) -> float:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        perf_started = time.perf_counter()
+        deadline = started + profile.duration
+
+        async def client(index: int) -> None:
+            rng = random.Random(f"{profile.seed}-{index}")
+            while loop.time() < deadline:
+                await run_session_async(service, profile, rng, recorder)
+
+        async def scheduled(offset: float, rng: random.Random) -> None:
+            await asyncio.sleep(max(0.0, started + offset - loop.time()))
+            await run_session_async(service, profile, rng, recorder, perf_started + offset)
+
+        if profile.arrival_rate:
+            rng = random.Random(profile.seed)
+            await asyncio.gather(*(scheduled(offset, random.Random(f"{profile.seed}-{i}"))
+                                   for i, offset in enumerate(_arrivals(profile, rng))))
+        else:
+            await asyncio.gather(*(client(i) for i in range(profile.clients)))
+        return time.perf_counter() - perf_started
+
+    elapsed = asyncio.run(main())
+    return LoadReport('asyncio', profile, elapsed, recorder)
+
+
+def _process_client(profile: LoadProfile, index: int) -> dict:
+    single = LoadProfile(**{**profile.__dict__, 'clients': 1,
+                            'seed': profile.seed + index,
+                            'arrival_rate': (profile.arrival_rate / profile.clients
+                                             if profile.arrival_rate else None)})
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = run_threads(build_app(single), single)
+    return {**report.recorder.export(), 'elapsed': report.elapsed}
+
+
+def run_processes(profile: LoadProfile) -> LoadReport:
+    """One client per process, each with its own application instance.
+
+    Processes share no state, so this measures how many independent
+    single-node instances the host sustains in parallel.
+    """
+    recorder = LoadRecorder()
+    elapsed = 0.0
+    with ProcessPoolExecutor(max_workers=profile.clients) as executor:
+        for partial in executor.map(_process_client, [profile] * profile.clients,
+                                    range(profile.clients)):
+            recorder.merge(partial)
+            elapsed = max(elapsed, partial['elapsed'])
+    return LoadReport('processes', profile, elapsed, recorder)
+
+
+def run_load_test(profile: LoadProfile, mode: str = 'threads') -> LoadReport:
+    """Run a load test in 'threads', 'asyncio' or 'processes' mode"""
+    if mode == 'processes':
+        return run_processes(profile)
+
+    app = build_app(profile)
+    runners = {'threads': run_threads, 'asyncio': run_asyncio}
+    if mode not in runners:
+        raise ValueError(f"Unknown load test mode: {mode}")
+    # Payment models print every transaction
+    with contextlib.redirect_stdout(io.StringIO()):
+        return runners[mode](app, profile)
@@ -0,0 +1,276 @@
+import json
+import random
+import threading
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable
+
+Labels = tuple[tuple[str, str], ...]
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Counter:
+    """Monotonic counter"""
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+
+class Histogram:
+    """Distribution of observed values with a bounded reservoir for quantiles"""
+
+    def __init__(self, max_samples: int = 10_000):
+        self._max_samples = max_samples
+        self._samples: list[float] = []
+        self._count = 0
+        self._sum = 0.0
+        self._min = float('inf')
+        self._max = float('-inf')
+        self._lock = threading.Lock()
+        self._random = random.Random(0)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+            if len(self._samples) < self._max_samples:
+                self._samples.append(value)
+            else:
+                # Reservoir sampling keeps a uniform sample of all observations
+                slot = self._random.randrange(self._count)
+                if slot < self._max_samples:
+                    self._samples[slot] = value
+
+    def samples(self) -> list[float]:
+        """Return a copy of the sampled values"""
+        with self._lock:
+            return list(self._samples)
+
+    def quantile(self, q: float) -> float:
+        """Return the q-quantile (0..1) of the sampled values"""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return 0.0
+        return samples[min(int(q * len(samples)), len(samples) - 1)]
+
+    def summary(self) -> dict[str, float]:
+        """Return count, sum, min, max and p50/p95/p99"""
+        result = {
+            'count': self._count,
+            'sum': self._sum,
+            'min': self._min if self._count else 0.0,
+            'max': self._max if self._count else 0.0,
+        }
+        for q in QUANTILES:
+            result[f"p{int(q * 100)}"] = self.quantile(q)
+        return result
+
+
+class MetricsRegistry:
+    """Holds counters and histograms; instrumentation is enabled per component"""
+
+    def __init__(self):
+        self._counters: dict[tuple[str, Labels], Counter] = {}
+        self._histograms: dict[tuple[str, Labels], Histogram] = {}
+        self._enabled: set[str] = set()
+        self._lock = threading.Lock()
+        # Bumped by reset() so cached metric handles get re-fetched
+        self._generation = 0
+
+    def enable(self, *components: str) -> None:
+        """Enable instrumentation of the given components (e.g. "order_service")"""
+        self._enabled.update(components)
+
+    def disable(self, *components: str) -> None:
+        """Disable instrumentation; without arguments disables everything"""
+        if components:
+            self._enabled.difference_update(components)
+        else:
+            self._enabled.clear()
+
+    def is_enabled(self, component: str) -> bool:
+        return component in self._enabled
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        """Get or create a counter"""
+        key = (name, tuple(sorted(labels.items())))
+        counter = self._counters.get(key)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(key, Counter())
+        return counter
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        """Get or create a histogram"""
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram())
+        return histogram
+
+    def reset(self) -> None:
+        """Drop all collected metrics (enabled components are kept)"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._generation += 1
+
+    def _items(self) -> tuple[list[tuple[tuple[str, Labels], Counter]],
+                              list[tuple[tuple[str, Labels], Histogram]]]:
+        # Copied under the lock: metrics may be created while another thread renders
+        with self._lock:
+            counters, histograms = list(self._counters.items()), list(self._histograms.items())
+        return sorted(counters), sorted(histograms)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all metrics as a JSON-serializable dict"""
+        counters, histograms = self._items()
+        return {
+            'counters': [
+                {'name': name, 'labels': dict(labels), 'value': counter.value}
+                for (name, labels), counter in counters
+            ],
+            'histograms': [
+                {'name': name, 'labels': dict(labels), **histogram.summary()}
+                for (name, labels), histogram in histograms
+            ],
+        }
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines: list[str] = []
+        typed: set[str] = set()
+        counters, histograms = self._items()
+
+        for (name, labels), counter in counters:
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{_format_labels(labels)} {counter.value}")
+
+        for (name, labels), histogram in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE {name} summary")
+                typed.add(name)
+            for q in QUANTILES:
+                quantile_labels = labels + (('quantile', str(q)),)
+                lines.append(
+                    f"{name}{_format_labels(quantile_labels)} {histogram.quantile(q)!r}"
+                )
+            lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum!r}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path) -> None:
+        """Write metrics to a file: Prometheus text for .prom/.txt, JSON otherwise"""
+        path = Path(path)
+        if path.suffix in ('.prom', '.txt'):
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.snapshot(), indent=2)
+        path.write_text(content, encoding='utf-8')
+
+    def serve(self, host: str = '127.0.0.1', port: int = 9100) -> ThreadingHTTPServer:
+        """Serve /metrics in Prometheus format from a daemon thread"""
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.to_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{key}="{value}"' for key, value in labels)
+    return "{" + body + "}"
+
+
+metrics = MetricsRegistry()
+
+
+def instrumented(component: str, registry: MetricsRegistry | None = None) -> Callable:
+    """Record latency (and call count) plus errors of a method when its component is enabled.
+
+    When the component is disabled the wrapper costs one set lookup. The
+    histogram handle is cached per method, so the enabled path does no
+    registry lookups either.
+    """
+    registry = registry or metrics
+    enabled = registry._enabled
+
+    def decorator(func: Callable) -> Callable:
+        method = func.__name__
+        cached: list = [-1, None]
+
+        def latency() -> Histogram:
+            if cached[0] != registry._generation:
+                cached[1] = registry.histogram(
+                    'method_latency_seconds', component=component, method=method
+                )
+                cached[0] = registry._generation
+            return cached[1]
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if component not in enabled:
+                return func(*args, **kwargs)
+
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                registry.counter(
+                    'method_errors_total', component=component, method=method
+                ).inc()
+                raise
+            finally:
+                latency().observe(perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,216 @@
+import ast
+import contextlib
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from ..schemas import AddressDTO, CustomerDTO, ProductDTO
+from .synthetic import SyntheticDataGenerator
+
+SERVICE_MARKER = '/src/servises/'
+# Only functions from these packages are attributed in the reports
+SOURCE_MARKERS = ('/src/servises/', '/src/repositories/', '/src/models/',
+                  '/src/schemas.py', '/src/utils/data_loader.py')
+
+
+@dataclass
+class Workload:
+    """Size of a profiling run; `lines` caps the lines of each order"""
+    customers: int = 1_000
+    orders: int = 10_000
+    lines: int = 3
+    products: int = 500
+    seed: int = 42
+
+
+@dataclass
+class ProfileReport:
+    """Paths and summaries produced by a profiling run"""
+    elapsed: float
+    pstats_path: Path
+    snapshot_path: Path
+    hotspots: str
+    service_methods: str
+    allocations: str
+    service_allocations: str
+
+
+def run_workload(app, workload: Workload) -> None:
+    """Drive products, customers, carts and orders through ApplicationService"""
+    generator = SyntheticDataGenerator(workload.seed)
+
+    for record in generator.products(workload.products):
+        app.product_service.create_product(ProductDTO(**record))
+
+    for record in generator.customers(workload.customers):
+        app.customer_service.create_customer(CustomerDTO(
+            id=record['id'],
+            name=record['name'],
+            email=record['email'],
+            addresses=[AddressDTO(**address) for address in record['addresses']],
+        ))
+
+    orders = generator.orders(workload.orders, workload.customers, workload.products)
+
+    # Payment models print every transaction; keep the profile about the code
+    with contextlib.redirect_stdout(io.StringIO()):
+        for order_dto in orders:
+            cart = app.cart_service
+            for product_id, quantity in order_dto.items[:workload.lines]:
+                cart.add_item(product_id, quantity)
+            cart.get_total()
+            order_dto.items = [
+                (item.product.product_id, item.quantity) for item in cart.get_items()
+            ]
+            order = app.order_service.create_order(order_dto)
+            cart.clear()
+            app.order_service.get_order(order.order_id)
+
+    app.get_statistics()
+
+
+def profile_workload(
+    app,
+    workload: Workload,
+    output_dir: str | Path,
+    top: int = 20
+) -> ProfileReport:
+    """Run the workload under cProfile and tracemalloc and write the results.
+
+    Writes `profile.pstats` (load with pstats or snakeviz) and
+    `allocations.snapshot` (tracemalloc.Snapshot.load) into output_dir.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pstats_path = output_dir / "profile.pstats"
+    snapshot_path = output_dir / "allocations.snapshot"
+
+    profiler = cProfile.Profile()
+    tracemalloc.start(10)
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        run_workload(app, workload)
+    finally:
+        profiler.disable()
+        elapsed = time.perf_counter() - start
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    profiler.dump_stats(pstats_path)
+    snapshot.dump(str(snapshot_path))
+    stats = pstats.Stats(profiler)
+
+    return ProfileReport(
+        elapsed=elapsed,
+        pstats_path=pstats_path,
+        snapshot_path=snapshot_path,
+        hotspots=format_hotspots(stats, top),
+        service_methods=format_service_methods(stats),
+        allocations=format_allocations(snapshot, top),
+        service_allocations=format_service_allocations(snapshot),
+    )
+
+
+def format_hotspots(stats: pstats.Stats, top: int = 20) -> str:
+    """Table of the project functions with the highest cumulative time"""
+    rows: list[tuple[float, float, int, str]] = []
+    raw: dict[Any, tuple] = stats.stats  # type: ignore[attr-defined]
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in raw.items():
+        if _is_project_file(filename):
+            rows.append((cumtime, tottime, calls, f"{_short_path(filename)}:{line}({name})"))
+    rows.sort(reverse=True)
+
+    lines = [f"{'cumtime':>9} {'tottime':>9} {'calls':>9}  function"]
+    for cumtime, tottime, calls, label in rows[:top]:
+        lines.append(f"{cumtime:>9.3f} {tottime:>9.3f} {calls:>9}  {label}")
+    return "\n".join(lines)
+
+
+def format_service_methods(stats: pstats.Stats) -> str:
+    """Per-call timings of every service method that ran"""
+    rows: list[tuple[float, int, str]] = []
+    raw: dict[Any, tuple] = stats.stats  # type: ignore[attr-defined]
+    for (filename, _, name), (_, calls, _, cumtime, _) in raw.items():
+        if SERVICE_MARKER in filename.replace('\\', '/') and not name.startswith('<'):
+            rows.append((cumtime, calls, f"{_short_path(filename)}::{name}"))
+    rows.sort(reverse=True)
+
+    lines = [f"{'cumtime':>9} {'calls':>9} {'us/call':>9}  service method"]
+    for cumtime, calls, label in rows:
+        lines.append(f"{cumtime:>9.3f} {calls:>9} {cumtime / calls * 1e6:>9.1f}  {label}")
+    return "\n".join(lines)
+
+
+def format_allocations(snapshot: tracemalloc.Snapshot, top: int = 20) -> str:
+    """Table of the project source lines holding the most memory"""
+    stats = [
+        stat for stat in snapshot.statistics('lineno')
+        if _is_project_file(stat.traceback[0].filename)
+    ]
+    lines = [f"{'size KiB':>10} {'blocks':>9}  allocation site"]
+    for stat in stats[:top]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"{stat.size / 1024:>10.1f} {stat.count:>9}  "
+            f"{_short_path(frame.filename)}:{frame.lineno}"
+        )
+    return "\n".join(lines)
+
+
+def format_service_allocations(snapshot: tracemalloc.Snapshot) -> str:
+    """Live memory grouped by the service method that allocated it"""
+    totals: dict[str, list[int]] = {}
+    for stat in snapshot.statistics('traceback'):
+        for frame in stat.traceback:
+            filename = frame.filename.replace('\\', '/')
+            if SERVICE_MARKER in filename:
+                key = f"{_short_path(filename)}::{_function_at(filename, frame.lineno)}"
+                entry = totals.setdefault(key, [0, 0])
+                entry[0] += stat.size
+                entry[1] += stat.count
+                break
+
+    lines = [f"{'size KiB':>10} {'blocks':>9}  service method"]
+    for key, (size, count) in sorted(totals.items(), key=lambda item: -item[1][0]):
+        lines.append(f"{size / 1024:>10.1f} {count:>9}  {key}")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _function_ranges(filename: str) -> list[tuple[int, int, str]]:
+    try:
+        tree = ast.parse(Path(filename).read_text(encoding='utf-8'))
+    except (OSError, SyntaxError):
+        return []
+    return [
+        (node.lineno, node.end_lineno or node.lineno, node.name)
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+
+
+def _function_at(filename: str, lineno: int) -> str:
+    """Name of the innermost function containing the line"""
+    best = None
+    for start, end, name in _function_ranges(filename):
+        if start <= lineno <= end and (best is None or start > best[0]):
+            best = (start, name)
+    return best[1] if best else '<module>'
+
+
+def _is_project_file(filename: str) -> bool:
+    normalized = filename.replace('\\', '/')
+    return any(marker in normalized for marker in SOURCE_MARKERS)
+
+
+def _short_path(filename: str) -> str:
+    normalized = filename.replace('\\', '/')
+    index = normalized.rfind('/src/')
+    return normalized[index + 1:] if index >= 0 else normalized
@@ -0,0 +1,335 @@
+import dataclasses
+import json
+import struct
+import types
+import typing
+from collections.abc import Iterable, Iterator
+from enum import Enum
+from functools import cache
+from typing import Any, Generic, TypeVar
+
+from ..models import Payment
+
+T = TypeVar('T')
+
+_JSON_SEPARATORS = (',', ':')
+
+
+class Codec(Generic[T]):
+    """Encoder/decoder for one DTO class, compiled once from its fields.
+
+    The dict form (used for JSON) keys values by field name; the row form
+    (used for the binary format) is a list in field order, so the binary
+    encoding carries no field names at all. Nested DTOs, lists/tuples of
+    DTOs and enums are handled by generated code, and Payment objects are
+    written as their method name (decoding gives that name back as a str).
+    """
+
+    def __init__(self, dto_type: type[T]):
+        self.dto_type = dto_type
+        self.field_names = tuple(f.name for f in dataclasses.fields(dto_type))
+        self.to_dict, self.from_dict, self.to_row, self.from_row = _compile(dto_type)
+
+    def dumps_json(self, dto: T) -> str:
+        return json.dumps(self.to_dict(dto), separators=_JSON_SEPARATORS, ensure_ascii=False)
+
+    def loads_json(self, text: str | bytes) -> T:
+        return self.from_dict(json.loads(text))
+
+    def dumps_binary(self, dto: T) -> bytes:
+        out = bytearray()
+        pack(self.to_row(dto), out)
+        return bytes(out)
+
+    def loads_binary(self, data: bytes) -> T:
+        row, _ = unpack(data, 0)
+        return self.from_row(row)
+
+    def iter_json(self, dtos: Iterable[T]) -> Iterator[str]:
+        """Encode DTOs as one JSON array, yielding it piece by piece"""
+        dumps = json.JSONEncoder(separators=_JSON_SEPARATORS, ensure_ascii=False).encode
+        to_dict = self.to_dict
+        separator = '['
+        for dto in dtos:
+            yield separator + dumps(to_dict(dto))
+            separator = ','
+        yield '[]' if separator == '[' else ']'
+
+    def iter_binary(self, dtos: Iterable[T], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Encode DTOs as a stream of concatenated binary values"""
+        to_row = self.to_row
+        out = bytearray()
+        for dto in dtos:
+            pack(to_row(dto), out)
+            if len(out) >= chunk_size:
+                yield bytes(out)
+                out.clear()
+        if out:
+            yield bytes(out)
+
+    def iter_load_binary(self, data: bytes) -> Iterator[T]:
+        """Decode a stream produced by iter_binary"""
+        from_row = self.from_row
+        view = memoryview(data)
+        position = 0
+        while position < len(view):
+            row, position = unpack(view, position)
+            yield from_row(row)
+
+
+@cache
+def codec_for(dto_type: type[T]) -> Codec[T]:
+    """Return the compiled codec for a DTO class"""
+    return Codec(dto_type)
+
+
+def _payment_name(payment: Payment | str | None) -> str | None:
+    return None if payment is None else str(payment)
+
+
+def _compile(dto_type: type) -> tuple:
+    """Generate to_dict/from_dict/to_row/from_row source for a dataclass"""
+    hints = typing.get_type_hints(dto_type)
+    namespace: dict[str, Any] = {'_cls': dto_type, '_payment_name': _payment_name}
+    to_dict, from_dict, to_row, from_row = [], [], [], []
+
+    for index, field in enumerate(dataclasses.fields(dto_type)):
+        name = field.name
+        encode, decode = _field_code(hints[name], name, namespace, 'dict')
+        to_dict.append(f"{name!r}: {encode.format(f'obj.{name}')}")
+        from_dict.append(decode.format(f"data[{name!r}]"))
+        encode, decode = _field_code(hints[name], name, namespace, 'row')
+        to_row.append(encode.format(f'obj.{name}'))
+        from_row.append(decode.format(f"row[{index}]"))
+
+    source = (
+        f"def to_dict(obj):\n    return {{{', '.join(to_dict)}}}\n"
+        f"def from_dict(data):\n    return _cls({', '.join(from_dict)})\n"
+        f"def to_row(obj):\n    return [{', '.join(to_row)}]\n"
+        f"def from_row(row):\n    return _cls({', '.join(from_row)})\n"
+    )
+    exec(compile(source, f"<codec {dto_type.__name__}>", "exec"), namespace)
+    return namespace['to_dict'], namespace['from_dict'], namespace['to_row'], namespace['from_row']
+
+
+def _field_code(hint: Any, name: str, namespace: dict, form: str) -> tuple[str, str]:
+    """Return (encode, decode) expression templates with {} for the value.
+
+    form is 'dict' or 'row' and selects which nested codec functions are used.
+    """
+    optional = False
+    if isinstance(hint, types.UnionType) or typing.get_origin(hint) is typing.Union:
+        args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        optional = len(args) < len(typing.get_args(hint))
+        if len(args) != 1:
+            raise TypeError(f"Unsupported field type {hint!r} for {name}")
+        hint = args[0]
+
+    origin = typing.get_origin(hint)
+    if hint in (int, float, str, bool):
+        encode, decode = "{}", "{}"
+    elif isinstance(hint, type) and issubclass(hint, Payment):
+        return "_payment_name({})", "{}"
+    elif isinstance(hint, type) and issubclass(hint, Enum):
+        namespace[f'_{name}_enum'] = hint
+        encode, decode = "{}.value", f"_{name}_enum({{}})"
+    elif dataclasses.is_dataclass(hint):
+        enc, dec = _nested(hint, name, namespace, form)
+        encode, decode = f"{enc}({{}})", f"{dec}({{}})"
+    elif origin in (list, tuple):
+        item = typing.get_args(hint)[0]
+        if dataclasses.is_dataclass(item):
+            enc, dec = _nested(item, name, namespace, form)
+            encode = f"[{enc}(v) for v in {{}}]"
+            decode = f"[{dec}(v) for v in {{}}]"
+        else:
+            encode, decode = "list({})", "list({})"
+        if origin is tuple:
+            decode = f"tuple({decode})"
+    else:
+        raise TypeError(f"Unsupported field type {hint!r} for {name}")
+
+    if optional:
+        encode = f"(None if {{0}} is None else {encode.replace('{}', '{0}')})"
+        decode = f"(None if {{0}} is None else {decode.replace('{}', '{0}')})"
+    return encode, decode
+
+
+def _nested(dto_type: type, name: str, namespace: dict, form: str) -> tuple[str, str]:
+    """Bind a nested codec's functions into namespace and return their names"""
+    nested = codec_for(dto_type)
+    enc, dec = f"_{name}_to_{form}", f"_{name}_from_{form}"
+    namespace[enc] = getattr(nested, f"to_{form}")
+    namespace[dec] = getattr(nested, f"from_{form}")
+    return enc, dec
+
+
+# --- MessagePack-compatible binary format --------------------------------
+
+_pack_double = struct.Struct('>Bd').pack
+_unpack_double = struct.Struct('>d').unpack_from
+
+
+def pack(value: Any, out: bytearray) -> None:
+    """Append the MessagePack encoding of value to out"""
+    if value is None:
+        out.append(0xc0)
+    elif value is True:
+        out.append(0xc3)
+    elif value is False:
+        out.append(0xc2)
+    elif type(value) is int:
+        _pack_int(value, out)
+    elif type(value) is float:
+        out += _pack_double(0xcb, value)
+    elif type(value) is str:
+        data = value.encode('utf-8')
+        size = len(data)
+        if size < 32:
+            out.append(0xa0 | size)
+        elif size < 0x100:
+            out += bytes((0xd9, size))
+        elif size < 0x10000:
+            out += b'\xda' + size.to_bytes(2, 'big')
+        else:
+            out += b'\xdb' + size.to_bytes(4, 'big')
+        out += data
+    elif isinstance(value, (list, tuple)):
+        size = len(value)
+        if size < 16:
+            out.append(0x90 | size)
+        elif size < 0x10000:
+            out += b'\xdc' + size.to_bytes(2, 'big')
+        else:
+            out += b'\xdd' + size.to_bytes(4, 'big')
+        for item in value:
+            pack(item, out)
+    elif isinstance(value, dict):
+        size = len(value)
+        if size < 16:
+            out.append(0x80 | size)
+        elif size < 0x10000:
+            out += b'\xde' + size.to_bytes(2, 'big')
+        else:
+            out += b'\xdf' + size.to_bytes(4, 'big')
+        for key, item in value.items():
+            pack(key, out)
+            pack(item, out)
+    elif isinstance(value, (bytes, bytearray)):
+        size = len(value)
+        if size < 0x100:
+            out += bytes((0xc4, size))
+        elif size < 0x10000:
+            out += b'\xc5' + size.to_bytes(2, 'big')
+        else:
+            out += b'\xc6' + size.to_bytes(4, 'big')
+        out += value
+    elif isinstance(value, int):
+        _pack_int(int(value), out)
+    elif isinstance(value, float):
+        out += _pack_double(0xcb, float(value))
+    else:
+        raise TypeError(f"Cannot serialize value of type {type(value).__name__}")
+
+
+def _pack_int(value: int, out: bytearray) -> None:
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xff)
+    elif value >= 0:
+        if value < 0x100:
+            out += bytes((0xcc, value))
+        elif value < 0x10000:
+            out += b'\xcd' + value.to_bytes(2, 'big')
+        elif value < 0x100000000:
+            out += b'\xce' + value.to_bytes(4, 'big')
+        else:
+            out += b'\xcf' + value.to_bytes(8, 'big')
+    elif value >= -0x80:
+        out += b'\xd0' + value.to_bytes(1, 'big', signed=True)
+    elif value >= -0x8000:
+        out += b'\xd1' + value.to_bytes(2, 'big', signed=True)
+    elif value >= -0x80000000:
+        out += b'\xd2' + value.to_bytes(4, 'big', signed=True)
+    else:
+        out += b'\xd3' + value.to_bytes(8, 'big', signed=True)
+
+
+def unpack(data: bytes | memoryview, position: int) -> tuple[Any, int]:
+    """Decode one MessagePack value starting at position; return (value, end)"""
+    try:
+        code = data[position]
+    except IndexError:
+        raise ValueError("Truncated binary data") from None
+    position += 1
+
+    if code < 0x80:
+        return code, position
+    if code >= 0xe0:
+        return code - 0x100, position
+    if 0xa0 <= code <= 0xbf:
+        end = position + (code & 0x1f)
+        return _text(data, position, end), end
+    if 0x90 <= code <= 0x9f:
+        return _unpack_array(data, position, code & 0x0f)
+    if 0x80 <= code <= 0x8f:
+        return _unpack_map(data, position, code & 0x0f)
+    if code == 0xc0:
+        return None, position
+    if code == 0xc2:
+        return False, position
+    if code == 0xc3:
+        return True, position
+    if code == 0xcb:
+        return _unpack_double(data, position)[0], position + 8
+    if code in _UINT_SIZES:
+        end = position + _UINT_SIZES[code]
+        return int.from_bytes(data[position:end], 'big'), end
+    if code in _INT_SIZES:
+        end = position + _INT_SIZES[code]
+        return int.from_bytes(data[position:end], 'big', signed=True), end
+    if code in _STR_SIZES:
+        start = position + _STR_SIZES[code]
+        end = start + int.from_bytes(data[position:start], 'big')
+        return _text(data, start, end), end
+    if code in _BIN_SIZES:
+        start = position + _BIN_SIZES[code]
+        end = start + int.from_bytes(data[position:start], 'big')
+        return bytes(data[start:end]), end
+    if code in (0xdc, 0xdd):
+        start = position + (2 if code == 0xdc else 4)
+        return _unpack_array(data, start, int.from_bytes(data[position:start], 'big'))
+    if code in (0xde, 0xdf):
+        start = position + (2 if code == 0xde else 4)
+        return _unpack_map(data, start, int.from_bytes(data[position:start], 'big'))
+    raise ValueError(f"Unsupported binary type code 0x{code:02x}")
+
+
+_UINT_SIZES = {0xcc: 1, 0xcd: 2, 0xce: 4, 0xcf: 8}
+_INT_SIZES = {0xd0: 1, 0xd1: 2, 0xd2: 4, 0xd3: 8}
+_STR_SIZES = {0xd9: 1, 0xda: 2, 0xdb: 4}
+_BIN_SIZES = {0xc4: 1, 0xc5: 2, 0xc6: 4}
+
+
+def _text(data: bytes | memoryview, start: int, end: int) -> str:
+    if end > len(data):
+        raise ValueError("Truncated binary data")
+    return str(data[start:end], 'utf-8')
+
+
+def _unpack_array(data, position: int, size: int) -> tuple[list, int]:
+    items = []
+    append = items.append
+    for _ in range(size):
+        item, position = unpack(data, position)
+        append(item)
+    return items, position
+
+
+def _unpack_map(data, position: int, size: int) -> tuple[dict, int]:
+    result = {}
+    for _ in range(size):
+        key, position = unpack(data, position)
+        result[key], position = unpack(data, position)
+    return result, position
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from typing import Any, NamedTuple, TypeVar
+
+T = TypeVar('T')
+
+
+class FlightInfo(NamedTuple):
+    executed: int
+    shared: int
+
+    @property
+    def shared_ratio(self) -> float:
+        total = self.executed + self.shared
+        return self.shared / total if total else 0.0
+
+
+class _Call:
+    __slots__ = ('running', 'result', 'error')
+
+    def __init__(self):
+        # Held by the executing thread until the result is in
+        self.running = threading.Lock()
+        self.running.acquire()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Lets concurrent threads asking for the same key share one call.
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait and receive the same result or exception. Results are shared
+    as is, so they should be immutable. Call forget(key) after changing the
+    underlying data, so later callers do not join a call that read the old
+    state. A function must not call do() for its own key.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, func: Callable[..., T], *args) -> T:
+        """Return func(*args), or the result of the same call already running for key"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                leader = True
+            else:
+                self._shared += 1
+                leader = False
+
+        if not leader:
+            call.running.acquire()
+            call.running.release()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args)
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.running.release()
+
+    def forget(self, key: Hashable) -> None:
+        """Let the next caller for key start a new call instead of joining"""
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def forget_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        """forget() every running key the predicate accepts"""
+        with self._lock:
+            for key in [key for key in self._calls if predicate(key)]:
+                del self._calls[key]
+
+    def info(self) -> FlightInfo:
+        with self._lock:
+            return FlightInfo(self._executed, self._shared)
+
+
+class AsyncSingleFlight:
+    """Lets concurrent asyncio tasks asking for the same key share one call.
+
+    Works like SingleFlight for coroutines on one event loop. The shared call
+    runs as its own task, so a caller that is cancelled stops waiting
+    without cancelling the call for the others.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self._executed = 0
+        self._shared = 0
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[T]], *args) -> T:
+        """Return await func(*args), or the result of the same call already running for key"""
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func(*args))
+            self._calls[key] = future
+            future.add_done_callback(partial(self._landed, key))
+            self._executed += 1
+        else:
+            self._shared += 1
+        return await asyncio.shield(future)
+
+    def _landed(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Seen here even when every caller gave up waiting
+            future.exception()
+
+    def forget(self, key: Hashable) -> None:
+        """Let the next caller for key start a new call instead of joining"""
+        self._calls.pop(key, None)
+
+    def forget_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        """forget() every running key the predicate accepts"""
+        for key in [key for key in self._calls if predicate(key)]:
+            del self._calls[key]
+
+    def info(self) -> FlightInfo:
+        return FlightInfo(self._executed, self._shared)
@@ -0,0 +1,133 @@
+import json
+import random
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from ..schemas import (
+    CreditCardPaymentDTO,
+    DiscountDTO,
+    DeliveryDTO,
+    ExpressDeliveryDTO,
+    FixedDiscountDTO,
+    OrderCreateDTO,
+    PaymentDTO,
+    PayPalPaymentDTO,
+    PercentageDiscountDTO,
+    StandardDeliveryDTO,
+)
+
+ADJECTIVES = ["Wireless", "Compact", "Ergonomic", "Smart", "Portable", "Premium",
+              "Classic", "Mechanical", "Silent", "Ultra"]
+NOUNS = ["Mouse", "Keyboard", "Monitor", "Laptop", "Headphones", "Speaker", "Camera",
+         "Charger", "Router", "Tablet", "Webcam", "Microphone"]
+FIRST_NAMES = ["John", "Jane", "Alex", "Maria", "Ivan", "Olga", "Peter", "Anna",
+               "David", "Sofia", "Max", "Elena"]
+LAST_NAMES = ["Smith", "Doe", "Ivanov", "Garcia", "Brown", "Petrova", "Muller",
+              "Rossi", "Kim", "Novak"]
+STREETS = ["Main St", "Oak Ave", "Pine Rd", "Elm Street", "Lake Dr", "Hill Rd"]
+CITIES = {
+    "USA": ["New York", "Los Angeles", "Chicago", "Houston", "San Francisco"],
+    "Germany": ["Berlin", "Munich", "Hamburg"],
+    "France": ["Paris", "Lyon", "Marseille"],
+    "Japan": ["Tokyo", "Osaka"],
+    "Canada": ["Toronto", "Vancouver"],
+}
+
+# Share of orders with 1, 2, 3 ... 10 lines: most orders are small
+LINE_COUNT_WEIGHTS = [38, 24, 14, 9, 6, 4, 2, 1.5, 1, 0.5]
+# Share of customers with 1, 2 ... 5 saved addresses
+ADDRESS_COUNT_WEIGHTS = [55, 25, 12, 5, 3]
+
+
+class SyntheticDataGenerator:
+    """Deterministic generator of catalog, customer and order data.
+
+    The same seed always yields the same records, so benchmark runs are
+    comparable. Records are produced lazily, which keeps millions of them
+    cheap to stream into services or files.
+    """
+
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+
+    def products(self, count: int, start_id: int = 1) -> Iterator[dict]:
+        """Yield product records shaped like products.json"""
+        rng = random.Random(f"{self.seed}-products")
+        for product_id in range(start_id, start_id + count):
+            yield {
+                "product_id": product_id,
+                "name": f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {product_id}",
+                "price": round(rng.lognormvariate(4.0, 1.0) + 0.99, 2),
+                "weight": round(rng.uniform(0.1, 15.0), 1),
+            }
+
+    def customers(self, count: int, start_id: int = 1) -> Iterator[dict]:
+        """Yield customer records with 1-5 addresses, shaped like customers.json"""
+        rng = random.Random(f"{self.seed}-customers")
+        countries = list(CITIES)
+        address_counts = range(1, len(ADDRESS_COUNT_WEIGHTS) + 1)
+        for customer_id in range(start_id, start_id + count):
+            addresses = []
+            for _ in range(rng.choices(address_counts, ADDRESS_COUNT_WEIGHTS)[0]):
+                country = rng.choice(countries)
+                addresses.append({
+                    "street": f"{rng.randint(1, 9999)} {rng.choice(STREETS)}",
+                    "city": rng.choice(CITIES[country]),
+                    "country": country,
+                })
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            yield {
+                "id": customer_id,
+                "name": f"{first} {last}",
+                "email": f"{first.lower()}.{last.lower()}.{customer_id}@example.com",
+                "addresses": addresses,
+            }
+
+    def order_lines(self, count: int, product_count: int) -> Iterator[list[tuple[int, int]]]:
+        """Yield (product_id, quantity) lists with a realistic line-count skew"""
+        rng = random.Random(f"{self.seed}-lines")
+        line_counts = range(1, len(LINE_COUNT_WEIGHTS) + 1)
+        for _ in range(count):
+            lines = rng.choices(line_counts, LINE_COUNT_WEIGHTS)[0]
+            product_ids = rng.sample(range(1, product_count + 1), min(lines, product_count))
+            yield [(product_id, rng.choices((1, 2, 3, 5), (70, 20, 7, 3))[0])
+                   for product_id in product_ids]
+
+    def orders(
+        self,
+        count: int,
+        customer_count: int,
+        product_count: int
+    ) -> Iterator[OrderCreateDTO]:
+        """Yield order requests for existing customer and product ids"""
+        rng = random.Random(f"{self.seed}-orders")
+        discounts: list[DiscountDTO] = [
+            PercentageDiscountDTO(value=0.0), PercentageDiscountDTO(value=10.0),
+            PercentageDiscountDTO(value=15.0), FixedDiscountDTO(value=20.0),
+        ]
+        deliveries: list[DeliveryDTO] = [StandardDeliveryDTO(), ExpressDeliveryDTO()]
+        payments: list[PaymentDTO] = [
+            CreditCardPaymentDTO(details="4111-1111-1111-1111"),
+            PayPalPaymentDTO(details="buyer@paypal.com"),
+        ]
+        for items in self.order_lines(count, product_count):
+            yield OrderCreateDTO(
+                customer_id=rng.randint(1, customer_count),
+                items=items,
+                discount=rng.choices(discounts, (55, 20, 15, 10))[0],
+                delivery=rng.choices(deliveries, (80, 20))[0],
+                payment=rng.choice(payments),
+            )
+
+    @staticmethod
+    def write_json(path: str | Path, records: Iterable[dict]) -> int:
+        """Stream records into a JSON array file readable by DataLoader"""
+        count = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('[')
+            for record in records:
+                f.write(',\n' if count else '\n')
+                json.dump(record, f)
+                count += 1
+            f.write('\n]\n')
+        return count
@@ -0,0 +1,230 @@
+import dataclasses
+import types
+import typing
+from collections.abc import Iterable
+from enum import Enum
+from functools import cache
+from typing import Any, Generic, TypeVar
+
+T = TypeVar('T')
+
+_MISSING = object()
+
+
+class ValidationError(ValueError):
+    """Raised with every problem found in one record"""
+
+    def __init__(self, dto_name: str, errors: list[str]):
+        self.errors = tuple(errors)
+        super().__init__(f"Invalid {dto_name}: {'; '.join(errors)}")
+
+
+class Validator(Generic[T]):
+    """Validating constructor for one DTO class, compiled once from its fields.
+
+    Field types are checked exactly (an int is accepted for a float field),
+    enums are converted from their values, nested DTOs and lists/tuples of
+    them are built recursively, and `min`/`max` entries of the field
+    metadata are enforced. Unknown keys are reported too. All problems in a
+    record are collected before ValidationError is raised.
+    """
+
+    def __init__(self, dto_type: type[T]):
+        self.dto_type = dto_type
+        self._validate = _compile(dto_type)
+
+    def __reduce__(self):
+        # Generated code can't be pickled; recompile in the receiving process
+        return validator_for, (self.dto_type,)
+
+    def build(self, data: dict) -> T:
+        errors: list[str] = []
+        dto = self._validate(data, errors)
+        if errors:
+            raise ValidationError(self.dto_type.__name__, errors)
+        return dto
+
+    def build_many(self, records: Iterable[dict]) -> tuple[list[T], dict[int, tuple[str, ...]]]:
+        """Build every valid record; return the DTOs and errors by record index"""
+        validate = self._validate
+        dtos: list[T] = []
+        failures: dict[int, tuple[str, ...]] = {}
+        errors: list[str] = []
+        for index, data in enumerate(records):
+            dto = validate(data, errors)
+            if errors:
+                failures[index] = tuple(errors)
+                errors.clear()
+            else:
+                dtos.append(dto)
+        return dtos, failures
+
+
+@cache
+def validator_for(dto_type: type[T]) -> Validator[T]:
+    """Return the compiled validator for a DTO class"""
+    return Validator(dto_type)
+
+
+def _compile(dto_type: type) -> Any:
+    """Generate the source of _validate(data, errors) for a dataclass"""
+    hints = typing.get_type_hints(dto_type)
+    fields = [f for f in dataclasses.fields(dto_type) if f.init]
+    namespace: dict[str, Any] = {
+        '_cls': dto_type,
+        '_MISSING': _MISSING,
+        '_known': frozenset(f.name for f in fields),
+    }
+    lines = [
+        "def _validate(data, errors):",
+        "    if type(data) is not dict:",
+        "        errors.append('record: expected object, got ' + type(data).__name__)",
+        "        return None",
+        "    count = len(errors)",
+    ]
+
+    for index, field in enumerate(fields):
+        name, var = field.name, f"f{index}"
+        label = repr(name)
+        lines.append(f"    {var} = data.get({name!r}, _MISSING)")
+        lines.append(f"    if {var} is _MISSING:")
+        if field.default is not dataclasses.MISSING:
+            namespace[f'_default_{name}'] = field.default
+            lines.append(f"        {var} = _default_{name}")
+        elif field.default_factory is not dataclasses.MISSING:
+            namespace[f'_factory_{name}'] = field.default_factory
+            lines.append(f"        {var} = _factory_{name}()")
+        else:
+            lines.append(f"        errors.append({label} + ': missing')")
+        lines.append("    else:")
+        body = _check(hints[name], var, label, namespace)
+        body += _range(field.metadata, var, label, namespace)
+        lines += ["        " + line for line in body]
+
+    lines += [
+        "    if not _known.issuperset(data):",
+        "        for key in data:",
+        "            if key not in _known:",
+        "                errors.append(str(key) + ': unknown field')",
+        "    if len(errors) != count:",
+        "        return None",
+    ]
+    values = [f"f{i}" for i in range(len(fields))]
+    if _plain_init(dto_type, fields):
+        # Every value is already checked, so skip the generated __init__
+        # (a frozen one sets each field through object.__setattr__)
+        namespace['_new'] = object.__new__
+        namespace['_setattr'] = object.__setattr__
+        items = ', '.join(f"{f.name!r}: {var}" for f, var in zip(fields, values))
+        lines += [
+            "    dto = _new(_cls)",
+            f"    _setattr(dto, '__dict__', {{{items}}})",
+        ]
+        if hasattr(dto_type, '__post_init__'):
+            lines.append("    dto.__post_init__()")
+        lines.append("    return dto")
+    else:
+        lines.append(f"    return _cls({', '.join(values)})")
+    exec(compile("\n".join(lines), f"<validator {dto_type.__name__}>", "exec"), namespace)
+    return namespace['_validate']
+
+
+def _plain_init(dto_type: type, fields: list) -> bool:
+    """True if the dataclass __init__ only stores the fields into __dict__"""
+    declared = dto_type.__dataclass_fields__.values()
+    return (
+        dto_type.__dataclass_params__.init
+        and '__slots__' not in vars(dto_type)
+        and len(fields) == len(dataclasses.fields(dto_type))
+        and not any(isinstance(f.type, dataclasses.InitVar) for f in declared)
+    )
+
+
+def _check(hint: Any, var: str, label: str, namespace: dict) -> list[str]:
+    """Return lines that type-check and convert var in place, appending to errors"""
+    if isinstance(hint, types.UnionType) or typing.get_origin(hint) is typing.Union:
+        args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        if len(args) != 1:
+            raise TypeError(f"Unsupported field type {hint!r}")
+        if len(args) == len(typing.get_args(hint)):
+            return _check(args[0], var, label, namespace)
+        return [f"if {var} is not None:"] + [
+            "    " + line for line in _check(args[0], var, label, namespace)
+        ]
+
+    got = f"type({var}).__name__"
+    origin = typing.get_origin(hint)
+    if hint is float:
+        return [
+            f"if type({var}) is not float:",
+            f"    if type({var}) is int:",
+            f"        {var} = float({var})",
+            "    else:",
+            f"        errors.append({label} + ': expected float, got ' + {got})",
+        ]
+    if hint in (int, str, bool):
+        return [
+            f"if type({var}) is not {hint.__name__}:",
+            f"    errors.append({label} + ': expected {hint.__name__}, got ' + {got})",
+        ]
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        enum_name = _bind(namespace, '_enum', hint)
+        return [
+            "try:",
+            f"    {var} = {enum_name}({var})",
+            "except ValueError:",
+            f"    errors.append({label} + ': invalid value ' + repr({var}))",
+        ]
+    if dataclasses.is_dataclass(hint):
+        nested = _bind(namespace, '_nested', validator_for(hint)._validate)
+        # Nested errors are prefixed with the path only when there are any
+        return [
+            f"if type({var}) is not dict:",
+            f"    errors.append({label} + ': expected object, got ' + {got})",
+            "else:",
+            f"    {var}_count = len(errors)",
+            f"    {var} = {nested}({var}, errors)",
+            f"    if {var} is None:",
+            f"        errors[{var}_count:] = [{label} + '.' + error for error in errors[{var}_count:]]",
+        ]
+    if origin in (list, tuple):
+        item = f"{var}_item"
+        item_label = f"{label} + '[' + str({var}_index) + ']'"
+        item_lines = _check(typing.get_args(hint)[0], item, item_label, namespace)
+        return [
+            f"if type({var}) is not list and type({var}) is not tuple:",
+            f"    errors.append({label} + ': expected list, got ' + {got})",
+            "else:",
+            f"    {var}_items = []",
+            f"    for {var}_index, {item} in enumerate({var}):",
+            *("        " + line for line in item_lines),
+            f"        {var}_items.append({item})",
+            f"    {var} = {'tuple' if origin is tuple else ''}({var}_items)",
+        ]
+    if isinstance(hint, type):
+        class_name = _bind(namespace, '_type', hint)
+        return [
+            f"if not isinstance({var}, {class_name}):",
+            f"    errors.append({label} + ': expected {hint.__name__}, got ' + {got})",
+        ]
+    raise TypeError(f"Unsupported field type {hint!r}")
+
+
+def _range(metadata: Any, var: str, label: str, namespace: dict) -> list[str]:
+    """Return lines enforcing metadata min/max on values that passed the number check"""
+    lines = []
+    for key, operator in (('min', '<'), ('max', '>')):
+        if key in metadata:
+            bound = _bind(namespace, f'_{key}', metadata[key])
+            lines += [
+                f"if (type({var}) is int or type({var}) is float) and {var} {operator} {bound}:",
+                f"    errors.append({label} + ': must be {'>=' if key == 'min' else '<='} ' + str({bound}))",
+            ]
+    return lines
+
+
+def _bind(namespace: dict, prefix: str, value: Any) -> str:
+    """Store value under a fresh name in namespace and return the name"""
+    name = f"{prefix}_{len(namespace)}"
+    namespace[name] = value
+    return name
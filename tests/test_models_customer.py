@@ -36,6 +36,23 @@ class TestCustomer:
         assert customer.addresses[0].city == "New York"
         assert customer.addresses[1].city == "Los Angeles"
 
+    def test_customer_version_changes_on_write(self, sample_customer):
+        """Тест смены версии клиента при изменениях."""
+        version = sample_customer.version
+
+        sample_customer.add_address("456 Oak St", "Chicago", "USA")
+        after_address = sample_customer.version
+        sample_customer.email = "new@example.com"
+
+        assert version != after_address != sample_customer.version
+
+    def test_recreated_customer_has_new_version(self):
+        """Тест: пересозданный клиент не повторяет версию."""
+        first = Customer(id=1, name="John Doe", email="john@example.com")
+        second = Customer(id=1, name="John Doe", email="john@example.com")
+
+        assert first.version != second.version
+
 
 class TestAddress:
     """Тесты для класса Address."""
@@ -57,3 +74,13 @@ class TestAddress:
         # Адреса равны по содержимому, но разные объекты
         assert address1 is not address2
         assert address1 is not address3
+
+    def test_repeated_values_share_strings(self):
+        """Тест: одинаковые города и страны хранятся одной строкой."""
+        first = Customer(1, "".join(["John ", "Doe"]), "john@example.com")
+        second = Customer(2, "".join(["John ", "Doe"]), "john2@example.com")
+        first.add_address("1 Main St", "".join(["New ", "York"]), "".join(["US", "A"]))
+        second.add_address("2 Main St", "".join(["New ", "York"]), "".join(["US", "A"]))
+
+        assert first.addresses[0].city is second.addresses[0].city
+        assert first.addresses[0].country is second.addresses[0].country
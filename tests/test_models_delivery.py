@@ -1,6 +1,13 @@
 """Тесты для моделей доставки."""
 import pytest
-from src.models.delivery import Delivery, StandardDelivery, ExpressDelivery
+from src.models.delivery import (
+    Delivery, StandardDelivery, ExpressDelivery, TableRateDelivery
+)
+from src.models.delivery_rates import DeliveryRateEngine
+from src.models.customer import Address
+from src.models.product import Product
+from src.models.cart import CartItem
+from src.models.order import Order
 
 
 class TestStandardDelivery:
@@ -31,6 +38,29 @@ class TestExpressDelivery:
         assert cost == 15.0
 
 
+class TestSharedDelivery:
+    """Тесты для общих экземпляров доставки."""
+
+    def test_shared_per_class(self):
+        """Тест: один экземпляр на способ доставки."""
+        assert StandardDelivery.shared() is StandardDelivery.shared()
+        assert ExpressDelivery.shared() is ExpressDelivery.shared()
+        assert StandardDelivery.shared() is not ExpressDelivery.shared()
+        assert ExpressDelivery.shared().cost() == 15.0
+
+    def test_shared_cannot_be_changed(self):
+        """Тест: общий экземпляр нельзя изменить из одного заказа."""
+        with pytest.raises(AttributeError):
+            StandardDelivery.shared().cost = lambda: 0.0
+        with pytest.raises(AttributeError):
+            TableRateDelivery("standard", DeliveryRateEngine()).method = "express"
+
+    def test_table_rate_has_no_shared_instance(self):
+        """Тест: для тарифной доставки нет общего экземпляра."""
+        with pytest.raises(TypeError, match="create it directly"):
+            TableRateDelivery.shared()
+
+
 class TestDeliveryAbstract:
     """Тесты для абстрактного класса Delivery."""
 
@@ -59,3 +89,111 @@ class TestDeliveryAbstract:
 
         # Экспресс-доставка должна быть дороже стандартной
         assert express_cost > standard_cost
+
+
+@pytest.fixture
+def rate_engine():
+    """Движок тарифов: зоны по стране и городу, весовые диапазоны."""
+    engine = DeliveryRateEngine()
+    engine.add_zone("domestic", "USA")
+    engine.add_zone("local", "USA", "New York")
+    engine.add_rate("standard", "default", 10.0, 30.0)
+    engine.add_rate("standard", "domestic", 1.0, 5.0)
+    engine.add_rate("standard", "domestic", 5.0, 9.0)
+    engine.add_rate("standard", "local", 5.0, 3.0)
+    engine.set_item_surcharge("standard", 0.5)
+    return engine
+
+
+class TestDeliveryRateEngine:
+    """Тесты для табличного расчета стоимости доставки."""
+
+    def test_zone_lookup(self, rate_engine):
+        """Тест определения зоны по стране и городу."""
+        assert rate_engine.zone_for("USA", "New York") == "local"
+        assert rate_engine.zone_for("usa", "Chicago") == "domestic"
+        assert rate_engine.zone_for("France", "Paris") == "default"
+        assert rate_engine.zone_for(None) == "default"
+
+    def test_weight_brackets(self, rate_engine):
+        """Тест выбора весового диапазона."""
+        assert rate_engine.quote("standard", "USA", "Chicago", weight=0.8) == 5.0
+        assert rate_engine.quote("standard", "USA", "Chicago", weight=1.2) == 9.0
+
+    def test_item_surcharge(self, rate_engine):
+        """Тест доплаты за каждую единицу товара."""
+        assert rate_engine.quote("standard", "USA", "New York", 1.0, item_count=4) == 5.0
+
+    def test_fallback_to_default_zone(self, rate_engine):
+        """Тест использования тарифов зоны по умолчанию."""
+        assert rate_engine.quote("standard", "France", "Paris", 2.0) == 30.0
+
+    def test_brackets_use_exact_weight(self):
+        """Тест: границы диапазонов не округляются до шага веса."""
+        engine = DeliveryRateEngine()
+        engine.add_rate("standard", "default", 0.3, 4.0)
+        engine.add_rate("standard", "default", 1.2, 6.0)
+        engine.add_rate("standard", "default", 2.0, 9.0)
+
+        assert engine.quote("standard", weight=0.2) == 4.0
+        assert engine.quote("standard", weight=1.1) == 6.0
+        assert engine.quote("standard", weight=1.2) == 6.0
+        assert engine.quote("standard", weight=1.21) == 9.0
+
+    def test_too_heavy(self, rate_engine):
+        """Тест посылки тяжелее максимального диапазона."""
+        with pytest.raises(ValueError, match="too heavy"):
+            rate_engine.quote("standard", "USA", "Chicago", weight=6.0)
+
+    def test_unknown_method(self, rate_engine):
+        """Тест неизвестного способа доставки."""
+        with pytest.raises(ValueError, match="No delivery rates for method drone"):
+            rate_engine.quote("drone", "USA")
+
+    def test_fallback_resolved_in_table(self, rate_engine):
+        """Тест: таблица диапазонов уже содержит запасные тарифы зон."""
+        rate_engine.add_zone("islands", "USA", "Honolulu")
+
+        assert rate_engine.quote("standard", "USA", "Honolulu", weight=8.0) == 30.0
+        assert rate_engine._zone_brackets[("standard", "islands")] == \
+            rate_engine._zone_brackets[("standard", "default")]
+
+    def test_table_change_rebuilds_table(self, rate_engine):
+        """Тест перестроения таблицы при изменении тарифов."""
+        assert rate_engine.quote("standard", "USA", "Chicago", weight=0.5) == 5.0
+
+        rate_engine.add_rate("standard", "domestic", 1.0, 6.0)
+
+        assert rate_engine.quote("standard", "USA", "Chicago", weight=0.5) == 6.0
+
+    def test_flat_engine(self):
+        """Тест плоского тарифа."""
+        engine = DeliveryRateEngine.flat({"express": 15.0})
+        assert engine.quote("express", "USA", "Chicago", weight=100.0) == 15.0
+
+
+class TestTableRateDelivery:
+    """Тесты для доставки по таблице тарифов."""
+
+    def test_cost_without_destination(self, rate_engine):
+        """Тест стоимости без адреса и веса."""
+        delivery = TableRateDelivery("standard", rate_engine)
+        assert delivery.cost() == 30.0
+
+    def test_order_uses_destination_and_weight(self, rate_engine, sample_customer):
+        """Тест расчета доставки заказа по адресу клиента и весу."""
+        product = Product(1, "Book", 20.0, weight=0.4)
+        order = Order(sample_customer, [CartItem(product, 2)])
+        order.delivery = TableRateDelivery("standard", rate_engine)
+
+        # New York -> local, 0.8 кг -> 3.0 + 2 * 0.5
+        assert order.calculate_total() == 44.0
+
+    def test_explicit_shipping_address(self, rate_engine, sample_customer):
+        """Тест явного адреса доставки."""
+        product = Product(1, "Book", 20.0, weight=0.4)
+        order = Order(sample_customer, [CartItem(product, 1)])
+        order.delivery = TableRateDelivery("standard", rate_engine)
+        order.shipping_address = Address("1 Rue", "Paris", "France")
+
+        assert order.calculate_total() == 50.5
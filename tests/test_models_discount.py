@@ -82,6 +82,26 @@ class TestFixedDiscount:
         assert discount_amount == 0.0
 
 
+class TestSharedDiscount:
+    """Тесты для общих экземпляров скидок."""
+
+    def test_shared_by_type_and_value(self):
+        """Тест: одинаковые скидки - один объект."""
+        assert PercentageDiscount.shared(10.0) is PercentageDiscount.shared(10.0)
+        assert PercentageDiscount.shared(10.0) is not PercentageDiscount.shared(15.0)
+        assert PercentageDiscount.shared(10.0) is not FixedDiscount.shared(10.0)
+        assert FixedDiscount.shared(20.0).apply(100.0) == 20.0
+
+    def test_discount_is_immutable(self):
+        """Тест: значение общей скидки нельзя изменить."""
+        discount = PercentageDiscount.shared(10.0)
+
+        with pytest.raises(AttributeError):
+            discount.percentage = 50.0
+        with pytest.raises(AttributeError):
+            discount.extra = 1
+
+
 class TestDiscountAbstract:
     """Тесты для абстрактного класса Discount."""
 
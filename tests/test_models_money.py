@@ -0,0 +1,111 @@
+"""Тесты для денежного типа с фиксированной точкой."""
+import pytest
+from src.models.money import Money, to_cents, from_cents
+from src.models.order import Order
+from src.models.cart import CartItem
+from src.models.product import Product
+from src.models.discount import PercentageDiscount
+
+
+class TestMoneyConversion:
+    """Тесты для преобразования сумм в центы."""
+
+    def test_to_cents(self):
+        """Тест преобразования суммы в центы."""
+        assert to_cents(19.99) == 1999
+        assert to_cents(0.1) == 10
+        assert to_cents(-2.5) == -250
+
+    def test_to_cents_rounds_half_up(self):
+        """Тест округления половины цента вверх."""
+        assert to_cents(0.125) == 13
+        assert to_cents(-0.125) == -13
+
+    def test_to_cents_inexact_halves(self):
+        """Тест: половины, неточные в двоичной записи, округляются вверх."""
+        assert to_cents(0.285) == 29
+        assert to_cents(1.005) == 101
+        assert to_cents(-1.005) == -101
+        assert to_cents(1.0049) == 100
+
+    def test_from_cents(self):
+        """Тест обратного преобразования."""
+        assert from_cents(1999) == 19.99
+
+
+class TestMoney:
+    """Тесты для класса Money."""
+
+    def test_creation_requires_int(self):
+        """Тест что Money создается только из целых центов."""
+        with pytest.raises(TypeError):
+            Money(1.5)
+
+    def test_arithmetic(self):
+        """Тест арифметических операций."""
+        price = Money.from_amount(0.1)
+
+        assert price + price + price == Money(30)
+        assert Money(500) - Money(120) == Money(380)
+        assert price * 3 == 3 * price == Money(30)
+        assert -price == Money(-10)
+
+    def test_comparison_and_hash(self):
+        """Тест сравнения и хеширования."""
+        assert Money(100) < Money(200)
+        assert max(Money(100), Money(200)) == Money(200)
+        assert len({Money(100), Money(100)}) == 1
+
+    def test_percent(self):
+        """Тест вычисления процента с округлением до цента."""
+        assert Money(10000).percent(15) == Money(1500)
+        assert Money(333).percent(50) == Money(167)
+        assert Money(12345).percent(33.33) == Money(4115)
+
+    def test_percent_keeps_rate_precision(self):
+        """Тест: ставка с тремя знаками после запятой не округляется."""
+        assert Money(1_000_000).percent(33.333) == Money(333330)
+        assert Money(1_000_000).percent(33.33) == Money(333300)
+        assert Money(-1_000_000).percent(0.125) == Money(-1250)
+        assert Money(100).percent(0.005) == Money(0)
+        assert Money(1000).percent(0.05) == Money(1)
+
+    def test_sum_is_exact(self):
+        """Тест точного суммирования."""
+        values = [Money.from_amount(0.1)] * 1000
+
+        assert Money.sum(values) == Money(10000)
+
+    def test_sum_amounts_is_exact(self):
+        """Тест точного пакетного суммирования float-сумм."""
+        amounts = [0.1] * 1000
+
+        naive_total = 0.0
+        for amount in amounts:
+            naive_total += amount
+        assert naive_total != 100.0
+        assert Money.sum_amounts(amounts).amount == 100.0
+
+    def test_str(self):
+        """Тест строкового представления."""
+        assert str(Money(123456)) == "1234.56"
+        assert str(Money(-5)) == "-0.05"
+
+
+class TestOrderPricing:
+    """Тесты для точного расчета стоимости заказа."""
+
+    def test_price_breakdown(self, sample_customer, sample_standard_delivery):
+        """Тест разбивки стоимости заказа в центах."""
+        product = Product(1, "Pen", 0.1)
+        order = Order(sample_customer, [CartItem(product, 3)])
+        order.discount = PercentageDiscount(10.0)
+        order.delivery = sample_standard_delivery
+
+        prices = order.price_breakdown()
+
+        assert prices.subtotal == Money(30)
+        assert prices.discount == Money(3)
+        assert prices.delivery == Money(500)
+        assert prices.total == Money(527)
+        assert order.calculate_total() == 5.27
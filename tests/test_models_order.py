@@ -1,4 +1,6 @@
 """Тесты для моделей заказов."""
+import time
+
 import pytest
 from src.models.order import Order, OrderItem, Warehouse
 from src.enum import OrderStatus
@@ -19,6 +21,13 @@ class TestOrder:
         assert order.delivery is None
         assert order.payment is None
 
+    def test_order_created_at(self, sample_customer, sample_cart_items):
+        """Тест времени создания заказа."""
+        before = time.time()
+        order = Order(sample_customer, sample_cart_items)
+
+        assert before <= order.created_at <= time.time()
+
     def test_order_id_setter(self, sample_order):
         """Тест установки ID заказа."""
         sample_order.order_id = 123
@@ -39,6 +48,33 @@ class TestOrder:
         sample_order.status = OrderStatus.PROCESSING
         assert sample_order.status == OrderStatus.PROCESSING
 
+    def test_order_status_full_lifecycle(self, sample_order):
+        """Тест полного жизненного цикла заказа."""
+        for status in (OrderStatus.PROCESSING, OrderStatus.SHIPPED, OrderStatus.DELIVERED):
+            sample_order.status = status
+        assert sample_order.status == OrderStatus.DELIVERED
+
+    @pytest.mark.parametrize("path", [
+        (OrderStatus.SHIPPED,),
+        (OrderStatus.PROCESSING, OrderStatus.SHIPPED, OrderStatus.CANCELLED),
+        (OrderStatus.CANCELLED, OrderStatus.PROCESSING),
+        (OrderStatus.PROCESSING, OrderStatus.PENDING),
+    ])
+    def test_order_status_invalid_transition(self, sample_order, path):
+        """Тест запрещённых переходов статуса."""
+        *allowed, forbidden = path
+        for status in allowed:
+            sample_order.status = status
+
+        with pytest.raises(ValueError, match="Cannot change order status"):
+            sample_order.status = forbidden
+
+    def test_order_status_same_value_is_noop(self, sample_order):
+        """Тест повторной установки текущего статуса."""
+        sample_order.status = OrderStatus.CANCELLED
+        sample_order.status = OrderStatus.CANCELLED
+        assert sample_order.status == OrderStatus.CANCELLED
+
     def test_order_discount_setter(self, sample_order, sample_percentage_discount):
         """Тест установки скидки."""
         sample_order.discount = sample_percentage_discount
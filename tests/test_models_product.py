@@ -33,6 +33,15 @@ class TestProduct:
         sample_product.price = 0.0
         assert sample_product.price == 0.0
 
+    def test_product_weight(self):
+        """Тест веса продукта."""
+        product = Product(1, "Test", 100.0, weight=1.5)
+        assert product.weight == 1.5
+        assert Product(2, "Test", 100.0).weight == 0.0
+
+        with pytest.raises(ValueError, match="Weight cannot be negative"):
+            product.weight = -1.0
+
     def test_product_equality(self):
         """Тест сравнения продуктов."""
         product1 = Product(1, "Test", 100.0)
@@ -83,14 +92,47 @@ class TestCategory:
         assert len(sample_category.products) == 0
 
     def test_category_products_immutable(self, sample_category, sample_product):
-        """Тест неизменяемости списка продуктов."""
+        """Тест неизменяемости представления продуктов."""
         sample_category.add_product(sample_product)
         products = sample_category.products
 
-        # Изменение полученного списка не должно влиять на категорию
-        products.clear()
+        # Представление только для чтения, изменить его нельзя
+        with pytest.raises(AttributeError):
+            products.clear()
         assert len(sample_category.products) == 1
 
+    def test_category_products_is_live_view(self, sample_category, sample_products):
+        """Тест что представление отражает изменения категории без копирования."""
+        products = sample_category.products
+        sample_category.add_product(sample_products[0])
+
+        assert len(products) == 1
+        assert sample_products[0] in products
+
+    def test_category_keeps_insertion_order(self, sample_category, sample_products):
+        """Тест сохранения порядка добавления продуктов."""
+        for product in reversed(sample_products):
+            sample_category.add_product(product)
+
+        assert list(sample_category.products) == list(reversed(sample_products))
+
+    def test_category_add_remove_return_flags(self, sample_category, sample_product):
+        """Тест флагов результата добавления и удаления."""
+        assert sample_category.add_product(sample_product) is True
+        assert sample_category.add_product(sample_product) is False
+        assert sample_category.remove_product(sample_product) is True
+        assert sample_category.remove_product(sample_product) is False
+
+    def test_category_add_products_bulk(self, sample_category, sample_products):
+        """Тест массового добавления продуктов."""
+        sample_category.add_product(sample_products[0])
+
+        added = sample_category.add_products(sample_products)
+
+        assert added == len(sample_products) - 1
+        assert len(sample_category) == len(sample_products)
+        assert sample_products[1] in sample_category
+
     def test_category_multiple_products(self, sample_category, sample_products):
         """Тест добавления нескольких продуктов."""
         for product in sample_products:
@@ -0,0 +1,122 @@
+"""Тесты для правил промо-акций и их компилированного индекса."""
+import pytest
+from src.models.money import Money
+from src.models.discount import PercentageDiscount, FixedDiscount
+from src.models.promotion import (
+    OrderLine, SubtotalRule, TieredRule, CategoryRule, BuyXGetYRule,
+    CompiledPromotions,
+)
+
+
+@pytest.fixture
+def lines():
+    """Строки заказа: ноутбук и три мыши."""
+    return [
+        OrderLine(1, Money(100000), 1, ("Electronics",)),
+        OrderLine(2, Money(2500), 3, ("Electronics", "Accessories")),
+    ]
+
+
+class TestPromotionRules:
+    """Тесты для отдельных правил."""
+
+    def test_subtotal_rule_threshold(self, lines):
+        """Тест правила с порогом суммы заказа."""
+        rule = SubtotalRule("fixed", FixedDiscount(50.0), min_subtotal=2000.0)
+
+        assert rule.evaluate(lines, Money(107500)) == Money()
+        assert rule.evaluate(lines, Money(200000)) == Money(5000)
+
+    def test_tiered_rule(self, lines):
+        """Тест ступенчатой скидки."""
+        rule = TieredRule("tiers", [(500.0, 5.0), (1000.0, 10.0)])
+
+        assert rule.min_subtotal == Money(50000)
+        assert rule.evaluate(lines, Money(40000)) == Money()
+        assert rule.evaluate(lines, Money(60000)) == Money(3000)
+        assert rule.evaluate(lines, Money(107500)) == Money(10750)
+
+    def test_tiered_rule_requires_tiers(self):
+        """Тест что ступенчатое правило требует хотя бы одну ступень."""
+        with pytest.raises(ValueError, match="at least one tier"):
+            TieredRule("empty", [])
+
+    def test_category_rule(self, lines):
+        """Тест скидки на категорию."""
+        rule = CategoryRule("acc", "Accessories", 20.0)
+
+        assert rule.evaluate(lines, Money(107500)) == Money(1500)
+
+    def test_buy_x_get_y_rule(self, lines):
+        """Тест акции «купи X получи Y»."""
+        rule = BuyXGetYRule("mice", product_id=2, buy=2, get=1)
+
+        assert rule.evaluate(lines, Money(107500)) == Money(2500)
+
+    def test_buy_x_get_y_invalid(self):
+        """Тест валидации количества в акции."""
+        with pytest.raises(ValueError, match="must be positive"):
+            BuyXGetYRule("bad", product_id=1, buy=0, get=1)
+
+
+class TestCompiledPromotions:
+    """Тесты для компилированного набора правил."""
+
+    def test_only_reachable_rules_are_candidates(self, lines):
+        """Тест что оцениваются только применимые правила."""
+        relevant = BuyXGetYRule("mice", product_id=2, buy=2, get=1)
+        compiled = CompiledPromotions([
+            relevant,
+            BuyXGetYRule("other", product_id=99, buy=1, get=1),
+            CategoryRule("books", "Books", 50.0),
+            TieredRule("big", [(5000.0, 10.0)]),
+        ])
+
+        assert compiled.candidates(lines, Money(107500)) == [relevant]
+
+    def test_stackable_rules_add_up(self, lines):
+        """Тест суммирования совместимых правил."""
+        compiled = CompiledPromotions([
+            BuyXGetYRule("mice", product_id=2, buy=2, get=1),
+            CategoryRule("acc", "Accessories", 20.0),
+        ])
+
+        result = compiled.evaluate(lines)
+
+        assert result.amount == Money(4000)
+        assert set(result.applied_rules) == {"mice", "acc"}
+
+    def test_exclusive_rule_wins_when_larger(self, lines):
+        """Тест что эксклюзивное правило побеждает, если оно выгоднее."""
+        compiled = CompiledPromotions([
+            BuyXGetYRule("mice", product_id=2, buy=2, get=1),
+            SubtotalRule("vip", PercentageDiscount(10.0), stackable=False),
+        ])
+
+        result = compiled.evaluate(lines)
+
+        assert result.amount == Money(10750)
+        assert result.applied_rules == ("vip",)
+
+    def test_discount_capped_at_subtotal(self, lines):
+        """Тест ограничения скидки суммой заказа."""
+        compiled = CompiledPromotions([
+            SubtotalRule("a", FixedDiscount(1000.0)),
+            SubtotalRule("b", FixedDiscount(1000.0)),
+        ])
+
+        assert compiled.evaluate(lines).amount == Money(107500)
+
+    def test_evaluate_batch(self, lines):
+        """Тест пакетной оценки заказов."""
+        compiled = CompiledPromotions([TieredRule("tiers", [(500.0, 10.0)])])
+
+        results = compiled.evaluate_batch([lines, lines[1:]])
+
+        assert [r.amount for r in results] == [Money(10750), Money()]
+
+    def test_result_as_discount(self, lines):
+        """Тест преобразования результата в скидку заказа."""
+        result = CompiledPromotions([CategoryRule("acc", "Accessories", 20.0)]).evaluate(lines)
+
+        assert result.as_discount().apply(1075.0) == 15.0
@@ -0,0 +1,98 @@
+"""Тесты для репозитория категорий."""
+import pytest
+from src.repositories.category_repo import CategoryRepository
+from src.models.product import Category
+
+
+@pytest.fixture
+def category_repository():
+    """Создает репозиторий категорий."""
+    return CategoryRepository()
+
+
+class TestCategoryRepository:
+    """Тесты для репозитория категорий."""
+
+    def test_create_and_get_category(self, category_repository):
+        """Тест создания и получения категории."""
+        category = category_repository.create("Electronics")
+
+        assert category_repository.get_by_name("Electronics") is category
+        assert category_repository.get_by_name("Books") is None
+
+    def test_create_duplicate_category(self, category_repository):
+        """Тест создания дублирующейся категории."""
+        category_repository.create("Electronics")
+
+        with pytest.raises(ValueError, match="Category Electronics already exists"):
+            category_repository.create("Electronics")
+
+    def test_add_existing_category_indexes_products(self, category_repository, sample_products):
+        """Тест индексации продуктов уже заполненной категории."""
+        category = Category("Electronics")
+        category.add_product(sample_products[0])
+
+        category_repository.add(category)
+
+        assert category_repository.get_categories_for_product(1) == ["Electronics"]
+
+    def test_reverse_index(self, category_repository, sample_products):
+        """Тест обратного индекса продукт -> категории."""
+        category_repository.create("Electronics")
+        category_repository.create("Sale")
+        category_repository.add_products("Electronics", sample_products)
+        category_repository.add_product("Sale", sample_products[1])
+
+        assert category_repository.get_categories_for_product(1) == ["Electronics"]
+        assert category_repository.get_categories_for_product(2) == ["Electronics", "Sale"]
+        assert category_repository.get_categories_for_product(999) == []
+
+    def test_add_products_counts_new_only(self, category_repository, sample_products):
+        """Тест подсчета только новых продуктов при массовом добавлении."""
+        category_repository.create("Electronics")
+        category_repository.add_product("Electronics", sample_products[0])
+
+        added = category_repository.add_products("Electronics", sample_products)
+
+        assert added == 2
+        assert category_repository.get_products("Electronics") == sample_products
+
+    def test_remove_product_updates_index(self, category_repository, sample_products):
+        """Тест обновления индекса при удалении продукта из категории."""
+        category_repository.create("Electronics")
+        category_repository.add_product("Electronics", sample_products[0])
+
+        category_repository.remove_product("Electronics", sample_products[0])
+
+        assert category_repository.get_products("Electronics") == []
+        assert category_repository.get_categories_for_product(1) == []
+
+    def test_remove_product_everywhere(self, category_repository, sample_products):
+        """Тест удаления продукта из всех категорий."""
+        category_repository.create("Electronics")
+        category_repository.create("Sale")
+        category_repository.add_product("Electronics", sample_products[0])
+        category_repository.add_product("Sale", sample_products[0])
+
+        category_repository.remove_product_everywhere(sample_products[0])
+
+        assert category_repository.get_products("Electronics") == []
+        assert category_repository.get_products("Sale") == []
+        assert category_repository.get_categories_for_product(1) == []
+
+    def test_delete_category(self, category_repository, sample_products):
+        """Тест удаления категории."""
+        category_repository.create("Electronics")
+        category_repository.add_product("Electronics", sample_products[0])
+
+        category_repository.delete("Electronics")
+
+        assert category_repository.get_all() == []
+        assert category_repository.get_categories_for_product(1) == []
+
+    def test_unknown_category(self, category_repository, sample_product):
+        """Тест операций с несуществующей категорией."""
+        with pytest.raises(ValueError, match="Category Books not found"):
+            category_repository.add_product("Books", sample_product)
+        with pytest.raises(ValueError, match="Category Books not found"):
+            category_repository.delete("Books")
@@ -111,6 +111,30 @@ class TestOrderRepository:
         retrieved = order_repository.get_by_id(sample_order.order_id)
         assert retrieved.status == OrderStatus.PROCESSING
 
+    def test_status_index(self, order_repository, sample_customer, sample_cart_items):
+        """Тест индекса заказов по статусу."""
+        from src.enum import OrderStatus
+        orders = [order_repository.add(Order(sample_customer, sample_cart_items))
+                  for _ in range(3)]
+
+        orders[0].status = OrderStatus.PROCESSING
+        order_repository.update(orders[0])
+        orders[1].status = OrderStatus.CANCELLED
+        orders[2].status = OrderStatus.CANCELLED
+        assert order_repository.update_many(orders[1:]) == 2
+
+        counts = order_repository.count_by_status()
+        assert counts[OrderStatus.PENDING] == 0
+        assert counts[OrderStatus.PROCESSING] == 1
+        assert counts[OrderStatus.CANCELLED] == 2
+        assert order_repository.get_by_status(OrderStatus.CANCELLED) == orders[1:]
+
+    def test_get_many(self, order_repository, sample_order):
+        """Тест получения нескольких заказов."""
+        order_repository.add(sample_order)
+
+        assert order_repository.get_many([1, 99]) == [sample_order, None]
+
     def test_update_nonexistent_order(self, order_repository):
         """Тест обновления несуществующего заказа."""
         customer = Customer(1, "Test Customer", "test@example.com")
@@ -0,0 +1,138 @@
+"""Тесты для шардированных репозиториев."""
+import threading
+
+import pytest
+from src.enum import OrderStatus
+from src.models import Customer, Order, Product, CartItem
+from src.repositories import ShardedCustomerRepository, ShardedOrderRepository
+
+
+def make_customers(count):
+    """Клиенты с id 1..count."""
+    return [Customer(i, f"Customer {i}", f"c{i}@example.com") for i in range(1, count + 1)]
+
+
+def make_order(customer):
+    """Заказ клиента с одной позицией."""
+    return Order(customer, [CartItem(Product(1, "Mouse", 25.0), 1)])
+
+
+class TestShardedCustomerRepository:
+    """Тесты для шардированного репозитория клиентов."""
+
+    def test_point_operations(self):
+        """Тест добавления, чтения, обновления и удаления."""
+        repository = ShardedCustomerRepository(shards=3)
+        customers = make_customers(10)
+        for customer in customers:
+            repository.add(customer)
+
+        assert repository.get_by_id(7) is customers[6]
+        assert repository.find_by_email("c9@example.com") is customers[8]
+        assert repository.find_by_email("missing@example.com") is None
+
+        repository.delete(7)
+        assert repository.get_by_id(7) is None
+        with pytest.raises(ValueError, match="Customer with id 7 not found"):
+            repository.update(customers[6])
+
+    def test_get_all_gathers_in_id_order(self):
+        """Тест сбора клиентов со всех шардов."""
+        repository = ShardedCustomerRepository(shards=4)
+        for customer in reversed(make_customers(10)):
+            repository.add(customer)
+
+        assert [c.id for c in repository.get_all()] == list(range(1, 11))
+
+    def test_duplicate_id(self):
+        """Тест повторного добавления клиента."""
+        repository = ShardedCustomerRepository(shards=2)
+        repository.add(Customer(1, "A", "a@example.com"))
+
+        with pytest.raises(ValueError, match="already exists"):
+            repository.add(Customer(1, "B", "b@example.com"))
+
+    def test_invalid_shard_count(self):
+        """Тест некорректного числа шардов."""
+        with pytest.raises(ValueError, match="Shard count must be positive"):
+            ShardedCustomerRepository(shards=0)
+
+
+class TestShardedOrderRepository:
+    """Тесты для шардированного репозитория заказов."""
+
+    def test_ids_do_not_overlap_between_shards(self):
+        """Тест непересекающихся диапазонов id."""
+        repository = ShardedOrderRepository(shards=4)
+        orders = [repository.add(make_order(c)) for c in make_customers(20)]
+
+        ids = [order.order_id for order in orders]
+        assert len(set(ids)) == 20
+        assert all(repository.get_by_id(order_id) is order
+                   for order_id, order in zip(ids, orders))
+        assert repository.get_by_id(10_000) is None
+
+    def test_orders_stay_with_customer(self):
+        """Тест хранения заказов в шарде клиента."""
+        repository = ShardedOrderRepository(shards=4)
+        customer = make_customers(1)[0]
+        orders = [repository.add(make_order(customer)) for _ in range(3)]
+
+        assert repository.get_by_customer(1) == orders
+        assert repository.get_all() == orders
+
+    def test_status_counts_and_bulk_update(self):
+        """Тест счётчиков статусов и пакетного обновления."""
+        repository = ShardedOrderRepository(shards=3)
+        orders = [repository.add(make_order(c)) for c in make_customers(6)]
+
+        for order in orders[:4]:
+            order.status = OrderStatus.PROCESSING
+        assert repository.update_many(orders[:4]) == 4
+
+        counts = repository.count_by_status()
+        assert counts[OrderStatus.PROCESSING] == 4
+        assert counts[OrderStatus.PENDING] == 2
+        assert repository.get_by_status(OrderStatus.PENDING) == sorted(
+            orders[4:], key=lambda o: o.order_id)
+
+    def test_update_unknown_order(self):
+        """Тест обновления заказа, которого нет в репозитории."""
+        repository = ShardedOrderRepository(shards=2)
+
+        with pytest.raises(ValueError, match="Order with id None not found"):
+            repository.update(make_order(make_customers(1)[0]))
+
+    def test_concurrent_writers(self):
+        """Тест одновременной записи из нескольких потоков."""
+        repository = ShardedOrderRepository(shards=4)
+        customers = make_customers(40)
+
+        def writer(offset):
+            for customer in customers[offset::8]:
+                for _ in range(50):
+                    repository.add(make_order(customer))
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        ids = [order.order_id for order in repository.get_all()]
+        assert len(ids) == 2000
+        assert len(set(ids)) == 2000
+
+
+class TestShardedApplication:
+    """Тесты для приложения в шардированном режиме."""
+
+    def test_application_with_shards(self):
+        """Тест работы сервисов поверх шардов."""
+        from src.servises import ApplicationService
+        app = ApplicationService(shards=4)
+
+        app.initialize_sample_data()
+
+        assert len(app.customer_service.get_all_customers()) > 0
+        assert app.get_statistics()['total_orders'] == 0
@@ -0,0 +1,146 @@
+"""Тесты для снимков репозиториев."""
+import threading
+
+from src.enum import OrderStatus
+from src.models import CartItem, Customer, Order, Product
+from src.repositories import (
+    CustomerRepository,
+    OrderRepository,
+    ProductRepository,
+    ShardedOrderRepository,
+)
+from src.utils.cow import CHUNK_BITS, CopyOnWriteDict
+
+
+def make_order(customer_id=1):
+    """Заказ с одной позицией."""
+    customer = Customer(customer_id, "John Doe", "john@example.com")
+    return Order(customer, [CartItem(Product(1, "Mouse", 25.0), 2)])
+
+
+class TestCopyOnWriteDict:
+    """Тесты для словаря с копированием при записи."""
+
+    def test_frozen_view_does_not_change(self):
+        """Тест неизменности замороженного представления."""
+        data = CopyOnWriteDict()
+        data[1] = "a"
+        frozen = data.freeze()
+
+        data[2] = "b"
+        del data[1]
+
+        assert dict(frozen) == {1: "a"}
+        assert dict(data) == {2: "b"}
+
+    def test_copy_happens_once_per_freeze(self):
+        """Тест однократного копирования после снимка."""
+        data = CopyOnWriteDict()
+        data[1] = "a"
+        data.freeze()
+        data[2] = "b"
+        owned = data._chunks[0]
+        data[3] = "c"
+
+        assert data._chunks[0] is owned
+
+    def test_write_copies_only_its_chunk(self):
+        """Тест: запись после снимка копирует только свой блок."""
+        data = CopyOnWriteDict()
+        for key in range(5_000):
+            data[key] = key
+        frozen = data.freeze()
+
+        data[4_999] = -1
+        del data[0]
+
+        changed = {index for index, chunk in data._chunks.items()
+                   if chunk is not frozen._chunks[index]}
+        assert changed == {0, 4_999 >> CHUNK_BITS}
+        assert frozen[4_999] == 4_999 and frozen[0] == 0
+        assert len(frozen) == 5_000 and len(data) == 4_999
+        assert list(data) == list(range(1, 5_000))
+
+
+class TestRepositorySnapshots:
+    """Тесты для снимков репозиториев."""
+
+    def test_product_snapshot(self):
+        """Тест снимка продуктов."""
+        repository = ProductRepository()
+        repository.create(1, "Laptop", 1000.0)
+        snapshot = repository.snapshot()
+
+        repository.create(2, "Mouse", 25.0)
+        repository.delete(1)
+
+        assert len(snapshot) == 1
+        assert snapshot.get_by_id(1).name == "Laptop"
+        assert snapshot.get_by_id(2) is None
+
+    def test_customer_snapshot(self):
+        """Тест снимка клиентов."""
+        repository = CustomerRepository()
+        repository.add(Customer(1, "John Doe", "john@example.com"))
+        snapshot = repository.snapshot()
+
+        repository.add(Customer(2, "Jane Roe", "jane@example.com"))
+
+        assert len(snapshot) == 1
+        assert snapshot.find_by_email("john@example.com").id == 1
+        assert snapshot.find_by_email("jane@example.com") is None
+
+    def test_order_snapshot_keeps_statuses(self):
+        """Тест: снимок хранит статусы на момент создания."""
+        repository = OrderRepository()
+        first = repository.add(make_order())
+        snapshot = repository.snapshot()
+
+        first.status = OrderStatus.CANCELLED
+        repository.update(first)
+        repository.add(make_order())
+
+        assert len(snapshot) == 1
+        assert snapshot.status_of(first.order_id) == OrderStatus.PENDING
+        assert snapshot.count_by_status()[OrderStatus.PENDING] == 1
+        assert snapshot.count_by_status()[OrderStatus.CANCELLED] == 0
+        assert snapshot.get_by_status(OrderStatus.PENDING) == [first]
+        assert repository.count_by_status()[OrderStatus.CANCELLED] == 1
+
+    def test_sharded_order_snapshot(self):
+        """Тест снимка шардированного репозитория."""
+        repository = ShardedOrderRepository(shards=3)
+        orders = [repository.add(make_order(customer_id)) for customer_id in range(1, 7)]
+        snapshot = repository.snapshot()
+
+        repository.add(make_order(7))
+
+        assert snapshot.get_all() == sorted(orders, key=lambda o: o.order_id)
+        assert snapshot.count_by_status()[OrderStatus.PENDING] == 6
+        assert snapshot.get_by_customer(2) == [orders[1]]
+
+
+class TestApplicationSnapshot:
+    """Тесты для согласованного снимка приложения."""
+
+    def test_statistics_consistent_under_writers(self, application_service):
+        """Тест согласованности статистики при одновременной записи."""
+        repository = application_service._order_repo
+
+        def writer():
+            for _ in range(3_000):
+                order = repository.add(make_order())
+                order.status = OrderStatus.CANCELLED
+                repository.update(order)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        while thread.is_alive():
+            snapshot = application_service.snapshot()
+            counts = snapshot.orders.count_by_status()
+            assert sum(counts.values()) == len(snapshot.orders)
+            assert len(snapshot.orders.get_all()) == len(snapshot.orders)
+        thread.join()
+
+        stats = application_service.get_statistics()
+        assert stats['total_orders'] == stats['cancelled_orders'] == 3_000
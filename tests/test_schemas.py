@@ -1,14 +1,16 @@
 """Тесты для схем (DTO)."""
+from dataclasses import FrozenInstanceError
+
 import pytest
 from src.schemas import (
     ProductDTO, CustomerDTO, AddressDTO, CartItemDTO,
     PercentageDiscountDTO, FixedDiscountDTO,
     StandardDeliveryDTO, ExpressDeliveryDTO,
     CreditCardPaymentDTO, BankTransferPaymentDTO, PayPalPaymentDTO,
-    OrderCreateDTO
+    OrderCreateDTO, OrderResultDTO
 )
 from src.models import (
-    Product, Customer, CartItem,
+    Product, Customer, CartItem, Order,
     PercentageDiscount, FixedDiscount,
     StandardDelivery, ExpressDelivery,
     CreditCardPayment, BankTransferPayment, PayPalPayment
@@ -235,6 +237,34 @@ class TestOrderCreateDTO:
         assert order.delivery is not None
         assert order.payment is not None
 
+    def test_orders_share_discount_and_delivery(self, sample_customer, sample_cart_items):
+        """Тест: заказы с одинаковыми условиями разделяют скидку и доставку."""
+        first, second = (
+            OrderCreateDTO(1, [(1, 1)], FixedDiscountDTO(value=50.0), ExpressDeliveryDTO(),
+                           PayPalPaymentDTO(details="user@example.com"))
+            .to_model(sample_customer, sample_cart_items)
+            for _ in range(2)
+        )
+
+        assert first.discount is second.discount
+        assert first.delivery is second.delivery
+        assert first.payment is not second.payment
+
+
+class TestOrderResultDTO:
+    """Тесты для OrderResultDTO."""
+
+    def test_result_is_immutable(self, sample_customer, sample_cart_items):
+        """Тест: общий результат заказа нельзя изменить."""
+        dto = OrderResultDTO.from_model(Order(sample_customer, sample_cart_items))
+
+        assert isinstance(dto.items, tuple)
+        assert len(dto.items) == len(sample_cart_items)
+        with pytest.raises(FrozenInstanceError):
+            dto.total_amount = 0.0
+        with pytest.raises(FrozenInstanceError):
+            dto.items[0].quantity = 100
+
 
 class TestDTOEdgeCases:
     """Тесты крайних случаев для DTO."""
@@ -0,0 +1,200 @@
+"""Тесты для асинхронного фасада над сервисами."""
+import asyncio
+import contextlib
+import io
+import threading
+import time
+
+import pytest
+from src.schemas import (
+    CreditCardPaymentDTO,
+    CustomerDTO,
+    OrderCreateDTO,
+    PercentageDiscountDTO,
+    ProductDTO,
+    StandardDeliveryDTO,
+)
+from src.servises import ApplicationService, AsyncApplicationService
+
+
+@pytest.fixture
+def app():
+    """Приложение с одним продуктом и одним клиентом."""
+    app = ApplicationService()
+    app.product_service.create_product(ProductDTO(1, "Laptop", 1000.0))
+    app.customer_service.create_customer(CustomerDTO(1, "John Doe", "john@example.com", ()))
+    return app
+
+
+def run(app, scenario):
+    """Выполнить сценарий с фасадом в новом цикле событий."""
+    async def main():
+        async with AsyncApplicationService(app, max_workers=2) as service:
+            return await scenario(service)
+    return asyncio.run(main())
+
+
+class TestAsyncApplicationService:
+    """Тесты для асинхронного фасада."""
+
+    def test_reads_by_id_run_inline(self, app):
+        """Тест: чтение по id выполняется в потоке цикла событий."""
+        threads = []
+        get_product = app.product_service.get_product
+        app.product_service.get_product = lambda product_id: (
+            threads.append(threading.current_thread()), get_product(product_id))[1]
+
+        product = run(app, lambda service: service.get_product(1))
+
+        assert product == ProductDTO(1, "Laptop", 1000.0)
+        assert threads == [threading.main_thread()]
+
+    def test_orders_run_in_pool(self, app):
+        """Тест: оформление заказа с оплатой выполняется в пуле потоков."""
+        threads = []
+        create_order = app.order_service.create_order
+        app.order_service.create_order = lambda dto: (
+            threads.append(threading.current_thread()), create_order(dto))[1]
+        dto = OrderCreateDTO(1, [(1, 2)], PercentageDiscountDTO(value=5.0), StandardDeliveryDTO(),
+                             CreditCardPaymentDTO(details="4111-1111-1111-1111"))
+
+        async def scenario(service):
+            order = await service.create_order(dto)
+            return order, await service.get_order(order.order_id)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            created, loaded = run(app, scenario)
+
+        assert created == loaded
+        assert created.total_amount == 1905.0
+        assert threads[0] is not threading.main_thread()
+
+    def test_identical_scans_coalesced(self, app):
+        """Тест: одинаковые одновременные запросы выполняются один раз."""
+        calls = []
+        get_all = app.product_service.get_all_products
+
+        def slow_get_all():
+            calls.append(threading.current_thread())
+            time.sleep(0.05)
+            return get_all()
+
+        app.product_service.get_all_products = slow_get_all
+
+        async def scenario(service):
+            results = await asyncio.gather(*(service.get_all_products() for _ in range(10)))
+            return results, await service.get_all_products()
+
+        results, later = run(app, scenario)
+
+        assert len(calls) == 2
+        assert threading.main_thread() not in calls
+        assert all(result is results[0] for result in results)
+        assert later == results[0]
+
+    def test_category_scan_runs_in_pool(self, app):
+        """Тест: выборка по категории выполняется в пуле потоков."""
+        app.category_repo.create("Electronics")
+        app.product_service.add_product_to_category(1, "Electronics")
+        threads = []
+        by_category = app.product_service.get_products_by_category
+        app.product_service.get_products_by_category = lambda name: (
+            threads.append(threading.current_thread()), by_category(name))[1]
+
+        products = run(app, lambda service: service.get_products_by_category("Electronics"))
+
+        assert products == [ProductDTO(1, "Laptop", 1000.0)]
+        assert len(threads) == 1
+        assert threads[0] is not threading.main_thread()
+
+    def test_scan_after_write_sees_the_write(self, app):
+        """Тест: запрос после записи не присоединяется к начатому до неё."""
+        release = threading.Event()
+        get_orders = app.order_service.get_customer_orders
+
+        def stale_get_orders(customer_id):
+            orders = get_orders(customer_id)
+            assert release.wait(5)
+            return orders
+
+        app.order_service.get_customer_orders = stale_get_orders
+        dto = OrderCreateDTO(1, [(1, 1)], PercentageDiscountDTO(value=5.0), StandardDeliveryDTO(),
+                             CreditCardPaymentDTO(details="4111-1111-1111-1111"))
+
+        async def scenario(service):
+            before = asyncio.ensure_future(service.get_customer_orders(1))
+            await asyncio.sleep(0.01)
+            order = await service.create_order(dto)
+            after = asyncio.ensure_future(service.get_customer_orders(1))
+            await asyncio.sleep(0)
+            release.set()
+            return order, await before, await after
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            order, before, after = run(app, scenario)
+
+        assert before == []
+        assert after == [order]
+
+    def test_concurrent_writes_keep_emails_unique(self, app):
+        """Тест: одновременные создания и смены email не дают дубликатов."""
+        find_by_email = app._customer_repo.find_by_email
+        app._customer_repo.find_by_email = lambda email: (find_by_email(email), time.sleep(0.01))[0]
+        app.customer_service.create_customer(CustomerDTO(2, "Jane Roe", "jane@example.com", ()))
+
+        async def scenario(service):
+            creates = await asyncio.gather(
+                *(service.create_customer(CustomerDTO(i, "Copy", "same@example.com", ()))
+                  for i in range(10, 14)),
+                return_exceptions=True,
+            )
+            updates = await asyncio.gather(
+                service.update_customer_email(1, "taken@example.com"),
+                service.update_customer_email(2, "taken@example.com"),
+                return_exceptions=True,
+            )
+            return creates, updates
+
+        creates, updates = run(app, scenario)
+
+        assert sum(not isinstance(result, ValueError) for result in creates) == 1
+        assert sum(not isinstance(result, ValueError) for result in updates) == 1
+        emails = [customer.email for customer in app.customer_service.get_all_customers()]
+        assert len(emails) == len(set(emails))
+
+    def test_cancelled_caller_does_not_cancel_others(self, app):
+        """Тест: отмена одного ожидающего не отменяет общий запрос."""
+        app.get_statistics = lambda: time.sleep(0.05) or {"total_products": 1}
+
+        async def scenario(service):
+            first = asyncio.ensure_future(service.get_statistics())
+            second = asyncio.ensure_future(service.get_statistics())
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        assert run(app, scenario) == {"total_products": 1}
+
+    def test_errors_reach_every_caller(self, app):
+        """Тест: ошибка общего запроса получают все ожидающие."""
+        def failing(email):
+            time.sleep(0.02)
+            raise ValueError("storage unavailable")
+
+        app.customer_service.get_customer_by_email = failing
+
+        async def scenario(service):
+            return await asyncio.gather(
+                *(service.get_customer_by_email("john@example.com") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        errors = run(app, scenario)
+
+        assert len(errors) == 3
+        assert all(isinstance(error, ValueError) for error in errors)
+
+    def test_invalid_worker_count(self, app):
+        """Тест: число потоков должно быть положительным."""
+        with pytest.raises(ValueError, match="Worker count must be positive"):
+            AsyncApplicationService(app, max_workers=0)
@@ -2,7 +2,8 @@
 import pytest
 from src.servises.cart_service import CartService
 from src.repositories.product_repo import ProductRepository
-from src.schemas import CartItemDTO, ProductDTO
+from src.schemas import CartItemDTO, ProductDTO, AddressDTO
+from src.models.delivery_rates import DeliveryRateEngine
 from src.models.product import Product
 
 
@@ -57,7 +58,8 @@ class TestCartService:
         cart_item2 = cart_service.add_item(1, 3)
         assert cart_item2.quantity == 5  # 2 + 3
         assert len(cart_service.get_items()) == 1  # Все еще один элемент
-        assert cart_item1 is cart_item2  # Тот же объект
+        assert cart_item1.quantity == 2  # Позиции неизменяемы, в корзине новая
+        assert cart_service.get_items()[0] is cart_item2
 
     def test_add_different_items(self, cart_service, populated_product_repository):
         """Тест добавления разных товаров."""
@@ -197,3 +199,23 @@ class TestCartService:
         assert len(cart_service.get_items()) == 2
         final_total = 1000.0 + 25.0  # 1025
         assert cart_service.get_total() == final_total
+
+    def test_quote_delivery(self, populated_product_repository):
+        """Тест расчета доставки корзины по таблице тарифов."""
+        engine = DeliveryRateEngine()
+        engine.add_zone("domestic", "USA")
+        engine.add_rate("standard", "domestic", 5.0, 7.0)
+        engine.add_rate("standard", "default", 5.0, 20.0)
+        engine.set_item_surcharge("standard", 1.0)
+        cart = CartService(populated_product_repository, engine)
+        cart.add_item(2, 3)  # Mouse x3
+
+        address = AddressDTO("1 Main St", "Chicago", "USA")
+        assert cart.quote_delivery("standard", address) == 10.0
+        assert cart.quote_delivery("standard") == 23.0
+        assert cart.get_total_with_delivery("standard", address) == 85.0
+
+    def test_quote_delivery_without_engine(self, cart_service):
+        """Тест расчета доставки без движка тарифов."""
+        with pytest.raises(ValueError, match="Delivery rate engine is not configured"):
+            cart_service.quote_delivery("standard")
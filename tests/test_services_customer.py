@@ -0,0 +1,180 @@
+"""Тесты для сервиса клиентов."""
+import sys
+import threading
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+from src.servises.customer_service import CustomerService
+from src.schemas import AddressDTO, CustomerDTO, SyncResultDTO
+from src.utils.cache import LRUCache
+
+
+@pytest.fixture
+def customer_dto():
+    """DTO клиента с двумя адресами."""
+    return CustomerDTO(
+        id=1, name="John Doe", email="john@example.com",
+        addresses=[
+            AddressDTO("123 Main St", "New York", "USA"),
+            AddressDTO("456 Oak Ave", "Los Angeles", "USA"),
+        ],
+    )
+
+
+@pytest.fixture
+def cached_service(customer_repository, customer_dto):
+    """Сервис клиентов с кэшем представлений."""
+    service = CustomerService(customer_repository, LRUCache(maxsize=100))
+    service.create_customer(customer_dto)
+    return service
+
+
+class TestCustomerService:
+    """Тесты для сервиса клиентов."""
+
+    def test_create_and_get_customer(self, customer_service, customer_dto):
+        """Тест создания и получения клиента."""
+        customer_service.create_customer(customer_dto)
+
+        result = customer_service.get_customer(1)
+
+        assert result == customer_dto
+        assert isinstance(result.addresses, tuple)
+
+    def test_duplicate_email(self, customer_service, customer_dto):
+        """Тест создания клиента с занятым email."""
+        customer_service.create_customer(customer_dto)
+
+        with pytest.raises(ValueError, match="already exists"):
+            customer_service.create_customer(
+                CustomerDTO(id=2, name="Jane", email="john@example.com", addresses=[]))
+
+    def test_view_is_immutable(self, customer_service, customer_dto):
+        """Тест неизменяемости представления клиента."""
+        result = customer_service.create_customer(customer_dto)
+
+        with pytest.raises(FrozenInstanceError):
+            result.email = "other@example.com"
+
+
+class TestCustomerServiceCache:
+    """Тесты для кэша представлений клиентов."""
+
+    def test_repeated_reads_share_view(self, cached_service):
+        """Тест повторного чтения без пересборки."""
+        first = cached_service.get_customer(1)
+        second = cached_service.get_customer_by_email("john@example.com")
+
+        assert first is second
+
+    def test_email_change_shares_addresses(self, cached_service):
+        """Тест: смена email не копирует адреса."""
+        before = cached_service.get_customer(1)
+
+        after = cached_service.update_customer_email(1, "new@example.com")
+
+        assert after.email == "new@example.com"
+        assert after.addresses is before.addresses
+        assert before.email == "john@example.com"
+        assert cached_service.get_customer(1) is after
+
+    def test_add_address_reuses_existing_addresses(self, cached_service):
+        """Тест: новый адрес добавляется к общим адресам."""
+        before = cached_service.get_customer(1)
+
+        after = cached_service.add_address_to_customer(
+            1, AddressDTO("789 Pine Rd", "Chicago", "USA"))
+
+        assert len(after.addresses) == 3
+        assert all(a is b for a, b in zip(after.addresses, before.addresses))
+        assert len(before.addresses) == 2
+        assert cached_service.get_customer(1) is after
+
+    def test_direct_model_change_rebuilds_view(self, cached_service, customer_repository):
+        """Тест: изменение модели в обход сервиса сбрасывает представление."""
+        before = cached_service.get_customer(1)
+        customer_repository.get_by_id(1).add_address("1 Elm St", "Boston", "USA")
+
+        after = cached_service.get_customer(1)
+
+        assert after is not before
+        assert len(after.addresses) == 3
+
+    def test_concurrent_writes_keep_every_address(self, cached_service):
+        """Тест: одновременные изменения клиента не теряют адреса в кэше."""
+        cached_service.get_customer(1)
+        start = threading.Barrier(3)
+
+        def add_addresses(prefix):
+            start.wait()
+            for i in range(500):
+                cached_service.add_address_to_customer(1, AddressDTO(f"{prefix} {i}", "Boston", "USA"))
+
+        def change_email():
+            start.wait()
+            for i in range(500):
+                cached_service.update_customer_email(1, f"john{i}@example.com")
+                cached_service.get_customer(1)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=add_addresses, args=(prefix,)) for prefix in "AB"]
+            threads.append(threading.Thread(target=change_email))
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        view = cached_service.get_customer(1)
+        assert len(view.addresses) == 2 + 1000
+        assert view.email == "john499@example.com"
+
+    def test_recreated_customer_is_not_stale(self, cached_service, customer_dto):
+        """Тест: удалённый и пересозданный клиент читается заново."""
+        cached_service.get_customer(1)
+        cached_service.delete_customer(1)
+        cached_service.create_customer(CustomerDTO(
+            id=1, name="Jane Roe", email="jane@example.com", addresses=[]))
+
+        assert cached_service.get_customer(1).name == "Jane Roe"
+
+
+class TestCustomerServiceSync:
+    """Тесты для инкрементальной синхронизации клиентов."""
+
+    def test_sync_customers(self, cached_service, customer_dto):
+        """Тест вставки, изменения и удаления клиентов."""
+        cached_service.create_customer(CustomerDTO(
+            id=2, name="Jane Roe", email="jane@example.com", addresses=[]))
+        before = cached_service.get_customer(1)
+        moved = replace(customer_dto, addresses=[AddressDTO("1 New St", "Boston", "USA")])
+        new = CustomerDTO(id=3, name="Max Kim", email="max@example.com", addresses=[])
+
+        result = cached_service.sync_customers([moved, new])
+
+        assert result == SyncResultDTO(inserted=1, updated=1, deleted=1)
+        assert cached_service.get_customer(1) == moved
+        assert cached_service.get_customer(1) is not before
+        assert cached_service.get_customer(2) is None
+        assert cached_service.get_customer(3) == new
+
+    def test_sync_unchanged_keeps_view(self, cached_service, customer_dto):
+        """Тест: неизменённый клиент сохраняет своё представление."""
+        before = cached_service.get_customer(1)
+
+        result = cached_service.sync_customers([customer_dto])
+
+        assert result == SyncResultDTO(unchanged=1)
+        assert cached_service.get_customer(1) is before
+
+    def test_sync_removes_all_addresses(self, cached_service, customer_dto):
+        """Тест: клиент без адресов в новом списке теряет адреса и в представлении."""
+        cached_service.get_customer(1)
+        homeless = replace(customer_dto, addresses=[])
+
+        assert cached_service.sync_customers([homeless]) == SyncResultDTO(updated=1)
+        assert cached_service.get_customer(1).addresses == ()
+        assert cached_service.sync_customers([homeless]) == SyncResultDTO(unchanged=1)
@@ -0,0 +1,201 @@
+"""Тесты для сервиса заказов."""
+import contextlib
+import io
+import json
+import threading
+
+import pytest
+from src.enum import OrderStatus
+from src.servises.order_service import OrderService
+from src.servises.app_service import ApplicationService
+from src.schemas import (
+    AddressDTO,
+    CreditCardPaymentDTO,
+    CustomerDTO,
+    OrderCreateDTO,
+    PercentageDiscountDTO,
+    ProductDTO,
+    StandardDeliveryDTO,
+)
+from src.utils.singleflight import SingleFlight
+
+
+def make_order_dto(customer_id, items):
+    """DTO заказа со скидкой 5%, стандартной доставкой и оплатой картой."""
+    return OrderCreateDTO(
+        customer_id=customer_id,
+        items=items,
+        discount=PercentageDiscountDTO(value=5.0),
+        delivery=StandardDeliveryDTO(),
+        payment=CreditCardPaymentDTO(details="4111-1111-1111-1111"),
+    )
+
+
+@pytest.fixture
+def order_ids(order_service, populated_product_repository, populated_customer_repository):
+    """Пять оформленных заказов в статусе PROCESSING."""
+    ids = []
+    for _ in range(5):
+        result = order_service.create_order(make_order_dto(1, [(1, 1), (2, 2)]))
+        ids.append(result.order_id)
+    return ids
+
+
+class TestOrderServiceTransitions:
+    """Тесты для пакетной смены статусов заказов."""
+
+    def test_transition_orders(self, order_service, order_ids):
+        """Тест пакетной отправки и доставки заказов."""
+        assert order_service.transition_orders(order_ids, OrderStatus.SHIPPED) == order_ids
+        assert order_service.transition_orders(order_ids[:2], OrderStatus.DELIVERED) == order_ids[:2]
+
+        counts = order_service.count_orders_by_status()
+        assert counts[OrderStatus.SHIPPED] == 3
+        assert counts[OrderStatus.DELIVERED] == 2
+        assert order_service.get_order(order_ids[0]).status == OrderStatus.DELIVERED
+
+    def test_invalid_batch_changes_nothing(self, order_service, order_ids):
+        """Тест: ошибка в пакете не меняет ни один заказ."""
+        order_service.transition_orders(order_ids[:1], OrderStatus.CANCELLED)
+
+        with pytest.raises(ValueError, match="from cancelled to shipped.*id 999 not found"):
+            order_service.transition_orders(order_ids + [999], OrderStatus.SHIPPED)
+
+        counts = order_service.count_orders_by_status()
+        assert counts[OrderStatus.PROCESSING] == 4
+        assert counts[OrderStatus.SHIPPED] == 0
+
+    def test_skip_invalid(self, order_service, order_ids):
+        """Тест пропуска недопустимых переходов."""
+        order_service.transition_orders(order_ids[:1], OrderStatus.CANCELLED)
+
+        changed = order_service.transition_orders(
+            order_ids + [999], OrderStatus.SHIPPED, skip_invalid=True)
+
+        assert changed == order_ids[1:]
+
+    def test_already_in_status_is_not_changed(self, order_service, order_ids):
+        """Тест повторного перевода в тот же статус."""
+        order_service.transition_orders(order_ids[:2], OrderStatus.SHIPPED)
+
+        assert order_service.transition_orders(order_ids, OrderStatus.SHIPPED) == order_ids[2:]
+
+    def test_concurrent_cancel_waits_for_batch(self, order_service, order_repository, order_ids):
+        """Тест: отмена во время пакетной смены статусов ждёт её завершения."""
+        errors = []
+
+        def cancel():
+            try:
+                order_service.cancel_order(order_ids[0])
+            except ValueError as error:
+                errors.append(error)
+
+        canceller = threading.Thread(target=cancel)
+        get_many = order_repository.get_many
+
+        def get_many_then_cancel(ids):
+            orders = get_many(ids)
+            canceller.start()
+            canceller.join(0.1)
+            return orders
+
+        order_repository.get_many = get_many_then_cancel
+
+        assert order_service.transition_orders(order_ids, OrderStatus.SHIPPED) == order_ids
+        canceller.join()
+
+        assert "Cannot change order status" in str(errors[0])
+        assert order_service.count_orders_by_status()[OrderStatus.SHIPPED] == 5
+
+    def test_cancel_delivered_order(self, order_service, order_ids):
+        """Тест отмены доставленного заказа."""
+        order_service.transition_orders(order_ids[:1], OrderStatus.SHIPPED)
+        order_service.transition_orders(order_ids[:1], OrderStatus.DELIVERED)
+
+        with pytest.raises(ValueError, match="Cannot change order status"):
+            order_service.cancel_order(order_ids[0])
+
+    def test_statistics_use_status_counts(self, application_service):
+        """Тест статистики по счётчикам статусов."""
+        application_service.initialize_sample_data()
+        application_service.order_service.create_order(make_order_dto(1, [(1, 1)]))
+        application_service.order_service.cancel_order(1)
+
+        stats = application_service.get_statistics()
+
+        assert stats['total_orders'] == 1
+        assert stats['cancelled_orders'] == 1
+        assert stats['active_orders'] == 0
+
+
+class TestOrderServiceExport:
+    """Тесты для выгрузки заказов через сервис."""
+
+    def test_export_uses_snapshot_status(self, order_service, populated_product_repository,
+                                         populated_customer_repository, tmp_path):
+        """Тест выгрузки всех заказов со статусами."""
+        for _ in range(3):
+            order_service.create_order(make_order_dto(1, [(1, 1)]))
+        order_service.cancel_order(2)
+
+        report = order_service.export_orders(tmp_path, "jsonl", "status")
+
+        assert report.orders == 3
+        cancelled = [json.loads(line) for line in open(tmp_path / "status=cancelled" / "orders.jsonl")]
+        assert [record["order_id"] for record in cancelled] == [2]
+
+
+class TestOrderServiceSingleFlight:
+    """Тесты для общих одновременных чтений заказов."""
+
+    def test_cancel_during_read_starts_new_lookup(
+        self, order_repository, populated_product_repository, populated_customer_repository
+    ):
+        """Тест: чтение после отмены заказа видит новый статус."""
+        service = OrderService(order_repository, populated_product_repository,
+                               populated_customer_repository, single_flight=SingleFlight())
+        with contextlib.redirect_stdout(io.StringIO()):
+            order_id = service.create_order(make_order_dto(1, [(1, 1)])).order_id
+        entered, release = threading.Event(), threading.Event()
+        get_by_id = order_repository.get_by_id
+
+        def slow_get_by_id(order_id):
+            entered.set()
+            assert release.wait(5)
+            return get_by_id(order_id)
+
+        order_repository.get_by_id = slow_get_by_id
+        reader = threading.Thread(target=service.get_order, args=(order_id,))
+        reader.start()
+        assert entered.wait(5)
+        order_repository.get_by_id = get_by_id
+
+        service.cancel_order(order_id)
+        assert service.get_order(order_id).status is OrderStatus.CANCELLED
+
+        release.set()
+        reader.join()
+        assert service.single_flight.info().executed == 2
+
+
+class TestOrderServiceDeliveryRates:
+    """Тесты для тарифов доставки в заказах."""
+
+    def test_order_charges_cart_quote(self):
+        """Тест: заказ оплачивает ту же доставку, что показала корзина."""
+        app = ApplicationService()
+        app.product_service.create_product(ProductDTO(1, "Laptop", 1000.0, 2.0))
+        app.customer_service.create_customer(CustomerDTO(
+            1, "Hans Muller", "hans@example.com", [AddressDTO("1 Hauptstr", "Berlin", "Germany")]))
+        app.delivery_engine.add_zone("eu", "Germany")
+        app.delivery_engine.add_rate("standard", "eu", 5.0, 8.0)
+        app.delivery_engine.set_item_surcharge("standard", 1.0)
+        cart = app.new_cart()
+        cart.add_item(1, 2)
+        quote = cart.quote_delivery("standard", AddressDTO("1 Hauptstr", "Berlin", "Germany"))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            order = app.order_service.create_order(make_order_dto(1, [(1, 2)]))
+
+        assert quote == 10.0
+        assert order.delivery_cost == quote
@@ -1,7 +1,17 @@
 """Тесты для сервисов продуктов."""
+import json
+import threading
+from dataclasses import FrozenInstanceError, asdict
+
 import pytest
 from src.servises.product_service import ProductService
-from src.schemas import ProductDTO
+from src.servises.app_service import ApplicationService
+from src.schemas import ProductDTO, SyncResultDTO
+from src.repositories.category_repo import CategoryRepository
+from src.repositories.product_repo import ProductRepository
+from src.utils.cache import LRUCache
+from src.utils.singleflight import SingleFlight
+from src.utils.validation import ValidationError
 
 
 class TestProductService:
@@ -144,3 +154,214 @@ class TestProductService:
         product_service.update_price(1, 0.0)
         updated = product_service.get_product(1)
         assert updated.price == 0.0
+
+
+class TestProductServiceCategories:
+    """Тесты для работы сервиса продуктов с категориями."""
+
+    @pytest.fixture
+    def service(self, product_repository):
+        """Сервис продуктов с репозиторием категорий."""
+        category_repository = CategoryRepository()
+        category_repository.create("Electronics")
+        service = ProductService(product_repository, category_repository)
+        service.create_product(ProductDTO(product_id=1, name="Laptop", price=1000.0))
+        service.create_product(ProductDTO(product_id=2, name="Mouse", price=25.0))
+        return service
+
+    def test_get_products_by_category(self, service):
+        """Тест получения продуктов категории."""
+        service.add_product_to_category(2, "Electronics")
+        service.add_product_to_category(1, "Electronics")
+
+        products = service.get_products_by_category("Electronics")
+
+        assert [p.product_id for p in products] == [2, 1]
+        assert service.get_product_categories(1) == ["Electronics"]
+
+    def test_add_nonexistent_product_to_category(self, service):
+        """Тест добавления несуществующего продукта в категорию."""
+        with pytest.raises(ValueError, match="Product with id 999 not found"):
+            service.add_product_to_category(999, "Electronics")
+
+    def test_delete_product_removes_from_categories(self, service):
+        """Тест удаления продукта из категорий при удалении продукта."""
+        service.add_product_to_category(1, "Electronics")
+
+        service.delete_product(1)
+
+        assert service.get_products_by_category("Electronics") == []
+        assert service.get_product_categories(1) == []
+
+    def test_categories_not_configured(self, product_service):
+        """Тест работы без репозитория категорий."""
+        with pytest.raises(ValueError, match="Category repository is not configured"):
+            product_service.get_products_by_category("Electronics")
+
+
+class TestProductServiceCache:
+    """Тесты для кэша DTO продуктов."""
+
+    @pytest.fixture
+    def service(self, product_repository):
+        """Сервис продуктов с кэшем."""
+        service = ProductService(product_repository, cache=LRUCache(maxsize=100))
+        service.create_product(ProductDTO(product_id=1, name="Laptop", price=1000.0))
+        return service
+
+    def test_repeated_reads_hit_cache(self, service):
+        """Тест повторного чтения из кэша."""
+        first = service.get_product(1)
+        second = service.get_product(1)
+
+        assert first is second
+        assert service.cache.info().hits == 1
+        assert service.cache.info().misses == 1
+
+    def test_cached_dto_is_immutable(self, service):
+        """Тест неизменяемости закэшированного DTO."""
+        dto = service.get_product(1)
+
+        with pytest.raises(FrozenInstanceError):
+            dto.price = 1.0
+
+    def test_update_price_invalidates(self, service):
+        """Тест инвалидации при изменении цены."""
+        service.get_product(1)
+        service.update_price(1, 900.0)
+
+        assert service.get_product(1).price == 900.0
+
+    def test_delete_product_invalidates(self, service):
+        """Тест инвалидации при удалении продукта."""
+        service.get_product(1)
+        service.delete_product(1)
+
+        assert service.get_product(1) is None
+
+    def test_cache_shared_with_cart_and_orders(self):
+        """Тест общего кэша для корзины и заказов."""
+        app = ApplicationService(product_cache_size=100)
+        app.product_service.create_product(ProductDTO(product_id=1, name="Laptop", price=1000.0))
+        cart = app.new_cart()
+
+        cart.add_item(1, 1)
+        app.product_service.update_price(1, 800.0)
+        cart.add_item(1, 1)
+
+        assert app.product_service.get_product(1).price == 800.0
+        assert app.product_service.cache.info().hits >= 1
+
+
+class TestProductServiceSync:
+    """Тесты для инкрементальной синхронизации каталога."""
+
+    @pytest.fixture
+    def service(self):
+        """Сервис с тремя продуктами, категорией и кэшем."""
+        category_repository = CategoryRepository()
+        category_repository.create("Electronics")
+        service = ProductService(ProductRepository(), category_repository, LRUCache(maxsize=100))
+        for product_id, name, price in [(1, "Laptop", 1000.0), (2, "Mouse", 25.0), (3, "Pad", 5.0)]:
+            service.create_product(ProductDTO(product_id, name, price))
+        service.add_product_to_category(1, "Electronics")
+        return service
+
+    def test_create_duplicate_product(self, service):
+        """Тест: повторное создание продукта с тем же id запрещено."""
+        with pytest.raises(ValueError, match="Product with id 1 already exists"):
+            service.create_product(ProductDTO(1, "Other", 1.0))
+
+    def test_sync_applies_only_changes(self, service):
+        """Тест применения только вставок, изменений и удалений."""
+        service.get_product(1)
+
+        result = service.sync_products([
+            ProductDTO(1, "Laptop", 900.0),
+            ProductDTO(2, "Mouse", 25.0),
+            ProductDTO(4, "Cable", 3.0, 0.1),
+        ])
+
+        assert result == SyncResultDTO(inserted=1, updated=1, deleted=1, unchanged=1)
+        assert service.get_product(1).price == 900.0
+        assert service.get_product(3) is None
+        assert service.get_product(4) == ProductDTO(4, "Cable", 3.0, 0.1)
+        assert [p.price for p in service.get_products_by_category("Electronics")] == [900.0]
+
+    def test_sync_same_listing_is_noop(self, service):
+        """Тест: повторная синхронизация ничего не меняет."""
+        listing = service.get_all_products()
+
+        result = service.sync_products(listing)
+
+        assert result == SyncResultDTO(unchanged=3)
+
+
+class TestReloadCatalog:
+    """Тесты для перезагрузки каталога из файлов."""
+
+    def test_reload_catalog(self, tmp_path):
+        """Тест инкрементальной перезагрузки продуктов и клиентов."""
+        app = ApplicationService()
+        app.initialize_sample_data()
+        products = [asdict(p) for p in app.product_service.get_all_products()]
+        products[0] = {**products[0], "price": 1.0}
+        (tmp_path / "products.json").write_text(json.dumps(products[:-1]))
+
+        results = app.reload_catalog(tmp_path, customers=None)
+
+        assert results == {"products": SyncResultDTO(updated=1, deleted=1, unchanged=3)}
+        assert app.product_service.get_product(products[0]["product_id"]).price == 1.0
+
+    def test_invalid_file_changes_nothing(self, tmp_path):
+        """Тест: файл с ошибками не применяется."""
+        app = ApplicationService()
+        app.initialize_sample_data()
+        (tmp_path / "products.json").write_text(json.dumps([
+            {"product_id": 1, "name": "Laptop", "price": -1.0},
+        ]))
+
+        with pytest.raises(ValidationError, match="record 0: price: must be >= 0"):
+            app.reload_catalog(tmp_path, customers=None)
+        assert len(app.product_service.get_all_products()) == 5
+
+
+class TestProductServiceSingleFlight:
+    """Тесты для общих одновременных чтений продуктов."""
+
+    def test_update_during_read_starts_new_lookup(self):
+        """Тест: чтение после изменения не присоединяется к старому."""
+        repository = ProductRepository()
+        service = ProductService(repository, single_flight=SingleFlight())
+        service.create_product(ProductDTO(1, "Laptop", 1000.0))
+        entered, release = threading.Event(), threading.Event()
+        get_by_id = repository.get_by_id
+
+        def slow_get_by_id(product_id):
+            entered.set()
+            assert release.wait(5)
+            return get_by_id(product_id)
+
+        repository.get_by_id = slow_get_by_id
+        reader = threading.Thread(target=service.get_product, args=(1,))
+        reader.start()
+        assert entered.wait(5)
+        repository.get_by_id = get_by_id
+
+        service.update_price(1, 900.0)
+        assert service.get_product(1).price == 900.0
+
+        release.set()
+        reader.join()
+        assert service.single_flight.info().executed == 2
+
+    def test_application_option(self):
+        """Тест: ApplicationService включает общие чтения по флагу."""
+        app = ApplicationService(single_flight=True)
+        app.product_service.create_product(ProductDTO(1, "Laptop", 1000.0))
+
+        assert app.product_service.get_product(1).name == "Laptop"
+        assert app.order_service.get_order(1) is None
+        assert app.product_service.single_flight.info().executed == 1
+        assert app.order_service.single_flight.info().executed == 1
+        assert ApplicationService().product_service.single_flight is None
@@ -0,0 +1,70 @@
+"""Тесты для сервиса промо-акций."""
+import pytest
+from src.servises.promotion_service import PromotionService
+from src.repositories.category_repo import CategoryRepository
+from src.models import Order, CartItem, CategoryRule, BuyXGetYRule, Money
+
+
+@pytest.fixture
+def promotion_service(populated_product_repository):
+    """Сервис промо-акций с категорией Accessories для мыши."""
+    category_repository = CategoryRepository()
+    category_repository.create("Accessories")
+    category_repository.add_product(
+        "Accessories", populated_product_repository.get_by_id(2))
+    return PromotionService(populated_product_repository, category_repository)
+
+
+class TestPromotionService:
+    """Тесты для сервиса промо-акций."""
+
+    def test_add_duplicate_rule(self, promotion_service):
+        """Тест добавления правила с существующим идентификатором."""
+        promotion_service.add_rule(CategoryRule("acc", "Accessories", 10.0))
+
+        with pytest.raises(ValueError, match="Promotion rule acc already exists"):
+            promotion_service.add_rule(CategoryRule("acc", "Accessories", 20.0))
+
+    def test_remove_unknown_rule(self, promotion_service):
+        """Тест удаления несуществующего правила."""
+        with pytest.raises(ValueError, match="Promotion rule nope not found"):
+            promotion_service.remove_rule("nope")
+
+    def test_evaluate_items_uses_categories(self, promotion_service):
+        """Тест применения скидки по категории из репозитория категорий."""
+        promotion_service.add_rule(CategoryRule("acc", "Accessories", 20.0))
+
+        result = promotion_service.evaluate_items([(1, 1), (2, 2)])
+
+        assert result.amount == Money(1000)
+        assert result.applied_rules == ("acc",)
+
+    def test_evaluate_items_unknown_product(self, promotion_service):
+        """Тест оценки заказа с несуществующим продуктом."""
+        with pytest.raises(ValueError, match="Product with id 999 not found"):
+            promotion_service.evaluate_items([(999, 1)])
+
+    def test_recompiles_after_changes(self, promotion_service):
+        """Тест перекомпиляции индекса после изменения правил."""
+        promotion_service.add_rule(CategoryRule("acc", "Accessories", 20.0))
+        compiled = promotion_service.compile()
+        assert promotion_service.compile() is compiled
+
+        promotion_service.remove_rule("acc")
+
+        assert promotion_service.compile() is not compiled
+        assert promotion_service.evaluate_items([(2, 2)]).amount == Money()
+
+    def test_evaluate_batch_orders(self, promotion_service, populated_product_repository,
+                                   sample_customer):
+        """Тест пакетной оценки заказов."""
+        promotion_service.add_rule(BuyXGetYRule("mice", product_id=2, buy=1, get=1))
+        mouse = populated_product_repository.get_by_id(2)
+        orders = [
+            Order(sample_customer, [CartItem(mouse, 2)]),
+            Order(sample_customer, [CartItem(mouse, 1)]),
+        ]
+
+        results = promotion_service.evaluate_batch(orders)
+
+        assert [r.amount for r in results] == [Money(2500), Money()]
@@ -0,0 +1,101 @@
+"""Тесты для сервиса отчетов по заказам."""
+import pytest
+from src.servises import report_service
+from src.servises.report_service import (
+    ReportService, aggregate_orders, aggregate_payload, encode_orders
+)
+from src.models import (
+    Order, CartItem, Customer, Product,
+    PercentageDiscount, FixedDiscount, StandardDelivery, ExpressDelivery,
+)
+from src.enum import OrderStatus
+from src.schemas import OrderResultDTO
+
+
+@pytest.fixture
+def filled_order_repository(order_repository):
+    """Репозиторий с заказами двух клиентов в разных статусах."""
+    john = Customer(1, "John", "john@example.com")
+    jane = Customer(2, "Jane", "jane@example.com")
+    laptop = Product(1, "Laptop", 1000.0)
+    mouse = Product(2, "Mouse", 25.5)
+
+    specs = [
+        (john, [(laptop, 1), (mouse, 2)], PercentageDiscount(15.0), ExpressDelivery(),
+         OrderStatus.PROCESSING),
+        (jane, [(mouse, 3)], FixedDiscount(10.0), StandardDelivery(), OrderStatus.PROCESSING),
+        (jane, [(laptop, 2)], None, None, OrderStatus.CANCELLED),
+        (john, [(mouse, 1)], None, StandardDelivery(), OrderStatus.PENDING),
+    ]
+    for customer, lines, discount, delivery, status in specs:
+        order = Order(customer, [CartItem(p, q) for p, q in lines])
+        if discount:
+            order.discount = discount
+        if delivery:
+            order.delivery = delivery
+        order_repository.add(order)
+        order.status = status
+    return order_repository
+
+
+class TestReportService:
+    """Тесты для сервиса отчетов."""
+
+    def test_empty_repository(self, order_repository):
+        """Тест отчета по пустому репозиторию."""
+        report = ReportService(order_repository, workers=1).generate()
+
+        assert report.order_count == 0
+        assert report.total_revenue == 0.0
+        assert report.status_counts == {}
+
+    def test_report_matches_order_totals(self, filled_order_repository):
+        """Тест совпадения отчета с суммами заказов."""
+        report = ReportService(filled_order_repository, workers=1).generate()
+
+        active = [o for o in filled_order_repository.get_all()
+                  if o.status != OrderStatus.CANCELLED]
+        totals = {}
+        for order in active:
+            total = OrderResultDTO.from_model(order).total_amount
+            totals[order.customer.id] = round(totals.get(order.customer.id, 0) + total, 2)
+
+        assert report.order_count == 4
+        assert report.customer_spend == totals
+        assert report.total_revenue == round(sum(totals.values()), 2)
+        assert report.product_revenue == {1: 1000.0, 2: 153.0}
+        assert report.status_counts == {
+            OrderStatus.PROCESSING: 2,
+            OrderStatus.CANCELLED: 1,
+            OrderStatus.PENDING: 1,
+        }
+
+    def test_process_pool_matches_inline(self, filled_order_repository):
+        """Тест совпадения параллельного и последовательного расчета."""
+        inline = ReportService(filled_order_repository, workers=1, chunk_size=1).generate()
+        parallel = ReportService(filled_order_repository, workers=2, chunk_size=1).generate()
+
+        assert parallel == inline
+
+    def test_payload_pool_without_fork(self, filled_order_repository, monkeypatch):
+        """Тест: без fork рабочие процессы получают закодированные части."""
+        inline = ReportService(filled_order_repository, workers=1, chunk_size=1).generate()
+        monkeypatch.setattr(report_service.multiprocessing, 'get_all_start_methods',
+                            lambda: ['spawn'])
+
+        parallel = ReportService(filled_order_repository, workers=2, chunk_size=1).generate()
+
+        assert parallel == inline
+
+    def test_payload_roundtrip(self, filled_order_repository):
+        """Тест что частичные агрегаты считаются из компактного представления."""
+        payload = encode_orders(filled_order_repository.get_all())
+
+        assert isinstance(payload, bytes)
+        assert aggregate_payload(payload)[0] == 4
+        assert aggregate_payload(payload) == aggregate_orders(filled_order_repository.get_all())
+
+    def test_invalid_chunk_size(self, order_repository):
+        """Тест валидации размера чанка."""
+        with pytest.raises(ValueError, match="Chunk size must be positive"):
+            ReportService(order_repository, chunk_size=0)
@@ -0,0 +1,105 @@
+"""Тесты для LRU-кэша."""
+import pytest
+from src.utils.cache import LRUCache
+
+
+class FakeClock:
+    """Управляемые часы для проверки TTL."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    """Тесты для LRU-кэша."""
+
+    def test_get_and_put(self):
+        """Тест сохранения и чтения значения."""
+        cache = LRUCache(maxsize=2)
+        cache.put(1, "a")
+
+        assert cache.get(1) == "a"
+        assert cache.get(2) is None
+        assert cache.info()[:2] == (1, 1)
+
+    def test_least_recently_used_is_evicted(self):
+        """Тест вытеснения давно не использованного значения."""
+        cache = LRUCache(maxsize=2)
+        cache.put(1, "a")
+        cache.put(2, "b")
+        cache.get(1)
+        cache.put(3, "c")
+
+        assert 1 in cache
+        assert 2 not in cache
+        assert 3 in cache
+        assert cache.info().evictions == 1
+
+    def test_ttl_expiry(self):
+        """Тест истечения срока жизни записи."""
+        clock = FakeClock()
+        cache = LRUCache(maxsize=10, ttl=5.0, clock=clock)
+        cache.put(1, "a")
+
+        clock.now = 4.9
+        assert cache.get(1) == "a"
+        clock.now = 5.0
+        assert cache.get(1) is None
+        assert len(cache) == 0
+
+    def test_get_or_load(self):
+        """Тест чтения через кэш с загрузкой при промахе."""
+        cache = LRUCache(maxsize=10)
+        calls = []
+
+        def loader(key):
+            calls.append(key)
+            return key * 10 if key > 0 else None
+
+        assert cache.get_or_load(1, loader) == 10
+        assert cache.get_or_load(1, loader) == 10
+        assert cache.get_or_load(-1, loader) is None
+        assert cache.get_or_load(-1, loader) is None
+        assert calls == [1, -1, -1]
+
+    def test_load_racing_with_invalidation_is_not_cached(self):
+        """Тест: значение, загруженное во время инвалидации, не кэшируется."""
+        cache = LRUCache(maxsize=10)
+
+        def loader(key):
+            cache.invalidate(key)  # запись произошла во время чтения
+            return "stale"
+
+        assert cache.get_or_load(1, loader) == "stale"
+        assert 1 not in cache
+
+    def test_invalidate_and_clear(self):
+        """Тест инвалидации и очистки."""
+        cache = LRUCache(maxsize=10)
+        cache.put(1, "a")
+        cache.put(2, "b")
+
+        assert cache.invalidate(1) is True
+        assert cache.invalidate(1) is False
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_hit_ratio(self):
+        """Тест доли попаданий."""
+        cache = LRUCache(maxsize=10)
+        cache.put(1, "a")
+        cache.get(1)
+        cache.get(1)
+        cache.get(1)
+        cache.get(2)
+
+        assert cache.info().hit_ratio == 0.75
+
+    @pytest.mark.parametrize("kwargs", [{"maxsize": 0}, {"ttl": 0}])
+    def test_invalid_arguments(self, kwargs):
+        """Тест некорректных параметров кэша."""
+        with pytest.raises(ValueError):
+            LRUCache(**kwargs)
@@ -0,0 +1,191 @@
+"""Тесты для загрузки данных из JSON-файлов."""
+import bz2
+import gzip
+import json
+import lzma
+
+import pytest
+from src.schemas import ProductDTO
+from src.servises.app_service import ApplicationService
+from src.utils.data_loader import DataLoader, intern_customer
+from src.utils.synthetic import SyntheticDataGenerator
+from src.utils.validation import validator_for
+
+
+@pytest.fixture
+def partitioned_dir(tmp_path):
+    """Каталог с продуктами и клиентами, разбитыми на файлы."""
+    generator = SyntheticDataGenerator(seed=1)
+    for part in range(4):
+        generator.write_json(tmp_path / f"products-{part:04d}.json",
+                             generator.products(25, start_id=part * 25 + 1))
+    for part in range(2):
+        generator.write_json(tmp_path / f"customers-{part:04d}.json",
+                             generator.customers(10, start_id=part * 10 + 1))
+    (tmp_path / "notes.txt").write_text("not data")
+    return tmp_path
+
+
+class TestLoadFiles:
+    """Тесты для загрузки файлов по шаблону."""
+
+    def test_find_files_sorted(self, partitioned_dir):
+        """Тест поиска файлов по шаблону в порядке имён."""
+        names = [path.name for path in DataLoader(partitioned_dir).find_files("products-*.json")]
+
+        assert names == [f"products-{part:04d}.json" for part in range(4)]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_load_files_in_order(self, partitioned_dir, workers):
+        """Тест загрузки файлов в порядке имён в процессе и в пуле процессов."""
+        loaded = list(DataLoader(partitioned_dir).load_files("products-*.json", workers=workers))
+
+        assert [path.name for path, _ in loaded] == [f"products-{part:04d}.json" for part in range(4)]
+        ids = [record["product_id"] for _, records in loaded for record in records]
+        assert ids == list(range(1, 101))
+
+    def test_transform_runs_in_worker(self, partitioned_dir):
+        """Тест преобразования данных в рабочем процессе."""
+        validate = validator_for(ProductDTO).build_many
+
+        loaded = list(DataLoader(partitioned_dir).load_files("products-*.json", 2, validate))
+
+        dtos, failures = loaded[0][1]
+        assert failures == {}
+        assert dtos[0] == validator_for(ProductDTO).build(
+            json.loads((partitioned_dir / "products-0000.json").read_text())[0]
+        )
+
+    def test_stop_early(self, partitioned_dir):
+        """Тест досрочной остановки чтения."""
+        files = DataLoader(partitioned_dir).load_files("products-*.json", workers=2)
+
+        path, _ = next(files)
+        files.close()
+
+        assert path.name == "products-0000.json"
+
+    def test_no_matches(self, partitioned_dir):
+        """Тест шаблона без совпадений."""
+        assert list(DataLoader(partitioned_dir).load_files("orders-*.json")) == []
+
+
+class TestIngestFiles:
+    """Тесты для загрузки разбитых на файлы данных в сервисы."""
+
+    def test_ingest_files(self, partitioned_dir):
+        """Тест загрузки продуктов и клиентов с отчётом об ошибках."""
+        (partitioned_dir / "products-0004.json").write_text(json.dumps([
+            {"product_id": 101, "name": "Cable", "price": 5.0},
+            {"product_id": 102, "name": "Broken", "price": -1.0},
+        ]))
+        app = ApplicationService()
+
+        report = app.ingest_files(partitioned_dir, workers=2)
+
+        assert report["products"] == 101
+        assert report["customers"] == 20
+        assert report["rejected"] == {"products-0004.json": {1: ("price: must be >= 0",)}}
+        assert app.product_service.get_product(101).name == "Cable"
+        assert app.customer_service.get_customer(20) is not None
+
+    def test_duplicate_ids_are_reported(self, partitioned_dir):
+        """Тест: повторный id попадает в отчёт, остальная часть загружается."""
+        (partitioned_dir / "products-0004.json").write_text(json.dumps([
+            {"product_id": 5, "name": "Again", "price": 5.0},
+            {"product_id": 102, "name": "Broken", "price": -1.0},
+            {"product_id": 103, "name": "Adapter", "price": 7.0},
+        ]))
+        app = ApplicationService()
+
+        report = app.ingest_files(partitioned_dir, workers=1)
+
+        assert report["products"] == 101
+        assert report["rejected"] == {"products-0004.json": {
+            0: ("Product with id 5 already exists",),
+            1: ("price: must be >= 0",),
+        }}
+        assert app.product_service.get_product(5).name != "Again"
+        assert app.product_service.get_product(103).name == "Adapter"
+
+
+class TestCompressedFiles:
+    """Тесты для сжатых файлов и JSON Lines."""
+
+    RECORDS = [{"product_id": i, "name": f"Product {i}", "price": float(i)} for i in range(1, 51)]
+
+    @pytest.mark.parametrize("module, suffix", [
+        (gzip, ".gz"), (bz2, ".bz2"), (lzma, ".xz"),
+    ])
+    def test_load_compressed_json(self, tmp_path, module, suffix):
+        """Тест чтения сжатого JSON с определением формата по содержимому."""
+        (tmp_path / f"products.json{suffix}").write_bytes(
+            module.compress(json.dumps(self.RECORDS).encode())
+        )
+        # The suffix is not used for detection
+        (tmp_path / "renamed.json").write_bytes(module.compress(json.dumps(self.RECORDS).encode()))
+        loader = DataLoader(tmp_path)
+
+        assert loader.load_json(f"products.json{suffix}") == self.RECORDS
+        assert loader.load_json("renamed") == self.RECORDS
+
+    def test_json_lines(self, tmp_path):
+        """Тест потокового чтения сжатого JSON Lines."""
+        lines = "\n".join(json.dumps(record) for record in self.RECORDS) + "\n\n"
+        (tmp_path / "products.jsonl.gz").write_bytes(gzip.compress(lines.encode()))
+        loader = DataLoader(tmp_path)
+
+        records = loader.iter_records("products.jsonl.gz")
+
+        assert next(records) == self.RECORDS[0]
+        assert list(records) == self.RECORDS[1:]
+        assert loader.load_json("products.jsonl.gz") == self.RECORDS
+
+    def test_iter_records_from_array(self, tmp_path):
+        """Тест перебора записей обычного JSON-массива."""
+        (tmp_path / "products.json").write_text(json.dumps(self.RECORDS))
+
+        assert list(DataLoader(tmp_path).iter_records("products")) == self.RECORDS
+
+    def test_load_files_compressed(self, tmp_path):
+        """Тест загрузки сжатых файлов по шаблону."""
+        for part in range(2):
+            records = self.RECORDS[part * 25:(part + 1) * 25]
+            (tmp_path / f"products-{part}.json.gz").write_bytes(
+                gzip.compress(json.dumps(records).encode())
+            )
+
+        loaded = DataLoader(tmp_path).load_files("products-*.json*", workers=1)
+
+        assert [record for _, data in loaded for record in data] == self.RECORDS
+
+    def test_zstd_not_supported(self, tmp_path):
+        """Тест понятной ошибки для Zstandard."""
+        (tmp_path / "products.json.zst").write_bytes(b"\x28\xb5\x2f\xfd" + b"\x00" * 8)
+
+        with pytest.raises(ValueError, match="Zstandard"):
+            DataLoader(tmp_path).load_json("products.json.zst")
+
+
+class TestInternedStrings:
+    """Тесты для общих строк в загруженных клиентах."""
+
+    def test_load_customers_interns(self, tmp_path):
+        """Тест: повторяющиеся города и страны после загрузки - одни объекты."""
+        address = {"street": "1 Main St", "city": "New York", "country": "USA"}
+        (tmp_path / "customers.json").write_text(json.dumps([
+            {"id": 1, "name": "John Doe", "email": "a@example.com", "addresses": [address]},
+            {"id": 2, "name": "John Doe", "email": "b@example.com", "addresses": [address]},
+        ]))
+
+        first, second = DataLoader(tmp_path).load_customers()
+
+        assert first["addresses"][0]["city"] is second["addresses"][0]["city"]
+        assert first["addresses"][0]["country"] is second["addresses"][0]["country"]
+
+    def test_malformed_record_untouched(self):
+        """Тест: некорректные записи остаются без изменений."""
+        record = {"name": 5, "addresses": "nowhere"}
+
+        assert intern_customer(record) == {"name": 5, "addresses": "nowhere"}
+        assert intern_customer([1]) == [1]
@@ -0,0 +1,140 @@
+"""Тесты для потоковой выгрузки заказов."""
+import copy
+import csv
+import json
+from datetime import datetime, timezone
+
+import pytest
+from src.enum import OrderStatus
+from src.models import Order, CreditCardPayment, StandardDelivery
+from src.utils.export import (
+    LINE_COLUMNS, ORDER_COLUMNS, OrderExporter, order_rows, read_columnar,
+)
+
+
+@pytest.fixture
+def orders(sample_customer, sample_cart_items):
+    """Три заказа: два в обработке, один отменён; один создан днём раньше."""
+    result = []
+    for order_id in range(1, 4):
+        order = Order(sample_customer, sample_cart_items)
+        order.order_id = order_id
+        order.delivery = StandardDelivery()
+        order.payment = CreditCardPayment("4111-1111-1111-1111")
+        order.created_at = datetime(2024, 5, 2 if order_id < 3 else 1, 12,
+                                    tzinfo=timezone.utc).timestamp()
+        status = OrderStatus.CANCELLED if order_id == 2 else OrderStatus.PROCESSING
+        result.append((order, status))
+    return result
+
+
+class TestOrderRows:
+    """Тесты для преобразования заказа в строки."""
+
+    def test_order_rows(self, orders):
+        """Тест строк заказа и его позиций."""
+        order, status = orders[0]
+
+        row, lines = order_rows(order, status)
+        record = dict(zip(ORDER_COLUMNS, row))
+
+        assert record["order_id"] == 1
+        assert record["created_at"] == "2024-05-02T12:00:00+00:00"
+        assert record["status"] == "processing"
+        assert record["total"] == order.calculate_total()
+        assert record["payment_method"] == "CreditCardPayment"
+        assert len(lines) == len(order.items)
+        assert dict(zip(LINE_COLUMNS, lines[0]))["line"] == 1
+
+
+class TestOrderExporter:
+    """Тесты для выгрузки в разные форматы."""
+
+    def test_csv(self, orders, tmp_path):
+        """Тест выгрузки в CSV."""
+        report = OrderExporter(tmp_path).export(orders)
+
+        with open(tmp_path / "orders.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        with open(tmp_path / "order_lines.csv", newline="") as f:
+            lines = list(csv.DictReader(f))
+        assert report.orders == 3
+        assert report.lines == len(lines)
+        assert [row["order_id"] for row in rows] == ["1", "2", "3"]
+        assert rows[1]["status"] == "cancelled"
+        assert report.files == [tmp_path / "orders.csv", tmp_path / "order_lines.csv"]
+
+    def test_jsonl(self, orders, tmp_path):
+        """Тест выгрузки в JSON Lines."""
+        OrderExporter(tmp_path, "jsonl").export(orders)
+
+        records = [json.loads(line) for line in open(tmp_path / "orders.jsonl")]
+
+        assert [record["order_id"] for record in records] == [1, 2, 3]
+        assert set(records[0]) == set(ORDER_COLUMNS)
+
+    def test_columnar_round_trip(self, orders, tmp_path):
+        """Тест колоночного формата с порциями и словарным кодированием."""
+        OrderExporter(tmp_path, "columnar", chunk_rows=2).export(orders)
+
+        chunks = list(read_columnar(tmp_path / "orders.col"))
+        lines = list(read_columnar(tmp_path / "order_lines.col"))
+
+        assert [chunk["order_id"] for chunk in chunks] == [[1, 2], [3]]
+        assert chunks[0]["status"] == ["processing", "cancelled"]
+        expected = [line for order, status in orders for line in order_rows(order, status)[1]]
+        assert [tuple(row) for chunk in lines for row in zip(*chunk.values())] == expected
+
+    @pytest.mark.parametrize("partition, directories", [
+        ("status", {"status=processing", "status=cancelled"}),
+        ("date", {"date=2024-05-02", "date=2024-05-01"}),
+    ])
+    def test_partitions(self, orders, tmp_path, partition, directories):
+        """Тест разбиения выгрузки по статусу и дате."""
+        report = OrderExporter(tmp_path, partition_by=partition).export(orders)
+
+        assert {path.parent.name for path in report.files} == directories
+        assert len(report.files) == 4
+
+    @pytest.mark.parametrize("format", ["csv", "jsonl", "columnar"])
+    def test_partitions_reopened_for_append(self, orders, tmp_path, format):
+        """Тест: при превышении лимита открытых разделов файлы дописываются."""
+        # Даты чередуются, так что каждый раздел закрывается и открывается снова
+        interleaved = []
+        for order, status in orders * 2:
+            order = copy.copy(order)
+            order.order_id = len(interleaved) + 1
+            order.created_at += 86400 * (order.order_id % 3)
+            interleaved.append((order, status))
+        exporter = OrderExporter(tmp_path, format, partition_by="date", max_open_partitions=1)
+
+        report = exporter.export(interleaved)
+
+        order_files = [path for path in report.files if path.stem == "orders"]
+        if format == "csv":
+            ids = [int(row["order_id"]) for path in order_files
+                   for row in csv.DictReader(open(path, newline=""))]
+        elif format == "jsonl":
+            ids = [json.loads(line)["order_id"] for path in order_files for line in open(path)]
+        else:
+            ids = [order_id for path in order_files
+                   for chunk in read_columnar(path) for order_id in chunk["order_id"]]
+        assert sorted(ids) == list(range(1, 7))
+        assert len(report.files) == 2 * len({path.parent for path in report.files})
+
+    def test_invalid_options(self, tmp_path):
+        """Тест неизвестного формата и разбиения."""
+        with pytest.raises(ValueError, match="Unknown export format"):
+            OrderExporter(tmp_path, "xml")
+        with pytest.raises(ValueError, match="Unknown partition"):
+            OrderExporter(tmp_path, partition_by="customer")
+        with pytest.raises(ValueError, match="Open partition limit must be positive"):
+            OrderExporter(tmp_path, max_open_partitions=0)
+
+    def test_not_columnar(self, tmp_path):
+        """Тест чтения файла другого формата."""
+        (tmp_path / "orders.csv").write_text("order_id\n1\n")
+
+        with pytest.raises(ValueError, match="Not a columnar export"):
+            list(read_columnar(tmp_path / "orders.csv"))
+
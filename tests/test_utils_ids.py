@@ -0,0 +1,77 @@
+"""Тесты для распределителя идентификаторов."""
+import threading
+
+import pytest
+from src.utils.ids import IdAllocator
+from src.repositories import OrderRepository
+from src.models import CartItem, Customer, Order, Product
+
+
+def run_threads(count, target):
+    """Запускает count потоков с target(index) и ждёт их завершения."""
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestIdAllocator:
+    """Тесты для распределителя идентификаторов."""
+
+    def test_sequential_in_one_thread(self):
+        """Тест последовательных id в одном потоке."""
+        allocator = IdAllocator(block_size=4)
+
+        assert [allocator.next_id() for _ in range(10)] == list(range(1, 11))
+        assert allocator.reserved == 12
+
+    def test_start_and_step(self):
+        """Тест начального значения и шага."""
+        allocator = IdAllocator(start=3, step=4, block_size=2)
+
+        assert [allocator.next_id() for _ in range(4)] == [3, 7, 11, 15]
+
+    def test_unique_across_threads(self):
+        """Стресс-тест уникальности id из многих потоков."""
+        allocator = IdAllocator(block_size=64)
+        results = [[] for _ in range(16)]
+
+        def allocate(index):
+            ids = results[index]
+            for _ in range(20_000):
+                ids.append(allocator.next_id())
+
+        run_threads(16, allocate)
+
+        all_ids = [i for ids in results for i in ids]
+        assert len(all_ids) == 320_000
+        assert len(set(all_ids)) == 320_000
+        assert all(ids == sorted(ids) for ids in results)
+
+    @pytest.mark.parametrize("kwargs", [{"step": 0}, {"block_size": 0}])
+    def test_invalid_arguments(self, kwargs):
+        """Тест некорректных параметров."""
+        with pytest.raises(ValueError):
+            IdAllocator(**kwargs)
+
+
+class TestOrderRepositoryConcurrency:
+    """Тесты для одновременного добавления заказов."""
+
+    def test_concurrent_add_keeps_every_order(self):
+        """Стресс-тест: ни один заказ не теряется и не перезаписывается."""
+        repository = OrderRepository()
+        customer = Customer(1, "John Doe", "john@example.com")
+        items = [CartItem(Product(1, "Mouse", 25.0), 1)]
+
+        def writer(_):
+            for _ in range(5_000):
+                repository.add(Order(customer, items))
+
+        run_threads(8, writer)
+
+        orders = repository.get_all()
+        assert len(orders) == 40_000
+        assert len({order.order_id for order in orders}) == 40_000
+        assert all(repository.get_by_id(order.order_id) is order for order in orders)
@@ -0,0 +1,93 @@
+"""Тесты для нагрузочного тестирования."""
+import threading
+
+import pytest
+from src.servises import OrderService
+from src.utils.load_test import LoadProfile, LoadRecorder, run_load_test
+
+
+@pytest.fixture
+def profile():
+    """Короткий профиль нагрузки на маленьком каталоге."""
+    return LoadProfile(clients=4, duration=0.3, products=50, customers=20)
+
+
+class TestLoadTest:
+    """Тесты для генератора нагрузки."""
+
+    @pytest.mark.parametrize("mode", ["threads", "asyncio"])
+    def test_closed_loop(self, profile, mode):
+        """Тест замкнутого цикла в потоках и asyncio."""
+        report = run_load_test(profile, mode)
+
+        stats = report.recorder.stats
+        assert report.recorder.sessions > 0
+        assert stats['place_order'].count == report.recorder.sessions
+        assert stats['browse'].count == 3 * report.recorder.sessions
+        assert report.error_rate == 0.0
+        assert report.orders_per_second > 0
+
+    @pytest.mark.parametrize("mode", ["threads", "asyncio"])
+    def test_open_loop_arrival_rate(self, profile, mode):
+        """Тест открытого цикла с заданной интенсивностью."""
+        profile.arrival_rate = 100.0
+        report = run_load_test(profile, mode)
+
+        # Пуассоновский поток: около 30 сессий за 0.3 секунды
+        assert 5 < report.recorder.sessions < 80
+
+    def test_asyncio_orders_run_off_the_loop(self, profile, monkeypatch):
+        """Тест: в режиме asyncio заказы оформляются в пуле фасада."""
+        threads = set()
+        create_order = OrderService.create_order
+
+        def recording(self, order_dto):
+            threads.add(threading.current_thread().name)
+            return create_order(self, order_dto)
+
+        monkeypatch.setattr(OrderService, "create_order", recording)
+        report = run_load_test(profile, "asyncio")
+
+        assert report.recorder.sessions > 0
+        assert threads and all(name.startswith("async-service") for name in threads)
+
+    def test_processes(self, profile):
+        """Тест запуска клиентов в отдельных процессах."""
+        profile.clients = 2
+        report = run_load_test(profile, "processes")
+
+        assert report.recorder.sessions > 0
+        assert report.error_rate == 0.0
+
+    def test_errors_are_counted(self):
+        """Тест учёта ошибок по операциям."""
+        recorder = LoadRecorder()
+        recorder.record('browse', 0.001)
+        recorder.record('place_order', 0.002, ValueError("boom"))
+
+        assert recorder.stats['place_order'].errors == 1
+        assert recorder.errors == {"place_order: ValueError": 1}
+
+    def test_report_format(self, profile):
+        """Тест текстового отчёта."""
+        text = run_load_test(profile, "asyncio").format()
+
+        assert "p99 ms" in text
+        assert "place_order" in text
+        assert "error rate" in text
+
+    def test_unknown_mode(self, profile):
+        """Тест неизвестного режима."""
+        with pytest.raises(ValueError, match="Unknown load test mode"):
+            run_load_test(profile, "fibers")
+
+    def test_new_cart_is_isolated(self, application_service):
+        """Тест отдельных корзин для разных покупателей."""
+        application_service.initialize_sample_data()
+        first = application_service.new_cart()
+        second = application_service.new_cart()
+
+        first.add_item(1, 1)
+
+        assert len(first.get_items()) == 1
+        assert second.get_items() == []
@@ -0,0 +1,153 @@
+"""Тесты для реестра метрик."""
+import json
+import urllib.request
+import pytest
+from src.utils.metrics import MetricsRegistry, Histogram, instrumented
+from src.servises.product_service import ProductService
+from src.schemas import ProductDTO
+
+
+@pytest.fixture
+def registry():
+    """Отдельный реестр метрик."""
+    return MetricsRegistry()
+
+
+class TestHistogram:
+    """Тесты для гистограммы."""
+
+    def test_quantiles(self):
+        """Тест вычисления квантилей."""
+        histogram = Histogram()
+        for value in range(1, 101):
+            histogram.observe(value)
+
+        summary = histogram.summary()
+        assert summary['count'] == 100
+        assert summary['min'] == 1
+        assert summary['max'] == 100
+        assert summary['p50'] == 51
+        assert summary['p99'] == 100
+
+    def test_reservoir_is_bounded(self):
+        """Тест ограничения размера выборки."""
+        histogram = Histogram(max_samples=10)
+        for value in range(1000):
+            histogram.observe(value)
+
+        assert histogram.count == 1000
+        assert len(histogram.samples()) == 10
+
+    def test_invalid_quantile(self):
+        """Тест недопустимого квантиля."""
+        with pytest.raises(ValueError, match="Quantile must be between 0 and 1"):
+            Histogram().quantile(1.5)
+
+
+class TestInstrumented:
+    """Тесты для декоратора инструментирования."""
+
+    def test_disabled_records_nothing(self, registry):
+        """Тест что выключенный компонент ничего не записывает."""
+        @instrumented("demo", registry)
+        def work():
+            return 42
+
+        assert work() == 42
+        assert registry.snapshot() == {'counters': [], 'histograms': []}
+
+    def test_enabled_records_calls_and_latency(self, registry):
+        """Тест записи вызовов и задержек включенного компонента."""
+        @instrumented("demo", registry)
+        def work():
+            return 42
+
+        registry.enable("demo")
+        work()
+        work()
+
+        histogram = registry.histogram('method_latency_seconds', component="demo", method="work")
+        assert histogram.count == 2
+
+    def test_reset_drops_cached_handles(self, registry):
+        """Тест что после сброса метрики записываются заново."""
+        @instrumented("demo", registry)
+        def work():
+            return 42
+
+        registry.enable("demo")
+        work()
+        registry.reset()
+        work()
+
+        histogram = registry.histogram('method_latency_seconds', component="demo", method="work")
+        assert histogram.count == 1
+
+    def test_errors_are_counted(self, registry):
+        """Тест подсчета ошибок."""
+        @instrumented("demo", registry)
+        def fail():
+            raise ValueError("boom")
+
+        registry.enable("demo")
+        with pytest.raises(ValueError):
+            fail()
+
+        assert registry.counter('method_errors_total', component="demo", method="fail").value == 1
+
+    def test_service_methods_are_instrumented(self, product_repository):
+        """Тест инструментирования методов сервисов глобальным реестром."""
+        from src.utils import metrics
+        metrics.reset()
+        metrics.enable("product_service")
+        try:
+            service = ProductService(product_repository)
+            service.create_product(ProductDTO(product_id=1, name="Pen", price=1.0))
+            service.get_product(1)
+        finally:
+            metrics.disable("product_service")
+
+        names = {h['labels']['method'] for h in metrics.snapshot()['histograms']}
+        assert {"create_product", "get_product"} <= names
+        metrics.reset()
+
+
+class TestExport:
+    """Тесты для экспорта метрик."""
+
+    def test_prometheus_format(self, registry):
+        """Тест формата Prometheus."""
+        registry.counter('orders_total', status="paid").inc(3)
+        registry.histogram('latency_seconds').observe(0.5)
+
+        text = registry.to_prometheus()
+
+        assert '# TYPE orders_total counter' in text
+        assert 'orders_total{status="paid"} 3' in text
+        assert 'latency_seconds{quantile="0.99"} 0.5' in text
+        assert 'latency_seconds_count 1' in text
+
+    def test_write_json_and_prometheus(self, registry, tmp_path):
+        """Тест записи снимка в JSON и Prometheus файлы."""
+        registry.counter('orders_total').inc()
+
+        registry.write(tmp_path / "metrics.json")
+        registry.write(tmp_path / "metrics.prom")
+
+        snapshot = json.loads((tmp_path / "metrics.json").read_text())
+        assert snapshot['counters'][0]['value'] == 1
+        assert 'orders_total 1' in (tmp_path / "metrics.prom").read_text()
+
+    def test_http_endpoint(self, registry):
+        """Тест HTTP-эндпоинта /metrics."""
+        registry.counter('orders_total').inc()
+        server = registry.serve(port=0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                body = response.read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert 'orders_total 1' in body
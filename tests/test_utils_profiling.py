@@ -0,0 +1,37 @@
+"""Тесты для режима профилирования."""
+import pstats
+import tracemalloc
+from src.servises import ApplicationService
+from src.utils.profiling import Workload, profile_workload, run_workload
+
+
+class TestProfiling:
+    """Тесты для профилирования синтетической нагрузки."""
+
+    def test_run_workload_creates_data(self):
+        """Тест что нагрузка проходит через все сервисы."""
+        app = ApplicationService()
+
+        run_workload(app, Workload(customers=5, orders=10, lines=2, products=4))
+
+        stats = app.get_statistics()
+        assert stats['total_products'] == 4
+        assert stats['total_customers'] == 5
+        assert stats['total_orders'] == 10
+
+    def test_profile_workload_writes_reports(self, tmp_path):
+        """Тест записи pstats, снимка аллокаций и отчетов."""
+        report = profile_workload(
+            ApplicationService(),
+            Workload(customers=3, orders=5, lines=2, products=3),
+            tmp_path,
+            top=5,
+        )
+
+        assert report.pstats_path.exists()
+        assert report.snapshot_path.exists()
+        pstats.Stats(str(report.pstats_path))
+        tracemalloc.Snapshot.load(str(report.snapshot_path))
+        assert "create_order" in report.hotspots
+        assert "order_service.py::create_order" in report.service_methods
+        assert "order_service.py::create_order" in report.service_allocations
@@ -0,0 +1,122 @@
+"""Тесты для сериализации DTO."""
+import json
+
+import pytest
+from src.enum import OrderStatus
+from src.models import CreditCardPayment
+from src.schemas import AddressDTO, CartItemDTO, CustomerDTO, OrderResultDTO, ProductDTO
+from src.utils.serialization import codec_for, pack, unpack
+
+
+@pytest.fixture
+def order_result():
+    """Результат заказа с вложенными позициями и оплатой."""
+    return OrderResultDTO(
+        order_id=7,
+        customer_name="Иван Петров",
+        items=[CartItemDTO(ProductDTO(1, "Laptop", 1000.0, 2.5), 1),
+               CartItemDTO(ProductDTO(2, "Mouse", 25.0), 3)],
+        subtotal=1075.0,
+        discount_amount=107.5,
+        delivery_cost=5.0,
+        total_amount=972.5,
+        status=OrderStatus.PROCESSING,
+        payment_method=CreditCardPayment("4111-1111-1111-1111"),
+    )
+
+
+class TestCodec:
+    """Тесты для скомпилированных кодеков."""
+
+    def test_product_json_round_trip(self):
+        """Тест JSON для продукта."""
+        codec = codec_for(ProductDTO)
+        dto = ProductDTO(1, "Laptop", 1000.0, 2.5)
+
+        text = codec.dumps_json(dto)
+
+        assert json.loads(text) == {"product_id": 1, "name": "Laptop",
+                                    "price": 1000.0, "weight": 2.5}
+        assert codec.loads_json(text) == dto
+
+    def test_customer_round_trip(self):
+        """Тест JSON и двоичного формата для клиента с адресами."""
+        codec = codec_for(CustomerDTO)
+        dto = CustomerDTO(1, "John", "john@example.com",
+                          [AddressDTO("1 Main St", "New York", "USA")])
+
+        assert codec.loads_json(codec.dumps_json(dto)) == dto
+        assert codec.loads_binary(codec.dumps_binary(dto)) == dto
+
+    def test_order_result_payment_as_name(self, order_result):
+        """Тест: способ оплаты сериализуется как имя без реквизитов."""
+        codec = codec_for(OrderResultDTO)
+
+        data = json.loads(codec.dumps_json(order_result))
+        decoded = codec.loads_binary(codec.dumps_binary(order_result))
+
+        assert data["payment_method"] == "CreditCardPayment"
+        assert data["status"] == "processing"
+        assert "4111" not in codec.dumps_json(order_result)
+        assert decoded.status is OrderStatus.PROCESSING
+        assert decoded.items == order_result.items
+        assert decoded.payment_method == "CreditCardPayment"
+
+    def test_binary_is_smaller_than_json(self, order_result):
+        """Тест компактности двоичного формата."""
+        codec = codec_for(OrderResultDTO)
+
+        assert len(codec.dumps_binary(order_result)) < len(codec.dumps_json(order_result).encode())
+
+    def test_streaming(self):
+        """Тест потокового кодирования списков."""
+        codec = codec_for(ProductDTO)
+        dtos = [ProductDTO(i, f"Product {i}", float(i)) for i in range(1, 1001)]
+
+        text = "".join(codec.iter_json(dtos))
+        chunks = list(codec.iter_binary(dtos, chunk_size=1024))
+
+        assert [codec.from_dict(d) for d in json.loads(text)] == dtos
+        assert len(chunks) > 1
+        assert list(codec.iter_load_binary(b"".join(chunks))) == dtos
+        assert "".join(codec.iter_json([])) == "[]"
+
+    def test_codec_is_cached(self):
+        """Тест кэширования кодека."""
+        assert codec_for(ProductDTO) is codec_for(ProductDTO)
+
+
+class TestBinaryFormat:
+    """Тесты для двоичного формата в стиле MessagePack."""
+
+    @pytest.mark.parametrize("value", [
+        None, True, False, 0, 127, 128, -1, -32, -33, -200, 70_000, -70_000,
+        2 ** 40, -(2 ** 40), 1.5, "", "x" * 40, "y" * 300, "z" * 70_000,
+        [1] * 20, {"a": 1}, b"bytes", [None, [1, "two"], {"k": 3.0}],
+    ])
+    def test_round_trip(self, value):
+        """Тест кодирования и декодирования значений."""
+        out = bytearray()
+        pack(value, out)
+
+        decoded, end = unpack(bytes(out), 0)
+
+        assert decoded == value
+        assert end == len(out)
+
+    def test_messagepack_compatible_bytes(self):
+        """Тест совпадения с кодировкой MessagePack."""
+        out = bytearray()
+        pack([1, "a", None], out)
+
+        assert bytes(out) == b"\x93\x01\xa1a\xc0"
+
+    def test_truncated_data(self):
+        """Тест обрезанных данных."""
+        with pytest.raises(ValueError, match="Truncated"):
+            unpack(b"\xa5ab", 0)
+
+    def test_unsupported_value(self):
+        """Тест неподдерживаемого значения."""
+        with pytest.raises(TypeError, match="Cannot serialize"):
+            pack(object(), bytearray())
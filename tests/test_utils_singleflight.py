@@ -0,0 +1,184 @@
+"""Тесты для объединения одновременных одинаковых запросов."""
+import asyncio
+import threading
+import time
+
+import pytest
+from src.utils.singleflight import AsyncSingleFlight, FlightInfo, SingleFlight
+
+
+def wait_for(condition, timeout=5.0):
+    """Дождаться выполнения условия."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """Тесты для объединения вызовов из потоков."""
+
+    @pytest.fixture
+    def blocked(self):
+        """Функция, которая ждёт разрешения завершиться."""
+        entered, release = threading.Event(), threading.Event()
+        calls = []
+
+        def load(key):
+            calls.append(key)
+            entered.set()
+            assert release.wait(5)
+            if key == "broken":
+                raise ValueError("lookup failed")
+            return {"key": key}
+
+        return load, entered, release, calls
+
+    def run_concurrently(self, flight, load, entered, key, followers):
+        """Запустить ведущий вызов и дождаться присоединения остальных."""
+        results = []
+
+        def call():
+            try:
+                results.append(flight.do(key, load, key))
+            except ValueError as error:
+                results.append(error)
+
+        threads = [threading.Thread(target=call)]
+        threads[0].start()
+        assert entered.wait(5)
+        threads += [threading.Thread(target=call) for _ in range(followers)]
+        for thread in threads[1:]:
+            thread.start()
+        wait_for(lambda: flight.info().shared == followers)
+        return threads, results
+
+    def test_concurrent_calls_share_result(self, blocked):
+        """Тест: одновременные вызовы с одним ключом выполняются один раз."""
+        load, entered, release, calls = blocked
+        flight = SingleFlight()
+
+        threads, results = self.run_concurrently(flight, load, entered, 1, followers=7)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert calls == [1]
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+        assert flight.info() == FlightInfo(executed=1, shared=7)
+
+    def test_error_reaches_every_caller(self, blocked):
+        """Тест: исключение получают все ожидающие."""
+        load, entered, release, calls = blocked
+        flight = SingleFlight()
+
+        threads, results = self.run_concurrently(flight, load, entered, "broken", followers=3)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["broken"]
+        assert len(results) == 4
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_later_calls_run_again(self):
+        """Тест: завершённый вызов не кэшируется."""
+        flight = SingleFlight()
+        calls = []
+
+        for _ in range(3):
+            flight.do("key", calls.append, "key")
+
+        assert calls == ["key"] * 3
+        assert flight.info() == FlightInfo(executed=3, shared=0)
+
+    def test_forget_starts_new_call(self, blocked):
+        """Тест: после forget новый вызов не присоединяется к старому."""
+        load, entered, release, calls = blocked
+        flight = SingleFlight()
+        leader = threading.Thread(target=flight.do, args=(1, load, 1))
+        leader.start()
+        assert entered.wait(5)
+
+        flight.forget(1)
+        release.set()
+        assert flight.do(1, load, 1) == {"key": 1}
+        leader.join()
+
+        assert calls == [1, 1]
+
+    def test_forget_if_selects_keys(self, blocked):
+        """Тест: forget_if забывает только подходящие ключи."""
+        load, entered, release, calls = blocked
+        flight = SingleFlight()
+        leader = threading.Thread(target=flight.do, args=(("orders", 1), load, ("orders", 1)))
+        leader.start()
+        assert entered.wait(5)
+
+        flight.forget_if(lambda key: key[0] == "products")
+        assert flight._calls
+        flight.forget_if(lambda key: key[0] == "orders")
+        assert not flight._calls
+        release.set()
+        leader.join()
+
+
+class TestAsyncSingleFlight:
+    """Тесты для объединения вызовов из задач asyncio."""
+
+    def test_concurrent_tasks_share_result(self):
+        """Тест: одновременные задачи с одним ключом выполняют один вызов."""
+        calls = []
+
+        async def load(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return [key]
+
+        async def main():
+            flight = AsyncSingleFlight()
+            results = await asyncio.gather(*(flight.do(1, load, 1) for _ in range(5)),
+                                           flight.do(2, load, 2))
+            return flight, results
+
+        flight, results = asyncio.run(main())
+
+        assert calls == [1, 2]
+        assert all(result is results[0] for result in results[:5])
+        assert results[5] == [2]
+        assert flight.info() == FlightInfo(executed=2, shared=4)
+
+    def test_cancelled_task_does_not_cancel_call(self):
+        """Тест: отмена одной задачи не отменяет общий вызов."""
+        async def load():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def main():
+            flight = AsyncSingleFlight()
+            first = asyncio.ensure_future(flight.do("key", load))
+            second = asyncio.ensure_future(flight.do("key", load))
+            await asyncio.sleep(0)
+            first.cancel()
+            return first, await second
+
+        first, result = asyncio.run(main())
+
+        assert first.cancelled()
+        assert result == "done"
+
+    def test_error_reaches_every_task(self):
+        """Тест: исключение получают все ожидающие задачи."""
+        async def load():
+            await asyncio.sleep(0.01)
+            raise ValueError("lookup failed")
+
+        async def main():
+            flight = AsyncSingleFlight()
+            return await asyncio.gather(*(flight.do("key", load) for _ in range(3)),
+                                        return_exceptions=True)
+
+        errors = asyncio.run(main())
+
+        assert all(isinstance(error, ValueError) for error in errors)
@@ -0,0 +1,65 @@
+"""Тесты для генератора синтетических данных."""
+import pytest
+from src.utils.synthetic import SyntheticDataGenerator
+from src.utils.data_loader import DataLoader
+from src.schemas import ProductDTO
+
+
+class TestSyntheticDataGenerator:
+    """Тесты для детерминированного генератора данных."""
+
+    def test_same_seed_same_data(self):
+        """Тест воспроизводимости при одинаковом seed."""
+        first = SyntheticDataGenerator(seed=7)
+        second = SyntheticDataGenerator(seed=7)
+
+        assert list(first.products(50)) == list(second.products(50))
+        assert list(first.customers(50)) == list(second.customers(50))
+        assert list(first.orders(50, 10, 20)) == list(second.orders(50, 10, 20))
+
+    def test_different_seed_different_data(self):
+        """Тест что разные seed дают разные данные."""
+        assert (list(SyntheticDataGenerator(1).products(20))
+                != list(SyntheticDataGenerator(2).products(20)))
+
+    def test_products_are_valid_dtos(self):
+        """Тест что записи продуктов подходят для ProductDTO."""
+        products = [ProductDTO(**record) for record in SyntheticDataGenerator().products(100)]
+
+        assert [p.product_id for p in products] == list(range(1, 101))
+        assert all(p.price > 0 and p.weight > 0 for p in products)
+
+    def test_customers_have_addresses(self):
+        """Тест что у клиентов от одного до пяти адресов и уникальный email."""
+        customers = list(SyntheticDataGenerator().customers(200))
+
+        assert all(1 <= len(c['addresses']) <= 5 for c in customers)
+        assert any(len(c['addresses']) > 1 for c in customers)
+        assert len({c['email'] for c in customers}) == 200
+
+    def test_orders_reference_existing_ids(self):
+        """Тест что заказы ссылаются на существующих клиентов и продукты."""
+        orders = list(SyntheticDataGenerator().orders(500, customer_count=10, product_count=30))
+
+        assert all(1 <= o.customer_id <= 10 for o in orders)
+        assert all(1 <= pid <= 30 and qty > 0 for o in orders for pid, qty in o.items)
+        line_counts = [len(o.items) for o in orders]
+        # Большинство заказов небольшие, но встречаются и крупные
+        assert line_counts.count(1) > line_counts.count(5)
+        assert max(line_counts) >= 5
+
+    def test_write_json_is_loadable(self, tmp_path):
+        """Тест записи JSON-файла, читаемого DataLoader."""
+        count = SyntheticDataGenerator.write_json(
+            tmp_path / "products.json", SyntheticDataGenerator().products(10))
+
+        assert count == 10
+        assert len(DataLoader(tmp_path).load_products()) == 10
+
+    @pytest.mark.parametrize("count", [0, 1])
+    def test_write_json_small(self, tmp_path, count):
+        """Тест записи пустого и одноэлементного массива."""
+        SyntheticDataGenerator.write_json(
+            tmp_path / "customers.json", SyntheticDataGenerator().customers(count))
+
+        assert len(DataLoader(tmp_path).load_customers()) == count
@@ -0,0 +1,115 @@
+"""Тесты для валидирующих конструкторов DTO."""
+from dataclasses import dataclass, field
+
+import pytest
+from src.enum import OrderStatus
+from src.schemas import AddressDTO, CustomerDTO, ProductDTO
+from src.utils.validation import ValidationError, validator_for
+
+
+@dataclass
+class StatusRecord:
+    """Запись со статусом, необязательным полем и ограничениями."""
+    status: OrderStatus
+    note: str | None = None
+    tags: list[str] = field(default_factory=list)
+    score: int = field(default=0, metadata={'min': 0, 'max': 10})
+
+
+class TestValidator:
+    """Тесты для скомпилированного валидатора."""
+
+    def test_build_product(self):
+        """Тест создания продукта; int допустим для float."""
+        dto = validator_for(ProductDTO).build(
+            {"product_id": 1, "name": "Laptop", "price": 1000}
+        )
+
+        assert dto == ProductDTO(1, "Laptop", 1000.0, 0.0)
+        assert type(dto.price) is float
+
+    def test_all_errors_reported(self):
+        """Тест: все ошибки записи собираются сразу."""
+        with pytest.raises(ValidationError) as error:
+            validator_for(ProductDTO).build(
+                {"product_id": "1", "price": -5, "weight": -1, "color": "red"}
+            )
+
+        assert error.value.errors == (
+            "product_id: expected int, got str",
+            "name: missing",
+            "price: must be >= 0",
+            "weight: must be >= 0",
+            "color: unknown field",
+        )
+        assert isinstance(error.value, ValueError)
+
+    def test_build_customer_with_addresses(self):
+        """Тест создания клиента с вложенными адресами."""
+        dto = validator_for(CustomerDTO).build({
+            "id": 1, "name": "John", "email": "john@example.com",
+            "addresses": [{"street": "1 Main St", "city": "New York", "country": "USA"}],
+        })
+
+        assert dto.addresses == (AddressDTO("1 Main St", "New York", "USA"),)
+        assert dto == CustomerDTO(1, "John", "john@example.com",
+                                  [AddressDTO("1 Main St", "New York", "USA")])
+        assert hash(dto) == hash(CustomerDTO(1, "John", "john@example.com",
+                                             [AddressDTO("1 Main St", "New York", "USA")]))
+
+    def test_nested_error_paths(self):
+        """Тест путей к ошибкам во вложенных DTO."""
+        with pytest.raises(ValidationError) as error:
+            validator_for(CustomerDTO).build({
+                "id": 1, "name": "John", "email": "john@example.com",
+                "addresses": [{"street": "1 Main St", "city": 5}, "Paris"],
+            })
+
+        assert error.value.errors == (
+            "addresses[0].city: expected str, got int",
+            "addresses[0].country: missing",
+            "addresses[1]: expected object, got str",
+        )
+
+    def test_enum_optional_and_defaults(self):
+        """Тест перечислений, необязательных полей и значений по умолчанию."""
+        validator = validator_for(StatusRecord)
+
+        record = validator.build({"status": "shipped", "tags": ["a", "b"]})
+
+        assert record == StatusRecord(OrderStatus.SHIPPED, None, ["a", "b"], 0)
+        assert validator.build({"status": "shipped"}).tags == []
+        with pytest.raises(ValidationError) as error:
+            validator.build({"status": "lost", "note": 3, "tags": ["a", 1], "score": 11})
+        assert error.value.errors == (
+            "status: invalid value 'lost'",
+            "note: expected str, got int",
+            "tags[1]: expected str, got int",
+            "score: must be <= 10",
+        )
+
+    def test_bool_is_not_int(self):
+        """Тест: bool не принимается вместо int."""
+        with pytest.raises(ValidationError, match="product_id: expected int, got bool"):
+            validator_for(ProductDTO).build({"product_id": True, "name": "x", "price": 1.0})
+
+    def test_build_many(self):
+        """Тест пакетной проверки с ошибками по номеру записи."""
+        records = [
+            {"product_id": 1, "name": "A", "price": 1.0},
+            {"product_id": 2, "name": "B", "price": -1.0},
+            "not a record",
+            {"product_id": 4, "name": "D", "price": 4.0},
+        ]
+
+        dtos, failures = validator_for(ProductDTO).build_many(records)
+
+        assert [dto.product_id for dto in dtos] == [1, 4]
+        assert failures == {
+            1: ("price: must be >= 0",),
+            2: ("record: expected object, got str",),
+        }
+
+    def test_validator_is_cached(self):
+        """Тест кэширования валидатора."""
+        assert validator_for(ProductDTO) is validator_for(ProductDTO)